@@ -0,0 +1,87 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import datetime
+from collections.abc import Sequence
+from typing import Any, Callable, NamedTuple
+
+from tcolorpy import tcolor
+
+
+class TableShape(NamedTuple):
+    name: str
+    num_rows: int
+    make_table: Callable[[int], tuple[list[str], list[Sequence[Any]]]]
+
+
+def _narrow_tall(num_rows: int) -> tuple[list[str], list[Sequence[Any]]]:
+    return (
+        ["id", "value", "name"],
+        [[i, i * 0.25, f"name{i}"] for i in range(num_rows)],
+    )
+
+
+def _wide_short(num_rows: int) -> tuple[list[str], list[Sequence[Any]]]:
+    num_cols = 50
+
+    return (
+        [f"col{col}" for col in range(num_cols)],
+        [[row * num_cols + col for col in range(num_cols)] for row in range(num_rows)],
+    )
+
+
+def _mixed_types(num_rows: int) -> tuple[list[str], list[Sequence[Any]]]:
+    base_time = datetime.datetime(2017, 1, 1, 0, 0, 0)
+
+    return (
+        ["int", "float", "str", "bool", "none", "datetime", "inf", "nan", "mix"],
+        [
+            [
+                i,
+                i / 3,
+                f"text {i}",
+                i % 2 == 0,
+                None,
+                base_time + datetime.timedelta(hours=i),
+                float("inf"),
+                float("nan"),
+                [i, f"{i}", i * 0.5][i % 3],
+            ]
+            for i in range(num_rows)
+        ],
+    )
+
+
+def _multibyte(num_rows: int) -> tuple[list[str], list[Sequence[Any]]]:
+    categories = ["文房具", "食料品", "家電製品", "書籍"]
+    vendors = ["山田商店", "株式会社サンプル", "ＡＢＣ商事"]
+
+    return (
+        ["商品ID", "カテゴリ", "販売元", "価格"],
+        [
+            [i, categories[i % len(categories)], vendors[i % len(vendors)], i * 10]
+            for i in range(num_rows)
+        ],
+    )
+
+
+def _ansi_colored(num_rows: int) -> tuple[list[str], list[Sequence[Any]]]:
+    colors = ["red", "green", "blue", "yellow"]
+
+    return (
+        ["id", "status", "message"],
+        [
+            [i, tcolor("OK" if i % 2 else "NG", color=colors[i % len(colors)]), f"message {i}"]
+            for i in range(num_rows)
+        ],
+    )
+
+
+TABLE_SHAPES = (
+    TableShape("narrow_tall", 2000, _narrow_tall),
+    TableShape("wide_short", 40, _wide_short),
+    TableShape("mixed_types", 500, _mixed_types),
+    TableShape("multibyte", 500, _multibyte),
+    TableShape("ansi_colored", 500, _ansi_colored),
+)
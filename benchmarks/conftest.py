@@ -0,0 +1,19 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--bench-scale",
+        type=float,
+        default=1.0,
+        help="multiplier for the number of rows of benchmark tables (defaults to 1.0)",
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_scale(request: pytest.FixtureRequest) -> float:
+    return request.config.getoption("--bench-scale")
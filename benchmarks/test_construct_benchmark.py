@@ -0,0 +1,28 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Benchmarks of writer construction for each table format.
+
+Constructing a writer copies the configured default data property extractor of the class
+instead of configuring an extractor.
+"""
+
+from typing import Any
+
+import pytest
+
+import pytablewriter as ptw
+
+
+BENCHMARK_ROUNDS = 200
+
+
+@pytest.mark.parametrize("table_format", list(ptw.TableFormat), ids=lambda fmt: fmt.name.lower())
+def test_construct_writer(benchmark: Any, table_format: ptw.TableFormat) -> None:
+    writer_class = table_format.writer_class
+
+    benchmark.pedantic(writer_class, rounds=BENCHMARK_ROUNDS, iterations=1, warmup_rounds=1)
+
+    if benchmark.stats:
+        # stats are not collected with --benchmark-disable
+        benchmark.extra_info.update({"writers_per_sec": round(1 / benchmark.stats.stats.mean, 1)})
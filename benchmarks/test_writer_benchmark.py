@@ -0,0 +1,180 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Benchmarks of table writing for each table format and table shape.
+
+Each benchmark records the following values to ``extra_info`` of the benchmark result
+(e.g. ``pytest benchmarks --benchmark-json=result.json``):
+
+- ``rows``/``columns``: size of the written table
+- ``rows_per_sec``: throughput calculated from the mean write time
+- ``peak_memory_kib``: peak memory allocated during a write (measured with ``tracemalloc``)
+- ``phase_seconds``: elapsed time of each phase (``AbstractTableWriter.last_write_stats``)
+"""
+
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pytest
+
+import pytablewriter as ptw
+from pytablewriter.writer import AbstractTableWriter
+
+from ._data import TABLE_SHAPES, TableShape
+
+
+# formats that require external resources to write
+EXCLUDE_FORMATS = ("elasticsearch",)
+
+BENCHMARK_ROUNDS = 3
+
+
+def _collect_format_names() -> list[str]:
+    # aliases of a format (e.g. "md" for "markdown") are benchmarked only once
+    format_names = []
+    writer_classes: set[type[AbstractTableWriter]] = set()
+
+    for format_name in ptw.TableWriterFactory.get_format_names():
+        table_format = ptw.TableFormat.from_name(format_name)
+        if table_format is None or table_format.writer_class in writer_classes:
+            continue
+
+        writer_classes.add(table_format.writer_class)
+
+        if table_format.names[0] in EXCLUDE_FORMATS:
+            continue
+
+        format_names.append(table_format.names[0])
+
+    return format_names
+
+
+def _is_binary_format(format_name: str) -> bool:
+    table_format = ptw.TableFormat.from_name(format_name)
+    assert table_format
+
+    return (table_format.format_attribute & ptw.FormatAttr.BIN) != 0
+
+
+def _make_output_path(format_name: str, tmp_path: Path) -> Optional[str]:
+    if not _is_binary_format(format_name):
+        return None
+
+    return str(tmp_path / f"benchmark_{format_name}")
+
+
+def _make_write_func(output_path: Optional[str]) -> Callable[[Any], Any]:
+    if output_path is None:
+        return lambda writer: writer.dumps()
+
+    return lambda writer: writer.dump(output_path)
+
+
+def _measure_peak_memory(create_writer: Callable[[], Any], write: Callable[[Any], Any]) -> int:
+    writer = create_writer()
+
+    tracemalloc.start()
+    try:
+        write(writer)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def _measure_phases(
+    create_writer: Callable[[], Any], write: Callable[[Any], Any]
+) -> dict[str, float]:
+    writer = create_writer()
+    writer.enable_write_stats = True
+    write(writer)
+
+    stats = writer.last_write_stats
+    if stats is None:
+        return {}
+
+    return {name: phase.elapsed_sec for name, phase in stats.phases.items()}
+
+
+@pytest.mark.parametrize("format_name", _collect_format_names())
+@pytest.mark.parametrize("shape", TABLE_SHAPES, ids=[shape.name for shape in TABLE_SHAPES])
+def test_write_table(
+    benchmark: Any, tmp_path: Path, bench_scale: float, format_name: str, shape: TableShape
+) -> None:
+    num_rows = max(1, int(shape.num_rows * bench_scale))
+    headers, value_matrix = shape.make_table(num_rows)
+
+    def create_writer() -> Any:
+        return ptw.TableWriterFactory.create_from_format_name(
+            format_name, table_name="benchmark", headers=headers, value_matrix=value_matrix
+        )
+
+    output_path = _make_output_path(format_name, tmp_path)
+    write = _make_write_func(output_path)
+
+    try:
+        peak_memory = _measure_peak_memory(create_writer, write)
+    except ImportError as e:
+        pytest.skip(f"missing optional dependency for {format_name}: {e}")
+
+    phase_seconds = _measure_phases(create_writer, write)
+
+    # writers cache the preprocessed results: create a fresh writer for each round
+    benchmark.pedantic(
+        write, setup=lambda: ((create_writer(),), {}), rounds=BENCHMARK_ROUNDS, iterations=1
+    )
+
+    benchmark.extra_info.update(
+        {
+            "rows": num_rows,
+            "columns": len(headers),
+            "peak_memory_kib": round(peak_memory / 1024, 1),
+            "phase_seconds": {name: round(sec, 6) for name, sec in phase_seconds.items()},
+        }
+    )
+    if benchmark.stats:
+        # stats are not collected with --benchmark-disable
+        benchmark.extra_info["rows_per_sec"] = round(num_rows / benchmark.stats.stats.mean, 1)
+
+
+@pytest.mark.parametrize("format_name", ["markdown", "csv"])
+def test_write_numeric_dataframe(benchmark: Any, bench_scale: float, format_name: str) -> None:
+    # numeric columns of a DataFrame are converted to data properties in vector
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+
+    num_rows = max(1, int(20000 * bench_scale))
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "int": rng.integers(-1000, 100000, num_rows),
+            "float": np.round(rng.normal(size=num_rows) * 1000, 4),
+            "ratio": rng.random(num_rows),
+        }
+    )
+
+    def create_writer() -> Any:
+        writer = ptw.TableWriterFactory.create_from_format_name(format_name)
+        writer.from_dataframe(df)
+
+        return writer
+
+    write = _make_write_func(None)
+    phase_seconds = _measure_phases(create_writer, write)
+
+    benchmark.pedantic(
+        write, setup=lambda: ((create_writer(),), {}), rounds=BENCHMARK_ROUNDS, iterations=1
+    )
+
+    benchmark.extra_info.update(
+        {
+            "rows": num_rows,
+            "columns": len(df.columns),
+            "phase_seconds": {name: round(sec, 6) for name, sec in phase_seconds.items()},
+        }
+    )
+    if benchmark.stats:
+        # stats are not collected with --benchmark-disable
+        benchmark.extra_info["rows_per_sec"] = round(num_rows / benchmark.stats.stats.mean, 1)
@@ -316,6 +316,7 @@ rp_class = """
 .. |Style| replace:: :py:class:`~pytablewriter.style.Style`
 .. |TableData| replace:: `TableData <https://tabledata.rtfd.io/en/latest/pages/reference/data.html#tabledata>`__
 .. |Typecode| replace:: :py:class:`typepy.Typecode`
+.. |WriteStats| replace:: :py:class:`~pytablewriter.WriteStats`
 
 .. |CsvTableWriter| replace:: :py:class:`~pytablewriter.CsvTableWriter`
 .. |ElasticsearchWriter| replace:: :py:class:`~pytablewriter.ElasticsearchWriter`
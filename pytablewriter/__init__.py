@@ -2,69 +2,81 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from dataproperty import LineBreakHandling
+from typing import TYPE_CHECKING
 
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
-from ._factory import TableWriterFactory
-from ._function import dumps_tabledata
-from ._logger import set_logger
-from ._table_format import FormatAttr, TableFormat
-from .error import (
-    EmptyTableDataError,
-    EmptyTableNameError,
-    EmptyValueError,
-    NotSupportedError,
-    WriterNotFoundError,
-)
-from .style import Align, Format
-from .typehint import (
-    Bool,
-    DateTime,
-    Dictionary,
-    Infinity,
-    Integer,
-    IpAddress,
-    List,
-    Nan,
-    NoneType,
-    NullString,
-    RealNumber,
-    String,
-)
-from .writer import (
-    AbstractTableWriter,
-    AsciiDocTableWriter,
-    BoldUnicodeTableWriter,
-    BorderlessTableWriter,
-    CssTableWriter,
-    CsvTableWriter,
-    ElasticsearchWriter,
-    ExcelXlsTableWriter,
-    ExcelXlsxTableWriter,
-    HtmlTableWriter,
-    JavaScriptTableWriter,
-    JsonLinesTableWriter,
-    JsonTableWriter,
-    LatexMatrixWriter,
-    LatexTableWriter,
-    LtsvTableWriter,
-    MarkdownTableWriter,
-    MediaWikiTableWriter,
-    NullTableWriter,
-    NumpyTableWriter,
-    PandasDataFramePickleWriter,
-    PandasDataFrameWriter,
-    PythonCodeTableWriter,
-    RstCsvTableWriter,
-    RstGridTableWriter,
-    RstSimpleTableWriter,
-    SpaceAlignedTableWriter,
-    SqliteTableWriter,
-    TomlTableWriter,
-    TsvTableWriter,
-    UnicodeTableWriter,
-    YamlTableWriter,
-)
+from ._lazy_import import make_lazy_attrs
+
+
+if TYPE_CHECKING:
+    from dataproperty import LineBreakHandling
+
+    from ._factory import TableWriterFactory
+    from ._function import dump_formats, dumps_tabledata
+    from ._logger import set_logger
+    from ._table_format import FormatAttr, TableFormat
+    from ._writer_pool import TableWriterPool
+    from .error import (
+        EmptyTableDataError,
+        EmptyTableNameError,
+        EmptyValueError,
+        NotSupportedError,
+        WriterNotFoundError,
+    )
+    from .style import Align, Format
+    from .typehint import (
+        Bool,
+        DateTime,
+        Dictionary,
+        Infinity,
+        Integer,
+        IpAddress,
+        List,
+        Nan,
+        NoneType,
+        NullString,
+        RealNumber,
+        String,
+    )
+    from .writer import (
+        AbstractTableWriter,
+        AsciiDocTableWriter,
+        BoldUnicodeTableWriter,
+        BorderlessTableWriter,
+        CssTableWriter,
+        CsvTableWriter,
+        ElasticsearchWriter,
+        ExcelXlsTableWriter,
+        ExcelXlsxTableWriter,
+        HtmlTableWriter,
+        JavaScriptTableWriter,
+        JsonLinesTableWriter,
+        JsonTableWriter,
+        LatexMatrixWriter,
+        LatexTableWriter,
+        LtsvTableWriter,
+        MarkdownTableWriter,
+        MediaWikiTableWriter,
+        NullTableWriter,
+        NumpyTableWriter,
+        PandasDataFramePickleWriter,
+        PandasDataFrameWriter,
+        PhaseStats,
+        PythonCodeTableWriter,
+        RenderPlan,
+        RstCsvTableWriter,
+        RstGridTableWriter,
+        RstSimpleTableWriter,
+        SchemaOverflow,
+        SpaceAlignedTableWriter,
+        SqliteTableWriter,
+        TomlTableWriter,
+        TsvTableWriter,
+        UnicodeTableWriter,
+        WriteStats,
+        YamlTableWriter,
+    )
+    from .writer._width import clear_width_cache, set_width_cache
 
 
 __all__ = (
@@ -75,10 +87,14 @@ __all__ = (
     "__version__",
     "LineBreakHandling",
     "TableWriterFactory",
+    "dump_formats",
     "dumps_tabledata",
     "set_logger",
+    "set_width_cache",
+    "clear_width_cache",
     "FormatAttr",
     "TableFormat",
+    "TableWriterPool",
     "Align",
     "Format",
     "Bool",
@@ -121,13 +137,95 @@ __all__ = (
     "PandasDataFramePickleWriter",
     "PandasDataFrameWriter",
     "PythonCodeTableWriter",
+    "RenderPlan",
     "RstCsvTableWriter",
     "RstGridTableWriter",
     "RstSimpleTableWriter",
+    "SchemaOverflow",
     "SpaceAlignedTableWriter",
     "SqliteTableWriter",
     "TomlTableWriter",
     "TsvTableWriter",
     "UnicodeTableWriter",
     "YamlTableWriter",
+    "PhaseStats",
+    "WriteStats",
+)
+
+# import writers and their dependencies at the first access to reduce the import time
+__getattr__, __dir__ = make_lazy_attrs(
+    __name__,
+    globals(),
+    {
+        "LineBreakHandling": "dataproperty",
+        "TableWriterFactory": "._factory",
+        "dump_formats": "._function",
+        "dumps_tabledata": "._function",
+        "set_logger": "._logger",
+        "set_width_cache": ".writer._width",
+        "clear_width_cache": ".writer._width",
+        "FormatAttr": "._table_format",
+        "TableFormat": "._table_format",
+        "TableWriterPool": "._writer_pool",
+        "EmptyTableDataError": ".error",
+        "EmptyTableNameError": ".error",
+        "EmptyValueError": ".error",
+        "NotSupportedError": ".error",
+        "WriterNotFoundError": ".error",
+        "Align": ".style",
+        "Format": ".style",
+        "Bool": ".typehint",
+        "DateTime": ".typehint",
+        "Dictionary": ".typehint",
+        "Infinity": ".typehint",
+        "Integer": ".typehint",
+        "IpAddress": ".typehint",
+        "List": ".typehint",
+        "Nan": ".typehint",
+        "NoneType": ".typehint",
+        "NullString": ".typehint",
+        "RealNumber": ".typehint",
+        "String": ".typehint",
+        "AbstractTableWriter": ".writer",
+        "AsciiDocTableWriter": ".writer",
+        "BoldUnicodeTableWriter": ".writer",
+        "BorderlessTableWriter": ".writer",
+        "CssTableWriter": ".writer",
+        "CsvTableWriter": ".writer",
+        "ElasticsearchWriter": ".writer",
+        "ExcelXlsTableWriter": ".writer",
+        "ExcelXlsxTableWriter": ".writer",
+        "HtmlTableWriter": ".writer",
+        "JavaScriptTableWriter": ".writer",
+        "JsonLinesTableWriter": ".writer",
+        "JsonTableWriter": ".writer",
+        "LatexMatrixWriter": ".writer",
+        "LatexTableWriter": ".writer",
+        "LtsvTableWriter": ".writer",
+        "MarkdownTableWriter": ".writer",
+        "MediaWikiTableWriter": ".writer",
+        "NullTableWriter": ".writer",
+        "NumpyTableWriter": ".writer",
+        "PandasDataFramePickleWriter": ".writer",
+        "PandasDataFrameWriter": ".writer",
+        "PhaseStats": ".writer",
+        "PythonCodeTableWriter": ".writer",
+        "RenderPlan": ".writer",
+        "RstCsvTableWriter": ".writer",
+        "RstGridTableWriter": ".writer",
+        "RstSimpleTableWriter": ".writer",
+        "SchemaOverflow": ".writer",
+        "SpaceAlignedTableWriter": ".writer",
+        "SqliteTableWriter": ".writer",
+        "TomlTableWriter": ".writer",
+        "TsvTableWriter": ".writer",
+        "UnicodeTableWriter": ".writer",
+        "WriteStats": ".writer",
+        "YamlTableWriter": ".writer",
+        "error": None,
+        "sanitizer": None,
+        "style": None,
+        "typehint": None,
+        "writer": None,
+    },
 )
@@ -9,7 +9,8 @@ from typing import Any, Final
 import typepy
 
 from ._logger import logger
-from ._table_format import FormatAttr, TableFormat
+from ._table_format import WRITER_FILE_EXTENSION_TABLE, WRITER_FORMAT_NAME_TABLE, TableFormat
+from ._writer_pool import DEFAULT_POOL_SIZE, TableWriterPool
 from .error import WriterNotFoundError
 from .writer import AbstractTableWriter
 
@@ -66,34 +67,10 @@ class TableWriterFactory:
             |WriterNotFoundError_desc| the file extension.
         """
 
-        ext: Final = os.path.splitext(file_extension)[1]
-        if typepy.is_null_string(ext):
-            file_extension = file_extension
-        else:
-            file_extension = ext
-
-        file_extension = file_extension.lstrip(".").lower()
-
-        for table_format in TableFormat:
-            if file_extension not in table_format.file_extensions:
-                continue
-
-            if table_format.format_attribute & FormatAttr.SECONDARY_EXT:
-                continue
-
-            logger.debug(f"create a {table_format.writer_class} instance")
+        table_format = cls.__find_table_format_from_file_extension(file_extension)
+        logger.debug(f"create a {table_format.writer_class} instance")
 
-            return table_format.writer_class(**kwargs)  # type: ignore
-
-        raise WriterNotFoundError(
-            "\n".join(
-                [
-                    f"{file_extension:s} (unknown file extension).",
-                    "",
-                    "acceptable file extensions are: {}.".format(", ".join(cls.get_extensions())),
-                ]
-            )
-        )
+        return table_format.writer_class(**kwargs)  # type: ignore
 
     @classmethod
     def create_from_format_name(cls, format_name: str, **kwargs: Any) -> AbstractTableWriter:
@@ -146,24 +123,64 @@ class TableWriterFactory:
             |WriterNotFoundError_desc| for the format.
         """
 
-        format_name = format_name.casefold()
+        table_format = cls.__find_table_format_from_format_name(format_name)
+        writer = table_format.writer_class(**kwargs)  # type: ignore
+        logger.debug(f"create a {writer.FORMAT_NAME} instance")
 
-        for table_format in TableFormat:
-            if format_name in table_format.names and not (
-                table_format.format_attribute & FormatAttr.SECONDARY_NAME
-            ):
-                writer = table_format.writer_class(**kwargs)  # type: ignore
-                logger.debug(f"create a {writer.FORMAT_NAME} instance")
+        return writer
 
-                return writer
+    @classmethod
+    def create_pool_from_file_extension(
+        cls, file_extension: str, pool_size: int = DEFAULT_POOL_SIZE, **kwargs: Any
+    ) -> TableWriterPool:
+        """
+        Create a pool of table writers from a file extension.
+        The prototype writer of the pool is created by
+        :py:meth:`.create_from_file_extension` with the ``kwargs``.
 
-        raise WriterNotFoundError(
-            "\n".join(
-                [
-                    f"{format_name} (unknown format name).",
-                    "acceptable format names are: {}.".format(", ".join(cls.get_format_names())),
-                ]
-            )
+        :param str file_extension:
+            File extension string (case insensitive).
+        :param int pool_size:
+            The maximum number of released writers that are kept to recycle.
+        :param kwargs:
+            Keyword arguments that pass to a writer class constructor.
+        :return:
+            Pool of writers that coincide with the ``file_extension``.
+        :rtype: :py:class:`~pytablewriter.TableWriterPool`
+        :raises pytablewriter.WriterNotFoundError:
+            |WriterNotFoundError_desc| the file extension.
+        """
+
+        return TableWriterPool(
+            cls.create_from_file_extension(file_extension, **kwargs), pool_size=pool_size
+        )
+
+    @classmethod
+    def create_pool_from_format_name(
+        cls, format_name: str, pool_size: int = DEFAULT_POOL_SIZE, **kwargs: Any
+    ) -> TableWriterPool:
+        """
+        Create a pool of table writers from a format name.
+        The prototype writer of the pool is created by
+        :py:meth:`.create_from_format_name` with the ``kwargs``.
+        Writers acquired from the pool are copies of the prototype (or recycled writers),
+        which cost less than creating and configuring writers for each table.
+
+        :param str format_name:
+            Format name string (case insensitive).
+        :param int pool_size:
+            The maximum number of released writers that are kept to recycle.
+        :param kwargs:
+            Keyword arguments that pass to a writer class constructor.
+        :return:
+            Pool of writers that coincide with the ``format_name``.
+        :rtype: :py:class:`~pytablewriter.TableWriterPool`
+        :raises pytablewriter.WriterNotFoundError:
+            |WriterNotFoundError_desc| for the format.
+        """
+
+        return TableWriterPool(
+            cls.create_from_format_name(format_name, **kwargs), pool_size=pool_size
         )
 
     @classmethod
@@ -272,3 +289,44 @@ class TableWriterFactory:
                 file_extension_set.add(file_extension)
 
         return sorted(list(file_extension_set))
+
+    @classmethod
+    def __find_table_format_from_file_extension(cls, file_extension: str) -> TableFormat:
+        ext: Final = os.path.splitext(file_extension)[1]
+        if typepy.is_null_string(ext):
+            file_extension = file_extension
+        else:
+            file_extension = ext
+
+        file_extension = file_extension.lstrip(".").lower()
+
+        table_format = WRITER_FILE_EXTENSION_TABLE.get(file_extension)
+        if table_format is not None:
+            return table_format
+
+        raise WriterNotFoundError(
+            "\n".join(
+                [
+                    f"{file_extension:s} (unknown file extension).",
+                    "",
+                    "acceptable file extensions are: {}.".format(", ".join(cls.get_extensions())),
+                ]
+            )
+        )
+
+    @classmethod
+    def __find_table_format_from_format_name(cls, format_name: str) -> TableFormat:
+        format_name = format_name.casefold()
+
+        table_format = WRITER_FORMAT_NAME_TABLE.get(format_name)
+        if table_format is not None:
+            return table_format
+
+        raise WriterNotFoundError(
+            "\n".join(
+                [
+                    f"{format_name} (unknown format name).",
+                    "acceptable format names are: {}.".format(", ".join(cls.get_format_names())),
+                ]
+            )
+        )
@@ -2,15 +2,22 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import pickle
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import IO, TYPE_CHECKING, Any, NamedTuple, Optional, Union
 
 import dataproperty
 from pathvalidate import replace_symbol
 from tabledata._core import TableData
 
 
+if TYPE_CHECKING:
+    from ._table_format import TableFormat
+    from .writer import AbstractTableWriter
+
+
 def quote_datetime_formatter(value: datetime) -> str:
     return f'"{value.strftime(dataproperty.DefaultValue.DATETIME_FORMAT):s}"'
 
@@ -59,6 +66,225 @@ def dumps_tabledata(value: TableData, format_name: str = "rst_grid_table", **kwa
     return writer.dumps()
 
 
+class _TableSpec(NamedTuple):
+    # attributes of a table that are copied by AbstractTableWriter.from_writer
+    table_name: str
+    headers: Sequence[str]
+    value_matrix: Sequence
+    type_hints: Sequence
+    column_styles: Sequence
+    style_filters: Sequence
+    style_filter_kwargs: dict[str, Any]
+    margin: Optional[int]
+
+
+def _to_table_spec(writer: "AbstractTableWriter") -> _TableSpec:
+    value_matrix = writer.value_matrix
+    if not isinstance(value_matrix, Sequence):
+        # writers read rows of the same table: consume an iterator only once
+        value_matrix = list(value_matrix)
+
+    try:
+        margin: Optional[int] = writer.margin
+    except NotImplementedError:
+        margin = None
+
+    return _TableSpec(
+        table_name=str(writer.table_name),
+        headers=writer.headers,
+        value_matrix=value_matrix,
+        type_hints=writer.type_hints,
+        column_styles=writer.column_styles,
+        style_filters=writer._style_filters,
+        style_filter_kwargs={
+            key: value for key, value in writer.style_filter_kwargs.items() if key != "writer"
+        },
+        margin=margin,
+    )
+
+
+def _create_format_writer(
+    table_format: Union[str, "TableFormat"], spec: _TableSpec
+) -> "AbstractTableWriter":
+    from ._factory import TableWriterFactory
+    from ._table_format import TableFormat
+
+    if isinstance(table_format, TableFormat):
+        writer = table_format.writer_class()  # type: ignore
+    else:
+        writer = TableWriterFactory.create_from_format_name(table_format)
+
+    writer.table_name = spec.table_name
+    writer.headers = spec.headers
+    writer.value_matrix = spec.value_matrix
+    writer.type_hints = spec.type_hints
+    writer.column_styles = spec.column_styles
+    writer._style_filters = list(spec.style_filters)
+    writer.style_filter_kwargs = dict(spec.style_filter_kwargs)
+    if spec.margin is not None:
+        try:
+            writer.margin = spec.margin
+        except NotImplementedError:
+            pass
+
+    # dump disables ANSI escape sequences while writing: disable them in advance to
+    # keep the preprocessed results of the writer after writing
+    writer.enable_ansi_escape = False
+
+    return writer
+
+
+_WriterGroup = list[tuple[Union[str, "TableFormat"], "AbstractTableWriter"]]
+
+
+def _group_format_writers(
+    table_formats: Sequence[Union[str, "TableFormat"]], spec: _TableSpec
+) -> list[_WriterGroup]:
+    # writers that convert values with the same settings are grouped:
+    # the first writer of a group converts values, and the others reuse the data properties
+    groups: list[_WriterGroup] = []
+    key_to_group: dict[tuple, _WriterGroup] = {}
+
+    for table_format in table_formats:
+        writer = _create_format_writer(table_format, spec)
+        key = writer._get_dp_extraction_key()
+
+        if key is not None and key in key_to_group:
+            key_to_group[key].append((table_format, writer))
+            continue
+
+        group = [(table_format, writer)]
+        groups.append(group)
+        if key is not None:
+            key_to_group[key] = group
+
+    return groups
+
+
+def _iter_shared_writers(
+    group: _WriterGroup,
+) -> Iterator[tuple[Union[str, "TableFormat"], "AbstractTableWriter"]]:
+    _, leader = group[0]
+
+    for table_format, writer in group:
+        if writer is not leader:
+            writer._share_table_dp(leader)
+
+        yield table_format, writer
+
+
+def _write_group(
+    group: _WriterGroup, outputs: Mapping[Union[str, "TableFormat"], Union[str, IO]]
+) -> None:
+    for table_format, writer in _iter_shared_writers(group):
+        output = outputs[table_format]
+        writer.dump(output, close_after_write=not hasattr(output, "write"))
+
+
+def _render_group_helper(
+    pickled_spec: bytes, table_formats: Sequence[Union[str, "TableFormat"]]
+) -> list[tuple[Union[str, "TableFormat"], str]]:
+    spec: _TableSpec = pickle.loads(pickled_spec)
+
+    return [
+        (table_format, writer.dumps())
+        for group in _group_format_writers(table_formats, spec)
+        for table_format, writer in _iter_shared_writers(group)
+    ]
+
+
+def _write_text(output: Union[str, IO], text: str) -> None:
+    if hasattr(output, "write"):
+        output.write(text)  # type: ignore
+        return
+
+    with open(output, "w", encoding="utf-8") as f:  # type: ignore
+        f.write(text)
+
+
+def dump_formats(
+    writer: "AbstractTableWriter",
+    outputs: Mapping[Union[str, "TableFormat"], Union[str, IO]],
+    max_workers: int = 1,
+) -> None:
+    """
+    Write the table of a writer to multiple outputs with different formats.
+
+    Types of values in the table are detected once for the formats that convert values
+    with the same settings (e.g. Markdown/reStructuredText/Unicode),
+    and each format renders the table from the shared data properties.
+
+    :param pytablewriter.writer.AbstractTableWriter writer:
+        A writer that holds the table to write. The same attributes as
+        :py:meth:`~pytablewriter.writer.AbstractTableWriter.from_writer` are copied to
+        the writers of the formats: headers, values, type hints, styles, etc.
+    :param outputs:
+        Mapping of formats (format names or |TableFormat|) to outputs.
+        Outputs must either output streams or paths to output files.
+        Output streams are not closed after writing.
+    :param int max_workers:
+        Maximum number of processes to render text formats concurrently.
+        Formats that share data properties are rendered in the same process,
+        and rendered texts are written to the outputs by the calling process.
+        Formats are rendered one by one if the value is one or less,
+        or the table can not be sent to other processes (e.g. style filters defined as lambdas).
+        Defaults to ``1``.
+
+    :Example:
+        .. code:: python
+
+            from pytablewriter import MarkdownTableWriter, dump_formats
+
+            writer = MarkdownTableWriter(
+                headers=["a", "b"],
+                value_matrix=[[1, 0.1], [2, 0.25]],
+            )
+            dump_formats(
+                writer,
+                {"markdown": "sample.md", "rst_grid_table": "sample.rst", "csv": "sample.csv"},
+            )
+    """
+
+    spec = _to_table_spec(writer)
+    groups = _group_format_writers(list(outputs), spec)
+
+    pickled_spec = None
+    if max_workers > 1 and len(groups) > 1:
+        try:
+            pickled_spec = pickle.dumps(spec)
+        except (AttributeError, TypeError, pickle.PicklingError):
+            # e.g. style filters defined as lambdas or local functions
+            pickled_spec = None
+
+    if pickled_spec is None:
+        for group in groups:
+            _write_group(group, outputs)
+        return
+
+    from concurrent import futures
+
+    from .writer.text._interface import TextWriterInterface
+
+    with futures.ProcessPoolExecutor(max_workers) as executor:
+        future_map = {}
+        for group_idx, group in enumerate(groups):
+            if all(isinstance(format_writer, TextWriterInterface) for _, format_writer in group):
+                future_map[group_idx] = executor.submit(
+                    _render_group_helper,
+                    pickled_spec,
+                    [table_format for table_format, _ in group],
+                )
+
+        for group_idx, group in enumerate(groups):
+            if group_idx not in future_map:
+                # binary formats write to the outputs by themselves
+                _write_group(group, outputs)
+                continue
+
+            for table_format, text in future_map[group_idx].result():
+                _write_text(outputs[table_format], text)
+
+
 def normalize_enum(
     value: Any, enum_class: type[Enum], validate: bool = True, default: Optional[Enum] = None
 ) -> Any:
@@ -0,0 +1,49 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import importlib
+from collections.abc import Mapping
+from typing import Any, Callable, Optional
+
+
+def make_lazy_attrs(
+    package: str, namespace: dict[str, Any], attr_modules: Mapping[str, Optional[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Make module-level ``__getattr__`` and ``__dir__`` functions that import attributes
+    of a package at the first access instead of at the import of the package.
+
+    Args:
+        package:
+            Name of the package (``__name__`` of the package).
+        namespace:
+            Namespace of the package (``globals()`` of the package).
+            Imported attributes are cached to the namespace.
+        attr_modules:
+            Mapping of attribute names to the (relative) module names that define them.
+            |None| means that the attribute is a submodule of the package.
+
+    Returns:
+        ``__getattr__`` and ``__dir__`` functions for the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = attr_modules[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        if module_name is None:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            value = getattr(importlib.import_module(module_name, package), name)
+
+        namespace[name] = value
+
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(attr_modules))
+
+    return __getattr__, __dir__
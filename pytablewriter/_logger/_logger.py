@@ -60,11 +60,24 @@ class WriterLogger:
 
         self.logger.debug(f"created WriterLogger: format={writer.format_name}")
 
+    def __getstate__(self) -> dict:
+        # loguru logger is not picklable: restore the module logger when unpickled
+        state = self.__dict__.copy()
+        del state["_WriterLogger__logger"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__logger = logger
+
     def __enter__(self) -> "WriterLogger":
+        self.__writer._write_stats_recorder.begin_write()
         self.logging_start_write()
         return self
 
     def __exit__(self, *exc):  # type: ignore
+        self.__writer._write_stats_recorder.end_write(is_succeeded=exc[0] is None)
         self.logging_complete_write()
         return False
 
@@ -4,7 +4,7 @@
 
 import enum
 from collections.abc import Sequence
-from typing import Optional
+from typing import Callable, Final, Optional
 
 from .writer import (
     AbstractTableWriter,
@@ -325,13 +325,7 @@ class TableFormat(enum.Enum):
             Optional[TableFormat]: A table format enum value corresponding to the ``format_name``.
         """
 
-        format_name = format_name.casefold().strip()
-
-        for table_format in TableFormat:
-            if format_name in table_format.names:
-                return table_format
-
-        return None
+        return FORMAT_NAME_TABLE.get(format_name.casefold().strip())
 
     @classmethod
     def from_file_extension(cls, file_extension: str) -> Optional["TableFormat"]:
@@ -345,10 +339,33 @@ class TableFormat(enum.Enum):
                 A table format enum value corresponding to the ``file_extension``.
         """
 
-        ext = file_extension.lower().strip().lstrip(".")
+        return FILE_EXTENSION_TABLE.get(file_extension.lower().strip().lstrip("."))
+
+
+def _make_lookup_table(
+    get_keys: Callable[[TableFormat], Sequence[str]], excluded_attr: int = 0
+) -> dict[str, TableFormat]:
+    # the first defined table format takes precedence if table formats share a key
+    lookup_table: dict[str, TableFormat] = {}
+
+    for table_format in TableFormat:
+        if table_format.format_attribute & excluded_attr:
+            continue
 
-        for table_format in TableFormat:
-            if ext in table_format.file_extensions:
-                return table_format
+        for key in get_keys(table_format):
+            lookup_table.setdefault(key, table_format)
 
-        return None
+    return lookup_table
+
+
+# lookup tables from format names/file extensions to table formats
+FORMAT_NAME_TABLE: Final = _make_lookup_table(lambda table_format: table_format.names)
+FILE_EXTENSION_TABLE: Final = _make_lookup_table(lambda table_format: table_format.file_extensions)
+
+# lookup tables of table formats to create writers: secondary names/file extensions are excluded
+WRITER_FORMAT_NAME_TABLE: Final = _make_lookup_table(
+    lambda table_format: table_format.names, excluded_attr=FormatAttr.SECONDARY_NAME
+)
+WRITER_FILE_EXTENSION_TABLE: Final = _make_lookup_table(
+    lambda table_format: table_format.file_extensions, excluded_attr=FormatAttr.SECONDARY_EXT
+)
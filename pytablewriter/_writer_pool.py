@@ -0,0 +1,187 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import copy
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Final
+
+from .writer import AbstractTableWriter
+from .writer.text._text_writer import TextTableWriter
+
+
+DEFAULT_POOL_SIZE: Final = 8
+
+
+class TableWriterPool:
+    """
+    A pool of table writers that are copied from a prototype writer.
+    Copying the prototype costs less than creating a writer and configuring it
+    (styles, style filters, themes, type hints, etc.),
+    and released writers are recycled without copying.
+
+    Writers acquired from a pool write to the stream of the prototype
+    (text writers only: binary writers output to files that are opened by the open method).
+    Writers are expected to change only table data: the following attributes,
+    which include the attributes set by the ``from_*`` methods, are restored to
+    the values of the prototype, and preprocessed data are cleared when a writer is released.
+
+    - :py:attr:`~pytablewriter.writer._table_writer.AbstractTableWriter.table_name`
+    - :py:attr:`~pytablewriter.writer._table_writer.AbstractTableWriter.headers`
+    - :py:attr:`~pytablewriter.writer._table_writer.AbstractTableWriter.type_hints`
+    - :py:attr:`~pytablewriter.writer._table_writer.AbstractTableWriter.value_matrix`
+    - :py:attr:`~pytablewriter.writer._table_writer.AbstractTableWriter.iteration_length`
+    - :py:attr:`~pytablewriter.writer._table_writer.AbstractTableWriter.write_callback`
+    - :py:attr:`~pytablewriter.writer._table_writer.AbstractTableWriter.column_styles`
+    - style filters and
+      :py:attr:`~pytablewriter.writer._table_writer.AbstractTableWriter.style_filter_kwargs`
+    - the stream and the margin of text writers
+
+    Acquiring and releasing writers are thread-safe.
+
+    Args:
+        prototype:
+            A configured writer to copy. Changes to the prototype after the pool creation
+            do not affect writers of the pool.
+        pool_size:
+            The maximum number of released writers that are kept to recycle.
+
+    :Example:
+        .. code-block:: python
+
+            import pytablewriter as ptw
+
+            pool = ptw.TableWriterFactory.create_pool_from_format_name("markdown", margin=1)
+
+            with pool.borrow() as writer:
+                writer.headers = ["a", "b"]
+                writer.value_matrix = [[1, 2], [3, 4]]
+                print(writer.dumps())
+    """
+
+    def __init__(self, prototype: AbstractTableWriter, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        if pool_size < 0:
+            raise ValueError(f"pool_size must be greater than or equal to zero: {pool_size}")
+
+        self.__prototype = prototype._create_detached_copy()
+        self.__pool_size = pool_size
+
+        # detached copies do not have streams
+        self.__stream = prototype.stream if isinstance(prototype, TextTableWriter) else None
+        self.__writers: deque[AbstractTableWriter] = deque()
+
+    def __repr__(self) -> str:
+        return "{}(format_name={}, pool_size={}, idle_writers={})".format(
+            self.__class__.__name__, self.format_name, self.pool_size, self.num_idle_writers
+        )
+
+    @property
+    def format_name(self) -> str:
+        return self.__prototype.format_name
+
+    @property
+    def pool_size(self) -> int:
+        return self.__pool_size
+
+    @property
+    def num_idle_writers(self) -> int:
+        """
+        int: The number of released writers that are waiting to be recycled.
+        """
+
+        return len(self.__writers)
+
+    def acquire(self) -> AbstractTableWriter:
+        """
+        Get a writer from the pool.
+        A released writer is recycled if any, otherwise a copy of the prototype is created.
+
+        Returns:
+            A writer that has the same configuration as the prototype.
+        """
+
+        try:
+            return self.__writers.pop()
+        except IndexError:
+            pass
+
+        writer = self.__prototype._create_detached_copy()
+        if isinstance(writer, TextTableWriter):
+            writer.stream = self.__stream
+
+        return writer
+
+    def release(self, writer: AbstractTableWriter) -> None:
+        """
+        Return a writer to the pool.
+        The writer is discarded if the pool is full.
+
+        Args:
+            writer:
+                A writer acquired from the pool.
+
+        Raises:
+            TypeError:
+                If the ``writer`` is not an instance of the class of the prototype.
+        """
+
+        if type(writer) is not type(self.__prototype):
+            raise TypeError(
+                "expected a {} instance, actual={}".format(
+                    type(self.__prototype).__name__, type(writer).__name__
+                )
+            )
+
+        if len(self.__writers) >= self.__pool_size:
+            return
+
+        self.__reset(writer)
+        self.__writers.append(writer)
+
+    @contextmanager
+    def borrow(self) -> Iterator[AbstractTableWriter]:
+        """
+        A context manager that acquires a writer and releases the writer at the exit.
+        """
+
+        writer = self.acquire()
+        try:
+            yield writer
+        finally:
+            self.release(writer)
+
+    def clear(self) -> None:
+        """
+        Discard released writers in the pool.
+        """
+
+        self.__writers.clear()
+
+    def __reset(self, writer: AbstractTableWriter) -> None:
+        prototype = self.__prototype
+
+        writer.table_name = prototype.table_name
+        writer.headers = list(prototype.headers)
+        writer.type_hints = prototype.type_hints
+        writer.value_matrix = []
+
+        if not isinstance(writer, AbstractTableWriter):
+            # NullTableWriter
+            return
+
+        writer.iteration_length = prototype.iteration_length
+        writer.write_callback = prototype.write_callback
+
+        # from_writer copies styles of another writer
+        if writer.column_styles != prototype.column_styles:
+            writer.column_styles = copy.deepcopy(prototype.column_styles)
+        writer._style_filters = list(prototype._style_filters)
+        writer.style_filter_kwargs = dict(prototype.style_filter_kwargs)
+
+        if isinstance(writer, TextTableWriter):
+            writer.stream = self.__stream
+            writer.margin = prototype.margin
+
+        writer._clear_preprocess()
@@ -20,6 +20,7 @@ from ._theme import (
     StyleFilterFunc,
     Theme,
     fetch_theme,
+    invalidate_theme_cache,
     list_themes,
 )
 
@@ -49,5 +50,6 @@ __all__ = (
     "Theme",
     "get_align_char",
     "fetch_theme",
+    "invalidate_theme_cache",
     "list_themes",
 )
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, Final, Optional
 from dataproperty import Align
 from tcolorpy import Color, tcolor
 
+from ..writer._width import align_str
 from ._font import FontSize, FontStyle, FontWeight
 from ._style import DecorationLine, Style, ThousandSeparator
 from ._styler_interface import StylerInterface
@@ -88,7 +89,7 @@ class TextStyler(AbstractStyler):
         return "".join(format_items)
 
     def apply_align(self, value: str, style: Style) -> str:
-        return self.__get_align_format(style).format(value)
+        return align_str(value, self.__get_align_format(style))
 
     def apply(self, value: str, style: Style) -> str:
         if value:
@@ -1,7 +1,9 @@
 import importlib
+import importlib.metadata
 import pkgutil
 import re
-from collections.abc import Sequence
+import threading
+from collections.abc import Iterable, Sequence
 from typing import Any, Final, NamedTuple, Optional, Protocol
 
 from .._logger import logger
@@ -14,6 +16,11 @@ KNOWN_PLUGINS: Final = (
     f"{PLUGIN_NAME_PEFIX}_altrow_{PLUGIN_NAME_SUFFIX}",
     f"{PLUGIN_NAME_PEFIX}_altcol_{PLUGIN_NAME_SUFFIX}",
 )
+PLUGIN_ENTRY_POINT_GROUP: Final = "pytablewriter.themes"
+
+_PLUGIN_REGEXP: Final = re.compile(
+    rf"^{PLUGIN_NAME_PEFIX}[_-].+[_-]{PLUGIN_NAME_SUFFIX}", re.IGNORECASE
+)
 
 
 class StyleFilterFunc(Protocol):
@@ -36,53 +43,143 @@ class Theme(NamedTuple):
     check_style_filter_kwargs: Optional[CheckStyleFilterKeywordArgsFunc]
 
 
+class _ThemeRegistry:
+    """
+    A process-wide registry of the installed theme plugins.
+    Plugins are discovered at the first access and the results are cached until
+    :py:func:`.invalidate_theme_cache` is called.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__themes: Optional[dict[str, Theme]] = None
+        self.__fetched_themes: dict[str, Theme] = {}
+
+    def get_themes(self) -> dict[str, Theme]:
+        themes = self.__themes
+        if themes is not None:
+            return themes
+
+        with self.__lock:
+            if self.__themes is None:
+                self.__themes = _discover_themes()
+
+            return self.__themes
+
+    def fetch(self, plugin_name: str) -> Optional[Theme]:
+        theme = self.__fetched_themes.get(plugin_name)
+        if theme is not None:
+            return theme
+
+        loaded_themes: Final = self.get_themes()
+        theme_regexp: Final = re.compile(
+            rf"^{PLUGIN_NAME_PEFIX}[_-]{plugin_name}[_-]{PLUGIN_NAME_SUFFIX}", re.IGNORECASE
+        )
+
+        for loaded_theme, theme in loaded_themes.items():
+            if theme_regexp.search(loaded_theme):
+                self.__fetched_themes[plugin_name] = theme
+                return theme
+
+        return None
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__themes = None
+            self.__fetched_themes = {}
+
+
+def _to_theme(plugin: Any) -> Theme:
+    style_filter = plugin.style_filter if hasattr(plugin, "style_filter") else None
+    col_sep_style_filter = (
+        plugin.col_separator_style_filter if hasattr(plugin, "col_separator_style_filter") else None
+    )
+    check_kwargs_func = (
+        plugin.check_style_filter_kwargs if hasattr(plugin, "check_style_filter_kwargs") else None
+    )
+
+    return Theme(style_filter, col_sep_style_filter, check_kwargs_func)
+
+
+def _iter_theme_entry_points() -> Iterable[importlib.metadata.EntryPoint]:
+    entry_points = importlib.metadata.entry_points()
+
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group=PLUGIN_ENTRY_POINT_GROUP)
+
+    # Python 3.9
+    return entry_points.get(PLUGIN_ENTRY_POINT_GROUP, [])  # type: ignore
+
+
+def _discover_themes() -> dict[str, Theme]:
+    discovered_plugins: dict[str, Any] = {}
+
+    for entry_point in _iter_theme_entry_points():
+        name = entry_point.name
+        if _PLUGIN_REGEXP.search(name) is None:
+            name = f"{PLUGIN_NAME_PEFIX}_{name}_{PLUGIN_NAME_SUFFIX}"
+
+        try:
+            discovered_plugins[name] = entry_point.load()
+        except (ImportError, AttributeError) as e:
+            # ImportError: the module of the entry point is not importable,
+            # AttributeError: the object of the entry point is not found in the module
+            logger.warning(f"failed to load a theme entry point '{entry_point.name}': {e}")
+
+    # plugins that do not provide entry points are found by the module names
+    for _finder, name, _ispkg in pkgutil.iter_modules():
+        if name in discovered_plugins or _PLUGIN_REGEXP.search(name) is None:
+            continue
+
+        discovered_plugins[name] = importlib.import_module(name)
+
+    logger.debug(f"discovered_plugins: {list(discovered_plugins)}")
+
+    return {name: _to_theme(plugin) for name, plugin in discovered_plugins.items()}
+
+
+_theme_registry: Final = _ThemeRegistry()
+
+
 def list_themes() -> Sequence[str]:
+    """
+    Return the names of the installed theme plugins.
+    """
+
     return list(load_ptw_plugins())
 
 
 def load_ptw_plugins() -> dict[str, Theme]:
-    plugin_regexp: Final = re.compile(
-        rf"^{PLUGIN_NAME_PEFIX}[_-].+[_-]{PLUGIN_NAME_SUFFIX}", re.IGNORECASE
-    )
+    """
+    Return the installed theme plugins.
+    Plugins are discovered once per process from the ``pytablewriter.themes`` entry points
+    and the modules that named ``pytablewriter-<name>-theme``.
+    """
 
-    discovered_plugins: Final = {
-        name: importlib.import_module(name)
-        for _finder, name, _ispkg in pkgutil.iter_modules()
-        if plugin_regexp.search(name) is not None
-    }
+    return dict(_theme_registry.get_themes())
 
-    logger.debug(f"discovered_plugins: {list(discovered_plugins)}")
 
-    themes: dict[str, Theme] = {}
-    for theme, plugin in discovered_plugins.items():
-        style_filter = plugin.style_filter if hasattr(plugin, "style_filter") else None
-        col_sep_style_filter = (
-            plugin.col_separator_style_filter
-            if hasattr(plugin, "col_separator_style_filter")
-            else None
-        )
-        check_kwargs_func = (
-            plugin.check_style_filter_kwargs
-            if hasattr(plugin, "check_style_filter_kwargs")
-            else None
-        )
-        themes[theme] = Theme(style_filter, col_sep_style_filter, check_kwargs_func)
+def invalidate_theme_cache() -> None:
+    """
+    Clear the cache of the discovered theme plugins.
+    Call this function after installing or uninstalling theme plugins at runtime
+    to discover the plugins again at the next theme lookup.
+    """
 
-    return themes
+    _theme_registry.invalidate()
 
 
 def fetch_theme(plugin_name: str) -> Theme:
-    loaded_themes: Final = load_ptw_plugins()
-    theme_regexp: Final = re.compile(
-        rf"^{PLUGIN_NAME_PEFIX}[_-]{plugin_name}[_-]{PLUGIN_NAME_SUFFIX}", re.IGNORECASE
-    )
-    matched_theme = None
+    """
+    Return the theme of the installed plugin that matches the theme name.
+
+    Raises:
+        RuntimeError: Raised when the theme plugin is not installed.
+    """
+
+    theme = _theme_registry.fetch(plugin_name)
 
-    for loaded_theme in loaded_themes:
-        if theme_regexp.search(loaded_theme):
-            matched_theme = loaded_theme
-            break
-    else:
+    if theme is None:
         err_msgs = [f"{plugin_name} theme is not installed."]
 
         if plugin_name in KNOWN_PLUGINS:
@@ -90,4 +187,4 @@ def fetch_theme(plugin_name: str) -> Theme:
 
         raise RuntimeError(" ".join(err_msgs))
 
-    return loaded_themes[matched_theme]
+    return theme
@@ -1,41 +1,50 @@
-from ._elasticsearch import ElasticsearchWriter
-from ._null import NullTableWriter
-from ._table_writer import AbstractTableWriter
-from .binary import (
-    ExcelXlsTableWriter,
-    ExcelXlsxTableWriter,
-    PandasDataFramePickleWriter,
-    SqliteTableWriter,
-)
-from .text import (
-    AsciiDocTableWriter,
-    BoldUnicodeTableWriter,
-    BorderlessTableWriter,
-    CssTableWriter,
-    CsvTableWriter,
-    HtmlTableWriter,
-    JsonLinesTableWriter,
-    JsonTableWriter,
-    LatexMatrixWriter,
-    LatexTableWriter,
-    LtsvTableWriter,
-    MarkdownTableWriter,
-    MediaWikiTableWriter,
-    RstCsvTableWriter,
-    RstGridTableWriter,
-    RstSimpleTableWriter,
-    SpaceAlignedTableWriter,
-    TomlTableWriter,
-    TsvTableWriter,
-    UnicodeTableWriter,
-    YamlTableWriter,
-)
-from .text.sourcecode import (
-    JavaScriptTableWriter,
-    NumpyTableWriter,
-    PandasDataFrameWriter,
-    PythonCodeTableWriter,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy_import import make_lazy_attrs
+
+
+if TYPE_CHECKING:
+    from ._elasticsearch import ElasticsearchWriter
+    from ._null import NullTableWriter
+    from ._schema import SchemaOverflow
+    from ._table_writer import AbstractTableWriter
+    from ._write_stats import PhaseStats, WriteStats
+    from .binary import (
+        ExcelXlsTableWriter,
+        ExcelXlsxTableWriter,
+        PandasDataFramePickleWriter,
+        SqliteTableWriter,
+    )
+    from .text import (
+        AsciiDocTableWriter,
+        BoldUnicodeTableWriter,
+        BorderlessTableWriter,
+        CssTableWriter,
+        CsvTableWriter,
+        HtmlTableWriter,
+        JsonLinesTableWriter,
+        JsonTableWriter,
+        LatexMatrixWriter,
+        LatexTableWriter,
+        LtsvTableWriter,
+        MarkdownTableWriter,
+        MediaWikiTableWriter,
+        RenderPlan,
+        RstCsvTableWriter,
+        RstGridTableWriter,
+        RstSimpleTableWriter,
+        SpaceAlignedTableWriter,
+        TomlTableWriter,
+        TsvTableWriter,
+        UnicodeTableWriter,
+        YamlTableWriter,
+    )
+    from .text.sourcecode import (
+        JavaScriptTableWriter,
+        NumpyTableWriter,
+        PandasDataFrameWriter,
+        PythonCodeTableWriter,
+    )
 
 
 __all__ = (
@@ -61,14 +70,64 @@ __all__ = (
     "NumpyTableWriter",
     "PandasDataFramePickleWriter",
     "PandasDataFrameWriter",
+    "PhaseStats",
     "PythonCodeTableWriter",
+    "RenderPlan",
     "RstCsvTableWriter",
     "RstGridTableWriter",
     "RstSimpleTableWriter",
+    "SchemaOverflow",
     "SpaceAlignedTableWriter",
     "SqliteTableWriter",
     "TomlTableWriter",
     "TsvTableWriter",
     "UnicodeTableWriter",
+    "WriteStats",
     "YamlTableWriter",
 )
+
+# import writers and their dependencies at the first access to reduce the import time
+__getattr__, __dir__ = make_lazy_attrs(
+    __name__,
+    globals(),
+    {
+        "ElasticsearchWriter": "._elasticsearch",
+        "NullTableWriter": "._null",
+        "AbstractTableWriter": "._table_writer",
+        "SchemaOverflow": "._schema",
+        "PhaseStats": "._write_stats",
+        "WriteStats": "._write_stats",
+        "ExcelXlsTableWriter": ".binary",
+        "ExcelXlsxTableWriter": ".binary",
+        "PandasDataFramePickleWriter": ".binary",
+        "SqliteTableWriter": ".binary",
+        "AsciiDocTableWriter": ".text",
+        "BoldUnicodeTableWriter": ".text",
+        "BorderlessTableWriter": ".text",
+        "CssTableWriter": ".text",
+        "CsvTableWriter": ".text",
+        "HtmlTableWriter": ".text",
+        "JsonLinesTableWriter": ".text",
+        "JsonTableWriter": ".text",
+        "LatexMatrixWriter": ".text",
+        "LatexTableWriter": ".text",
+        "LtsvTableWriter": ".text",
+        "MarkdownTableWriter": ".text",
+        "MediaWikiTableWriter": ".text",
+        "RenderPlan": ".text",
+        "RstCsvTableWriter": ".text",
+        "RstGridTableWriter": ".text",
+        "RstSimpleTableWriter": ".text",
+        "SpaceAlignedTableWriter": ".text",
+        "TomlTableWriter": ".text",
+        "TsvTableWriter": ".text",
+        "UnicodeTableWriter": ".text",
+        "YamlTableWriter": ".text",
+        "JavaScriptTableWriter": ".text.sourcecode",
+        "NumpyTableWriter": ".text.sourcecode",
+        "PandasDataFrameWriter": ".text.sourcecode",
+        "PythonCodeTableWriter": ".text.sourcecode",
+        "binary": None,
+        "text": None,
+    },
+)
@@ -0,0 +1,222 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Conversion of Apache Arrow data (pyarrow) to the tabular data of writers.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Optional, Union, overload
+
+from ..typehint import Bool, DateTime, Dictionary, Integer, List, NoneType, RealNumber, TypeHint
+
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+    ArrowData = Union[
+        "pyarrow.Table",
+        "pyarrow.RecordBatch",
+        "pyarrow.RecordBatchReader",
+        Iterable["pyarrow.RecordBatch"],
+    ]
+
+
+def to_type_hint(arrow_type: "pyarrow.DataType") -> TypeHint:
+    """
+    Convert an Arrow data type to a type hint of writers.
+    |None| (detect types from values) if no type hint corresponds to the type.
+    Type hints of string columns are also |None|:
+    the :py:class:`~pytablewriter.typehint.String` type hint converts null values to ``"None"``.
+    """
+
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(arrow_type):
+        return to_type_hint(arrow_type.value_type)
+
+    if pa.types.is_null(arrow_type):
+        return NoneType
+    if pa.types.is_boolean(arrow_type):
+        return Bool
+    if pa.types.is_integer(arrow_type):
+        return Integer
+    if pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+        return RealNumber
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+        return DateTime
+    if (
+        pa.types.is_list(arrow_type)
+        or pa.types.is_large_list(arrow_type)
+        or pa.types.is_fixed_size_list(arrow_type)
+    ):
+        return List
+    if pa.types.is_struct(arrow_type) or pa.types.is_map(arrow_type):
+        return Dictionary
+
+    return None
+
+
+def _to_numeric_array(column: "pyarrow.Array") -> Optional["numpy.ndarray"]:
+    import pyarrow as pa
+
+    if column.null_count > 0 or not (
+        pa.types.is_integer(column.type) or pa.types.is_floating(column.type)
+    ):
+        return None
+
+    try:
+        # a view of the Arrow buffer
+        return column.to_numpy(zero_copy_only=True)
+    except (pa.ArrowInvalid, NotImplementedError):
+        return None
+
+
+class RecordBatchMatrix(Sequence):
+    """
+    Rows of a ``pyarrow.RecordBatch``.
+
+    Attributes:
+        numeric_columns:
+            Mapping of column indices to NumPy views of the integer/float columns
+            that have no null values.
+    """
+
+    def __init__(self, batch: Optional["pyarrow.RecordBatch"] = None) -> None:
+        self.__rows: list[tuple[Any, ...]] = []
+        self.numeric_columns: dict[int, "numpy.ndarray"] = {}
+
+        if batch is None:
+            return
+
+        self.__rows = list(zip(*(column.to_pylist() for column in batch.columns)))
+
+        for col_idx, column in enumerate(batch.columns):
+            array = _to_numeric_array(column)
+            if array is not None:
+                self.numeric_columns[col_idx] = array
+
+    @classmethod
+    def from_matrices(cls, matrices: Iterable["RecordBatchMatrix"]) -> "RecordBatchMatrix":
+        """
+        Concatenate the rows of matrices.
+        Columns are numeric columns of the result if the columns are numeric in all of the matrices.
+        """
+
+        import numpy as np
+
+        result = cls()
+        numeric_arrays: Optional[dict[int, list["numpy.ndarray"]]] = None
+
+        for matrix in matrices:
+            result.__rows.extend(matrix.__rows)
+
+            if numeric_arrays is None:
+                numeric_arrays = {
+                    col_idx: [array] for col_idx, array in matrix.numeric_columns.items()
+                }
+                continue
+
+            numeric_arrays = {
+                col_idx: arrays + [matrix.numeric_columns[col_idx]]
+                for col_idx, arrays in numeric_arrays.items()
+                if col_idx in matrix.numeric_columns
+            }
+
+        if numeric_arrays:
+            result.numeric_columns = {
+                col_idx: np.concatenate(arrays) for col_idx, arrays in numeric_arrays.items()
+            }
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[Any, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[Any, ...]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[tuple[Any, ...], list[tuple[Any, ...]]]:
+        return self.__rows[index]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rows={len(self.__rows)})"
+
+
+class RecordBatchMatrices(Iterable):
+    """
+    An iterable of :py:class:`RecordBatchMatrix`: a record batch is converted to rows
+    when the iteration reaches the batch.
+    Iterable multiple times if the batches are a sequence, or after :py:meth:`.to_matrix`.
+    """
+
+    def __init__(self, batches: Iterable["pyarrow.RecordBatch"]) -> None:
+        self.__batches = batches
+        self.__matrix: Optional[RecordBatchMatrix] = None
+
+    def __iter__(self) -> Iterator[RecordBatchMatrix]:
+        if self.__matrix is not None:
+            if self.__matrix:
+                yield self.__matrix
+            return
+
+        for batch in self.__batches:
+            if batch.num_rows == 0:
+                continue
+
+            yield RecordBatchMatrix(batch)
+
+    def to_matrix(self) -> RecordBatchMatrix:
+        """
+        Concatenate all of the record batches into a matrix to write them as a table.
+        The matrix is cached: batches of an iterator are consumed at the first call.
+        """
+
+        if self.__matrix is None:
+            self.__matrix = RecordBatchMatrix.from_matrices(iter(self))
+
+        return self.__matrix
+
+
+def split_arrow_data(
+    data: "ArrowData",
+) -> tuple[Optional["pyarrow.Schema"], Iterable["pyarrow.RecordBatch"], Optional[int]]:
+    """
+    Returns:
+        A tuple of the schema, record batches, and the number of non-empty record batches
+        of the data. The schema is |None| if the data is an empty iterator of record batches.
+        The number of batches is |None| if the data is an iterator.
+    """
+
+    import pyarrow as pa
+
+    batches: Iterable[pa.RecordBatch]
+
+    if isinstance(data, pa.Table):
+        batches = data.to_batches()
+        schema = data.schema
+    elif isinstance(data, pa.RecordBatch):
+        batches = [data]
+        schema = data.schema
+    elif isinstance(data, pa.RecordBatchReader):
+        return data.schema, data, None
+    else:
+        batch_iter = iter(data)
+        first_batch = next(batch_iter, None)
+        if first_batch is None:
+            return None, [], 0
+
+        if isinstance(data, Sequence):
+            batches = data
+        else:
+            return first_batch.schema, chain([first_batch], batch_iter), None
+
+        schema = first_batch.schema
+
+    return schema, batches, sum(1 for batch in batches if batch.num_rows > 0)
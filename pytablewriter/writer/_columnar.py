@@ -0,0 +1,343 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Final, Optional, Union, overload
+
+from dataproperty import DataProperty
+from typepy import Typecode
+
+
+# types of data that are shared between cells of the same value.
+# mapped to True if the string representations differ between equal values:
+# e.g. 0.0 and -0.0, Decimal("1.0") and Decimal("1.00").
+# data of other types (e.g. list/dict) are mutable or may be rendered differently.
+_INTERN_DATA_TYPES: Final[Mapping[type, bool]] = {
+    type(None): False,
+    bool: False,
+    int: False,
+    str: False,
+    float: True,
+    Decimal: True,
+    datetime: True,
+}
+
+
+# stop sharing data properties in a column when most of the values in the column are distinct:
+# e.g. IDs. holding the index of distinct values costs more than it saves.
+_MIN_INTERN_SAMPLES: Final = 1024
+_MAX_INTERN_UNIQUE_RATIO: Final = 0.5
+
+
+def _to_intern_key(value_dp: DataProperty) -> Optional[tuple[type, Any]]:
+    data = value_dp.data
+    data_type = type(data)
+
+    try:
+        is_str_key = _INTERN_DATA_TYPES[data_type]
+    except KeyError:
+        return None
+
+    if is_str_key:
+        return (data_type, str(data))
+
+    return (data_type, data)
+
+
+class _Column:
+    __slots__ = ("__code_maps", "codes", "representatives", "values")
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values: list[DataProperty] = []
+
+        # data properties that determine the properties of the column.
+        # None if all of the values are required.
+        self.representatives: Optional[list[DataProperty]] = None
+
+        # typecode -> (value -> code). None if the column does not share data properties
+        self.__code_maps: Optional[dict[Typecode, dict[Any, int]]] = {}
+
+    def append(self, value_dp: DataProperty) -> None:
+        code_map = None
+
+        if self.representatives is not None:
+            self.representatives.append(value_dp)
+
+        if self.__code_maps is not None:
+            code_map = self.__code_maps.setdefault(value_dp.typecode, {})
+            key = _to_intern_key(value_dp)
+
+            if key is None:
+                code = None
+                code_map = None
+            else:
+                code = code_map.get(key)
+
+            if code is not None:
+                self.codes.append(code)
+                return
+
+        code = len(self.values)
+        self.values.append(value_dp)
+        self.codes.append(code)
+
+        if code_map is not None:
+            code_map[key] = code
+
+    def extend_unshared(
+        self, value_dp_list: Sequence[DataProperty], representatives: Sequence[DataProperty]
+    ) -> None:
+        self.__code_maps = None
+
+        if self.representatives is None:
+            self.representatives = list(self.values)
+        self.representatives.extend(representatives)
+
+        self.codes.extend(range(len(self.values), len(self.values) + len(value_dp_list)))
+        self.values.extend(value_dp_list)
+
+    @property
+    def is_sharing(self) -> bool:
+        return self.__code_maps is not None
+
+    def update_interning(self) -> None:
+        if self.__code_maps is None or len(self.codes) < _MIN_INTERN_SAMPLES:
+            return
+
+        if len(self.values) > len(self.codes) * _MAX_INTERN_UNIQUE_RATIO:
+            self.__code_maps = None
+
+
+class ColumnarValueStore:
+    """
+    A columnar store of |DataProperty| of value cells.
+
+    Each column holds an array of integer codes (one per row) and the distinct
+    |DataProperty| instances of the column: cells of which data properties have
+    the same type, data type, and scalar data share a |DataProperty| instance
+    instead of holding one instance per cell.
+    The data properties are not modified after the creation.
+
+    The store reduces the memory usage only for columns that have repeated values.
+    Columns that consist of mostly distinct values (e.g. IDs or measurements) hold
+    one instance per cell, and use about as much memory as a matrix of |DataProperty|.
+    """
+
+    def __init__(self) -> None:
+        self.__columns: list[_Column] = []
+        self.__num_rows = 0
+
+    @property
+    def num_rows(self) -> int:
+        return self.__num_rows
+
+    @property
+    def num_columns(self) -> int:
+        return len(self.__columns)
+
+    @property
+    def num_cells(self) -> int:
+        return self.__num_rows * len(self.__columns)
+
+    @property
+    def num_unique_cells(self) -> int:
+        return sum(len(column.values) for column in self.__columns)
+
+    def is_sharing_column(self, col_idx: int) -> bool:
+        """
+        Return |True| if cells of the same value in the column share a |DataProperty| instance.
+        """
+
+        try:
+            return self.__columns[col_idx].is_sharing
+        except IndexError:
+            return False
+
+    def extend(self, value_dp_matrix: Iterable[Sequence[DataProperty]]) -> None:
+        """
+        Append rows of |DataProperty| to the store.
+
+        Raises:
+            ValueError: If the number of columns of a row differs from the store.
+        """
+
+        for value_dp_list in value_dp_matrix:
+            if not self.__columns and self.__num_rows == 0:
+                self.__columns = [_Column() for _ in range(len(value_dp_list))]
+
+            if len(value_dp_list) != len(self.__columns):
+                raise ValueError(
+                    "nonuniform column size found: expected={}, actual={}".format(
+                        len(self.__columns), len(value_dp_list)
+                    )
+                )
+
+            for column, value_dp in zip(self.__columns, value_dp_list):
+                column.append(value_dp)
+
+            self.__num_rows += 1
+
+        for column in self.__columns:
+            column.update_interning()
+
+    def extend_columns(
+        self,
+        column_value_dp_lists: Sequence[Sequence[DataProperty]],
+        representatives: Optional[Mapping[int, Sequence[DataProperty]]] = None,
+    ) -> None:
+        """
+        Append rows of |DataProperty| to the store column by column.
+
+        Args:
+            column_value_dp_lists:
+                Data properties of the appended rows for each column.
+            representatives:
+                Mapping of column indices to the data properties that determine the properties
+                of the columns (types, widths, digits, etc.) among the appended rows.
+                Cells of the columns are stored as they are without sharing.
+
+        Raises:
+            ValueError: If the number of columns or rows differs.
+        """
+
+        if not self.__columns and self.__num_rows == 0:
+            self.__columns = [_Column() for _ in range(len(column_value_dp_lists))]
+
+        if len(column_value_dp_lists) != len(self.__columns):
+            raise ValueError(
+                "nonuniform column size found: expected={}, actual={}".format(
+                    len(self.__columns), len(column_value_dp_lists)
+                )
+            )
+
+        num_rows = {len(value_dp_list) for value_dp_list in column_value_dp_lists}
+        if len(num_rows) > 1:
+            raise ValueError(f"nonuniform row size found: {sorted(num_rows)}")
+
+        if representatives is None:
+            representatives = {}
+
+        for col_idx, (column, value_dp_list) in enumerate(
+            zip(self.__columns, column_value_dp_lists)
+        ):
+            if col_idx in representatives:
+                column.extend_unshared(value_dp_list, representatives[col_idx])
+                continue
+
+            for value_dp in value_dp_list:
+                column.append(value_dp)
+
+            column.update_interning()
+
+        if num_rows:
+            self.__num_rows += num_rows.pop()
+
+    def get_row(self, row_idx: int) -> tuple[DataProperty, ...]:
+        if row_idx < 0:
+            row_idx += self.__num_rows
+        if not 0 <= row_idx < self.__num_rows:
+            raise IndexError(f"row index out of range: {row_idx}")
+
+        return tuple(column.values[column.codes[row_idx]] for column in self.__columns)
+
+    def iter_rows(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[tuple[DataProperty, ...]]:
+        if stop is None or stop > self.__num_rows:
+            stop = self.__num_rows
+
+        if not self.__columns:
+            for _ in range(start, stop):
+                yield ()
+            return
+
+        column_values = [column.values for column in self.__columns]
+        column_codes = [column.codes[start:stop] for column in self.__columns]
+
+        for codes in zip(*column_codes):
+            yield tuple(values[code] for values, code in zip(column_values, codes))
+
+    def to_unique_dp_matrix(self) -> list[tuple[DataProperty, ...]]:
+        """
+        Return a matrix that consists of the distinct data properties of each column.
+        Shorter columns are filled by repeating the last value of the column.
+
+        Properties of columns (types, widths, digits, etc.) are calculated from
+        the maximum/union of properties of cells:
+        calculating them from the matrix produces the same results as from the all rows.
+        Columns that have representatives consist of the representatives instead of
+        the distinct data properties.
+        """
+
+        if self.__num_rows == 0:
+            return []
+
+        column_values = [column.representatives or column.values for column in self.__columns]
+        num_unique_rows = max(len(values) for values in column_values)
+
+        return [
+            tuple(values[min(row_idx, len(values) - 1)] for values in column_values)
+            for row_idx in range(num_unique_rows)
+        ]
+
+
+class DataPropertyMatrixView(Sequence):
+    """
+    A read-only row-oriented view of a :py:class:`ColumnarValueStore`.
+    Rows are materialized when accessed.
+    """
+
+    def __init__(self, store: ColumnarValueStore) -> None:
+        self.__store = store
+
+    @property
+    def store(self) -> ColumnarValueStore:
+        return self.__store
+
+    @property
+    def num_cells(self) -> int:
+        return self.__store.num_cells
+
+    def __len__(self) -> int:
+        return self.__store.num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[DataProperty, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[DataProperty, ...]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[tuple[DataProperty, ...], list[tuple[DataProperty, ...]]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return list(self.__store.iter_rows(start, stop))
+
+            return [self.__store.get_row(row_idx) for row_idx in range(start, stop, step)]
+
+        return self.__store.get_row(index)
+
+    def __iter__(self) -> Iterator[tuple[DataProperty, ...]]:
+        return self.__store.iter_rows()
+
+    def __repr__(self) -> str:
+        return "{}(rows={}, columns={})".format(
+            self.__class__.__name__, self.__store.num_rows, self.__store.num_columns
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            tuple(lhs) == tuple(rhs) for lhs, rhs in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
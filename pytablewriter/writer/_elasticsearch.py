@@ -2,15 +2,17 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-import copy
+import asyncio
+from collections import deque
 from collections.abc import Generator
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Final, Optional, Union
 
 import dataproperty
 from dataproperty import ColumnDataProperty
 from typepy import Typecode
 
-from ..error import EmptyValueError
+from ..error import EmptyTableDataError, EmptyValueError
 from ._msgfy import to_error_message
 from ._table_writer import AbstractTableWriter
 
@@ -18,6 +20,32 @@ from ._table_writer import AbstractTableWriter
 DataType = dict[str, str]
 Properties = dict[str, DataType]
 
+# error types of the index creation when the index already exists:
+# "index_already_exists_exception" is of Elasticsearch versions before 6
+_INDEX_EXISTS_ERRORS: Final = (
+    "resource_already_exists_exception",
+    "index_already_exists_exception",
+)
+
+
+@dataclass(frozen=True)
+class FailedDocument:
+    """
+    A data class representing a document that failed to be indexed by a bulk request.
+    """
+
+    row: int
+    """row index of the document in the written tabular data."""
+
+    document: dict[str, Any]
+    """the document that failed to be indexed."""
+
+    status: Optional[int]
+    """HTTP status code of the failed operation."""
+
+    error: Any
+    """error information of the failed operation returned from Elasticsearch."""
+
 
 def _get_es_datatype(column_dp: ColumnDataProperty) -> DataType:
     if column_dp.typecode in (
@@ -80,9 +108,41 @@ class ElasticsearchWriter(AbstractTableWriter):
 
         Specify document type for indices.
 
+    .. py:attribute:: bulk_chunk_size
+        :type: int
+        :value: 500
+
+        The maximum number of documents in a bulk request.
+
+    .. py:attribute:: bulk_max_chunk_bytes
+        :type: int
+        :value: 104857600
+
+        The maximum size of a bulk request in bytes.
+
+    .. py:attribute:: bulk_thread_count
+        :type: int
+        :value: 1
+
+        The number of threads to send bulk requests in parallel.
+        Bulk requests are sent sequentially if the value is ``1``.
+
+    .. py:attribute:: refresh
+        :type: Union[bool, str, None]
+        :value: None
+
+        Refresh policy of bulk requests: |True|, |False|, or ``"wait_for"``.
+        Use the default of the Elasticsearch server if the value is |None|.
+
+    .. py:attribute:: failed_documents
+        :type: List[FailedDocument]
+
+        Documents that failed to be indexed by the last write.
+        Each item has the row index, the document, the status code, and the error information.
+
     .. py:method:: write_table()
 
-        Create an index and put documents for each row to Elasticsearch.
+        Create an index and put documents for each row to Elasticsearch with bulk requests.
 
         You need to pass an
         `elasticsearch.Elasticsearch <https://elasticsearch-py.rtfd.io/en/master/api.html#elasticsearch>`__
@@ -141,11 +201,23 @@ class ElasticsearchWriter(AbstractTableWriter):
         self.is_padding = False
         self.is_formatting_float = False
         self._is_require_table_name = True
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
-        self._dp_extractor.type_value_map = copy.deepcopy(dataproperty.DefaultValue.TYPE_VALUE_MAP)
 
         self.document_type = "table"
 
+        self.bulk_chunk_size: int = kwargs.get("bulk_chunk_size", 500)
+        self.bulk_max_chunk_bytes: int = kwargs.get("bulk_max_chunk_bytes", 100 * 1024 * 1024)
+        self.bulk_thread_count: int = kwargs.get("bulk_thread_count", 1)
+        self.refresh: Union[bool, str, None] = kwargs.get("refresh")
+        self.failed_documents: list[FailedDocument] = []
+        self.__num_written_rows = 0
+
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
+        extractor.type_value_map = dict(dataproperty.DefaultValue.TYPE_VALUE_MAP)
+
     def write_null_line(self) -> None:
         pass
 
@@ -168,6 +240,65 @@ class ElasticsearchWriter(AbstractTableWriter):
 
             yield dict(zip(self.headers, values))
 
+    async def write_table_async(self, is_preprocess_in_executor: bool = False) -> None:
+        """
+        Write a table to Elasticsearch with an ``elasticsearch.AsyncElasticsearch``
+        instance of the |stream| attribute.
+        Documents are sent by ``elasticsearch.helpers.async_streaming_bulk``
+        with :py:attr:`.bulk_chunk_size`, :py:attr:`.bulk_max_chunk_bytes`,
+        and :py:attr:`.refresh`: :py:attr:`.bulk_thread_count` is not used.
+
+        Args:
+            is_preprocess_in_executor:
+                Preprocess the table (type detection of the values) in the default executor
+                of the event loop instead of in the event loop.
+                Defaults to |False|.
+
+        Raises:
+            ValueError: If the |stream| is not an ``elasticsearch.AsyncElasticsearch`` instance.
+        """
+
+        import elasticsearch as es
+        from elasticsearch.helpers import async_streaming_bulk
+
+        if not isinstance(self.stream, es.AsyncElasticsearch):
+            raise ValueError("stream must be an elasticsearch.AsyncElasticsearch instance")
+
+        with self._logger:
+            try:
+                self._verify_property()
+                self._verify_value_matrix()
+            except (EmptyTableDataError, EmptyValueError):
+                self._logger.logger.debug("no tabular data found")
+                return
+
+            if is_preprocess_in_executor:
+                await asyncio.get_running_loop().run_in_executor(None, self._preprocess)
+            else:
+                self._preprocess()
+
+            try:
+                result = await self.stream.indices.create(
+                    index=self.index_name, body=self._get_mappings()
+                )
+                self._logger.logger.debug(result)
+            except es.ApiError as e:
+                if e.error not in _INDEX_EXISTS_ERRORS:
+                    raise
+
+                # ignore already existing index
+                self._logger.logger.debug(to_error_message(e))
+
+            self.failed_documents = []
+            pending_bodies: deque[dict[str, Any]] = deque()
+            row = 0
+
+            async for is_succeeded, item in async_streaming_bulk(
+                self.stream, self.__to_actions(pending_bodies), **self.__get_bulk_kwargs()
+            ):
+                self.__record_result(row, is_succeeded, item, pending_bodies.popleft())
+                row += 1
+
     def _write_table(self, **kwargs: Any) -> None:
         import elasticsearch as es
 
@@ -182,24 +313,79 @@ class ElasticsearchWriter(AbstractTableWriter):
 
         self._preprocess()
 
-        mappings = self._get_mappings()
+        if self._iter_count in (None, 1):
+            # the index is created by the first iteration of write_table_iter
+            try:
+                result = self.stream.indices.create(
+                    index=self.index_name, body=self._get_mappings()
+                )
+                self._logger.logger.debug(result)
+            except es.ApiError as e:
+                if e.error not in _INDEX_EXISTS_ERRORS:
+                    raise
 
-        try:
-            result = self.stream.indices.create(index=self.index_name, body=mappings)
-            self._logger.logger.debug(result)
-        except es.TransportError as e:
-            for error in e.errors:
-                if error == "index_already_exists_exception":
-                    # ignore already existing index
-                    self._logger.logger.debug(to_error_message(e))
-            else:
-                raise
+                # ignore already existing index
+                self._logger.logger.debug(to_error_message(e))
+
+            self.failed_documents = []
+            self.__num_written_rows = 0
+
+        # bodies of documents that are sent but the results are not yet received:
+        # bulk helpers yield results in the same order as the actions
+        pending_bodies: deque[dict[str, Any]] = deque()
 
+        # rows of the previous iterations of write_table_iter precede the rows
+        for row, (is_succeeded, item) in enumerate(
+            self.__bulk(self.__to_actions(pending_bodies)), start=self.__num_written_rows
+        ):
+            self.__record_result(row, is_succeeded, item, pending_bodies.popleft())
+
+        self.__num_written_rows += len(self._table_value_dp_matrix)
+
+    def __to_actions(self, pending_bodies: deque[dict[str, Any]]) -> Generator:
         for body in self._get_body():
-            try:
-                self.stream.index(index=self.index_name, body=body)
-            except es.exceptions.RequestError as e:
-                self._logger.logger.error(f"{to_error_message(e)}, body={body}")
+            pending_bodies.append(body)
+            yield {"_index": self.index_name, "_source": body}
+
+    def __record_result(
+        self, row: int, is_succeeded: bool, item: dict[str, Any], body: dict[str, Any]
+    ) -> None:
+        if is_succeeded:
+            return
+
+        # the item of a failed operation: {"index": {"status": ..., "error": ..., ...}}
+        op_result = next(iter(item.values()), {})
+        failed_document = FailedDocument(
+            row=row, document=body, status=op_result.get("status"), error=op_result.get("error")
+        )
+        self.failed_documents.append(failed_document)
+        self._logger.logger.error(
+            f"failed to index a document: row={row}, status={failed_document.status}, "
+            f"error={failed_document.error}, body={body}"
+        )
+
+    def __get_bulk_kwargs(self) -> dict[str, Any]:
+        bulk_kwargs: dict[str, Any] = {
+            "chunk_size": self.bulk_chunk_size,
+            "max_chunk_bytes": self.bulk_max_chunk_bytes,
+            "raise_on_error": False,
+        }
+        if self.refresh is not None:
+            bulk_kwargs["refresh"] = self.refresh
+
+        return bulk_kwargs
+
+    def __bulk(self, actions: Generator) -> Generator:
+        from elasticsearch import helpers
+
+        bulk_kwargs = self.__get_bulk_kwargs()
+
+        if self.bulk_thread_count > 1:
+            yield from helpers.parallel_bulk(
+                self.stream, actions, thread_count=self.bulk_thread_count, **bulk_kwargs
+            )
+        else:
+            yield from helpers.streaming_bulk(self.stream, actions, **bulk_kwargs)
 
     def _write_value_row_separator(self) -> None:
         pass
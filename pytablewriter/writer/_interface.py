@@ -57,6 +57,21 @@ class TableWriterInterface(metaclass=abc.ABCMeta):
         A callback function is called when each iteration of writing a table is completed.
         You can set a callback function via the |write_callback| attribute.
 
+        Args:
+            warmup_rows (Optional[int]):
+                If specified, |value_matrix| is treated as an iterator of rows
+                instead of an iterator of matrices.
+                Column properties (types and widths) are inferred from the first
+                ``warmup_rows`` rows and then frozen. The remaining rows are written per
+                ``warmup_rows`` rows, so the memory usage does not depend on the number of rows.
+                Types of the remaining cells are still detected for each cell:
+                if cells of a chunk do not fit the types or the decimal places of
+                the frozen columns (e.g. a real number in an integer column),
+                the column properties are recalculated with the rows of the chunk
+                instead of converting the cells to the frozen types.
+                Cells that are wider than the frozen columns are written as they are.
+                |iteration_length| is not required in this mode.
+
         Raises:
             pytablewriter.NotSupportedError: If the writer class does not support this method.
 
@@ -2,9 +2,11 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from typing import IO, Any, Union
+import copy
+from typing import IO, Any, Optional, Union
 
 from ._interface import TableWriterInterface
+from ._write_stats import WriteStats
 from .text._interface import IndentationInterface, TextWriterInterface
 
 
@@ -18,6 +20,9 @@ class NullTableWriter(IndentationInterface, TextWriterInterface, TableWriterInte
         self.headers = kwargs.get("headers", [])
         self.type_hints = kwargs.get("type_hints", [])
         self.max_workers = kwargs.get("max_workers", 1)
+        self.enable_write_stats = kwargs.get("enable_write_stats", False)
+        self.write_stats_callback = kwargs.get("write_stats_callback")
+        self.last_write_stats: Optional[WriteStats] = None
 
     def __repr__(self) -> str:
         return self.dumps()
@@ -59,3 +64,9 @@ class NullTableWriter(IndentationInterface, TextWriterInterface, TableWriterInte
 
     def _write_value_row_separator(self) -> None:
         pass
+
+    def _create_detached_copy(self) -> "NullTableWriter":
+        return copy.copy(self)
+
+    def _clear_preprocess(self) -> None:
+        pass
@@ -0,0 +1,295 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Conversion of NumPy integer/float arrays (e.g. columns of a pandas.DataFrame)
+to data properties without inferring the type of each cell.
+"""
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Final, Optional, cast
+
+from dataproperty import Align, DataProperty, align_getter
+from typepy import Integer, RealNumber, Typecode
+
+from ..typehint import TypeHint
+
+
+if TYPE_CHECKING:
+    import numpy
+
+
+# the same as the default of dataproperty.get_number_of_digit
+_MAX_DECIMAL_PLACES: Final = 99
+
+# real numbers that are converted to data properties in vector:
+# integer digits of larger values are not calculated from the value by dataproperty
+_MAX_ABS_REAL_NUMBER: Final = 1e15
+
+_POW10: Final = [10**exp for exp in range(1, 20)]
+
+
+class NumericDataProperty:
+    """
+    Properties of an integer or a real number that are calculated in advance from
+    the dtype of an array, instead of inferring the type of the value.
+
+    The class is not a subclass of |DataProperty|: it has the read-only attributes of
+    |DataProperty| that are used by :py:class:`dataproperty.ColumnDataProperty` and writers.
+    The values of the attributes are the same as the attributes of a |DataProperty|
+    created by :py:class:`dataproperty.DataPropertyExtractor` with
+    ``Integer``/``RealNumber`` type hints.
+    """
+
+    __slots__ = (
+        "__additional_format_len",
+        "__data",
+        "__decimal_places",
+        "__integer_digits",
+        "__typecode",
+    )
+
+    def __init__(
+        self,
+        data: Any,
+        typecode: Typecode,
+        integer_digits: int,
+        decimal_places: int,
+        additional_format_len: int,
+    ) -> None:
+        self.__data = data
+        self.__typecode = typecode
+        self.__integer_digits = integer_digits
+        self.__decimal_places = decimal_places
+        self.__additional_format_len = additional_format_len
+
+    def __repr__(self) -> str:
+        return "data={}, type={}, int_digits={}, decimal_places={}, extra_len={}".format(
+            self.to_str(),
+            self.typename,
+            self.__integer_digits,
+            self.__decimal_places,
+            self.__additional_format_len,
+        )
+
+    @property
+    def data(self) -> Any:
+        return self.__data
+
+    @property
+    def typecode(self) -> Typecode:
+        return self.__typecode
+
+    @property
+    def typename(self) -> str:
+        return self.__typecode.name
+
+    @property
+    def align(self) -> Align:
+        return align_getter.get_align_from_typecode(self.__typecode)
+
+    @property
+    def decimal_places(self) -> int:
+        return self.__decimal_places
+
+    @property
+    def integer_digits(self) -> int:
+        return self.__integer_digits
+
+    @property
+    def additional_format_len(self) -> int:
+        return self.__additional_format_len
+
+    @property
+    def length(self) -> Optional[int]:
+        return None
+
+    @property
+    def ascii_char_width(self) -> int:
+        width = self.__integer_digits + self.__additional_format_len
+        if self.__decimal_places:
+            # decimal places and a dot
+            width += self.__decimal_places + 1
+
+        return width
+
+    @property
+    def is_include_ansi_escape(self) -> bool:
+        return False
+
+    @property
+    def no_ansi_escape_dp(self) -> Optional[DataProperty]:
+        return None
+
+    @property
+    def format_str(self) -> str:
+        if self.__typecode == Typecode.INTEGER:
+            return "{:d}"
+
+        return "{:" + f".{self.__decimal_places:d}f" + "}"
+
+    def get_padding_len(self, ascii_char_width: int) -> int:
+        # the same as DataProperty.get_padding_len of values that have no length
+        return ascii_char_width
+
+    def to_str(self) -> str:
+        return self.format_str.format(self.__data)
+
+
+def get_numeric_type_hint(array: "numpy.ndarray") -> TypeHint:
+    """
+    Return the type hint of the cells of an array that can be converted by
+    :py:func:`to_numeric_dp_list`. |None| if the dtype of the array is not supported.
+    """
+
+    if array.dtype.kind in "iu":
+        return Integer
+    if array.dtype.kind == "f":
+        return RealNumber
+
+    return None
+
+
+def _count_integer_digits(abs_values: "numpy.ndarray") -> "numpy.ndarray":
+    import numpy as np
+
+    return np.searchsorted(np.array(_POW10, dtype=np.uint64), abs_values, side="right") + 1
+
+
+def _to_abs_uint(values: "numpy.ndarray") -> "numpy.ndarray":
+    import numpy as np
+
+    if values.dtype.kind == "u":
+        return values.astype(np.uint64)
+
+    # avoid overflow of abs(numpy.iinfo(numpy.int64).min)
+    is_negative = values < 0
+    return np.where(is_negative, -(values + 1), values).astype(np.uint64) + is_negative
+
+
+def _get_decimal_places(text: str) -> int:
+    # the same as dataproperty.get_number_of_digit for the str() of a float
+    if "." in text:
+        return min(len(text.split(".")[1]), _MAX_DECIMAL_PLACES)
+
+    if "e-" in text:
+        return min(int(text.split("e-")[1]), _MAX_DECIMAL_PLACES)
+
+    return 0
+
+
+def _select_representative_rows(
+    is_valid: "numpy.ndarray",
+    is_integer: "numpy.ndarray",
+    abs_values: "numpy.ndarray",
+    digits: "numpy.ndarray",
+    decimal_places: "numpy.ndarray",
+    is_negative: "numpy.ndarray",
+) -> list[int]:
+    # properties of columns (types, widths, digits, etc.) are calculated from
+    # the maximum/minimum/union of properties of cells, and formatted widths of numbers
+    # are the largest at the maximum absolute values:
+    # select the rows of the extreme values for each type and sign of cells
+    import numpy as np
+
+    row_indices: set[int] = set()
+
+    for group in (
+        is_valid & is_integer & is_negative,
+        is_valid & is_integer & ~is_negative,
+        is_valid & ~is_integer & is_negative,
+        is_valid & ~is_integer & ~is_negative,
+    ):
+        group_rows = np.flatnonzero(group)
+        if len(group_rows) == 0:
+            continue
+
+        for values in (abs_values, digits, decimal_places):
+            group_values = values[group_rows]
+            row_indices.add(int(group_rows[np.argmax(group_values)]))
+            row_indices.add(int(group_rows[np.argmin(group_values)]))
+
+    return sorted(row_indices)
+
+
+def to_numeric_dp_list(array: "numpy.ndarray") -> tuple[list[Optional[DataProperty]], list[int]]:
+    """
+    Convert an integer/float array to data properties.
+
+    Returns:
+        A tuple of data properties of each cell of the array, and
+        the row indices of the data properties that determine the properties of the column.
+        Cells that are not converted are |None|: NaN, infinity, and too large real numbers.
+        Convert such cells with :py:class:`dataproperty.DataPropertyExtractor`.
+    """
+
+    import numpy as np
+
+    if array.dtype.kind in "iu":
+        abs_values = _to_abs_uint(array)
+        digits = _count_integer_digits(abs_values)
+        is_negative = array < 0
+        dp_list: list[Optional[NumericDataProperty]] = [
+            NumericDataProperty(value, Typecode.INTEGER, num_digits, 0, int(negative))
+            for value, num_digits, negative in zip(
+                array.tolist(), digits.tolist(), is_negative.tolist()
+            )
+        ]
+        is_valid = np.ones(len(array), dtype=bool)
+
+        return cast(list[Optional[DataProperty]], dp_list), _select_representative_rows(
+            is_valid, is_valid, abs_values, digits, np.zeros(len(array)), is_negative
+        )
+
+    values = array.astype(np.float64)
+    with np.errstate(invalid="ignore"):
+        is_valid = np.isfinite(values) & (np.abs(values) < _MAX_ABS_REAL_NUMBER)
+        abs_values = np.abs(np.where(is_valid, values, 0))
+        is_integer = abs_values == np.floor(abs_values)
+    is_negative = values < 0
+    digits = _count_integer_digits(abs_values.astype(np.uint64))
+    decimal_places = np.zeros(len(values), dtype=np.int64)
+
+    dp_list = []
+    for row_idx, (value, num_digits, valid, integer) in enumerate(
+        zip(values.tolist(), digits.tolist(), is_valid.tolist(), is_integer.tolist())
+    ):
+        if not valid:
+            dp_list.append(None)
+        elif integer:
+            # real numbers without fractional parts are converted to integers
+            int_value = int(value)
+            dp_list.append(
+                NumericDataProperty(int_value, Typecode.INTEGER, num_digits, 0, int(int_value < 0))
+            )
+        else:
+            text = str(value)
+            places = _get_decimal_places(text)
+            decimal_places[row_idx] = places
+            dp_list.append(
+                NumericDataProperty(
+                    Decimal(text), Typecode.REAL_NUMBER, num_digits, places, int(value < 0)
+                )
+            )
+
+    # -0.0 is converted to an integer 0
+    is_negative &= ~(is_integer & (abs_values == 0))
+
+    return cast(list[Optional[DataProperty]], dp_list), _select_representative_rows(
+        is_valid, is_integer, abs_values, digits, decimal_places, is_negative
+    )
+
+
+def is_same_dp(lhs: DataProperty, rhs: DataProperty) -> bool:
+    return (
+        lhs.typecode == rhs.typecode
+        and type(lhs.data) is type(rhs.data)
+        and lhs.data == rhs.data
+        and lhs.integer_digits == rhs.integer_digits
+        and lhs.decimal_places == rhs.decimal_places
+        and lhs.additional_format_len == rhs.additional_format_len
+        and lhs.ascii_char_width == rhs.ascii_char_width
+        and lhs.length == rhs.length
+        and lhs.align == rhs.align
+        and lhs.is_include_ansi_escape == rhs.is_include_ansi_escape
+        and lhs.to_str() == rhs.to_str()
+    )
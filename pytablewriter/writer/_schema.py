@@ -0,0 +1,254 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Export/import of the resolved column properties of a table (schema) as JSON documents.
+"""
+
+import enum
+import ipaddress
+import json
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any, Final, NamedTuple, Optional, Union, cast
+
+from dataproperty import ColumnDataProperty, DataProperty, align_getter
+from typepy import Typecode
+
+from ..typehint import (
+    AbstractType,
+    Bool,
+    DateTime,
+    Dictionary,
+    Infinity,
+    Integer,
+    IpAddress,
+    List,
+    Nan,
+    NoneType,
+    NullString,
+    RealNumber,
+    String,
+    TypeHint,
+)
+from ._numeric import NumericDataProperty
+from ._width import calc_ascii_char_width
+
+
+SCHEMA_VERSION: Final = 1
+
+_TYPE_CLASSES: Final = {
+    type_class(None).typecode: type_class
+    for type_class in (
+        Bool,
+        DateTime,
+        Dictionary,
+        Infinity,
+        Integer,
+        IpAddress,
+        List,
+        Nan,
+        NoneType,
+        NullString,
+        RealNumber,
+        String,
+    )
+}
+
+# values to create data properties that have the type of a column
+_SAMPLE_VALUES: Final[Mapping[Typecode, Any]] = {
+    Typecode.BOOL: False,
+    Typecode.DATETIME: datetime(1970, 1, 1),
+    Typecode.DICTIONARY: {},
+    Typecode.INFINITY: float("inf"),
+    Typecode.IP_ADDRESS: ipaddress.ip_address("0.0.0.0"),
+    Typecode.LIST: [],
+    Typecode.NAN: float("nan"),
+    Typecode.NONE: None,
+    Typecode.NULL_STRING: "",
+    Typecode.STRING: "a",
+}
+
+
+@enum.unique
+class SchemaOverflow(enum.Enum):
+    """
+    Policies for values that do not fit a schema loaded by
+    :py:meth:`~pytablewriter.writer.AbstractTableWriter.load_schema`.
+    """
+
+    #: extend the column properties (types, widths, decimal places) to fit the values
+    EXTEND = "extend"
+
+    #: raise a :py:class:`ValueError`
+    ERROR = "error"
+
+    #: write values with the column properties of the schema without checking the values:
+    #: numbers are rounded to the decimal places of the schema,
+    #: and wider values are written as they are (the alignment of the columns is broken)
+    IGNORE = "ignore"
+
+
+class ColumnSchema(NamedTuple):
+    header: str
+    typecode: Typecode
+    width: int
+    decimal_places: Optional[int]
+    integer_digits: Optional[int]
+    additional_format_len: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "header": self.header,
+            "type": self.typecode.name,
+            "align": align_getter.get_align_from_typecode(self.typecode).align_string,
+            "width": self.width,
+            "decimal_places": self.decimal_places,
+            "integer_digits": self.integer_digits,
+            "additional_format_len": self.additional_format_len,
+        }
+
+    @property
+    def type_class(self) -> type[AbstractType]:
+        return _TYPE_CLASSES[self.typecode]
+
+    @property
+    def type_hint(self) -> TypeHint:
+        """
+        A type hint to convert values of the column.
+        Type hints of other than numbers are |None| (detect types from values):
+        type hints convert values that have other types, e.g. |None| to ``"None"`` as a string.
+        """
+
+        if self.typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER):
+            # integer values are converted to integers with the real number type hint,
+            # and real number values are not truncated to integers
+            return RealNumber
+
+        return None
+
+    def to_dp(self, datetime_format_str: str) -> DataProperty:
+        """
+        Create a data property that has the properties of the column:
+        the column properties calculated from the data property are the same as the schema.
+        """
+
+        if self.typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER):
+            return cast(
+                DataProperty,
+                NumericDataProperty(
+                    0,
+                    self.typecode,
+                    self.integer_digits or 1,
+                    self.decimal_places or 0,
+                    self.additional_format_len,
+                ),
+            )
+
+        return DataProperty(
+            _SAMPLE_VALUES[self.typecode],
+            type_hint=self.type_class,
+            datetime_format_str=datetime_format_str,
+        )
+
+
+def is_fit_to_column(
+    column_dp: ColumnDataProperty, value_dp: DataProperty, east_asian_ambiguous_width: int = 1
+) -> bool:
+    """
+    Return |True| if a value is written with the properties of a pinned column as it is:
+    the type, the decimal places, and the width of the value fit the column.
+    """
+
+    if value_dp.typecode in (Typecode.NONE, Typecode.NULL_STRING):
+        return True
+
+    if column_dp.typecode == Typecode.REAL_NUMBER:
+        if value_dp.typecode not in (Typecode.INTEGER, Typecode.REAL_NUMBER):
+            return False
+        if (value_dp.decimal_places or 0) > (column_dp.decimal_places or 0):
+            return False
+    elif value_dp.typecode != column_dp.typecode:
+        return False
+
+    if value_dp.typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER):
+        # widths of numbers depend on the decimal places of the column
+        width = calc_ascii_char_width(column_dp.dp_to_str(value_dp), east_asian_ambiguous_width)
+    else:
+        width = value_dp.ascii_char_width
+
+    return width <= column_dp.ascii_char_width
+
+
+def to_column_schemas(
+    headers: Sequence[str], column_dp_list: Sequence[ColumnDataProperty]
+) -> list[ColumnSchema]:
+    return [
+        ColumnSchema(
+            header=str(header),
+            typecode=col_dp.typecode,
+            width=col_dp.ascii_char_width,
+            decimal_places=col_dp.decimal_places,
+            integer_digits=_to_optional_int(col_dp.minmax_integer_digits.max_value),
+            additional_format_len=int(col_dp.minmax_additional_format_len.max_value or 0),
+        )
+        for header, col_dp in zip(headers, column_dp_list)
+    ]
+
+
+def dumps_column_schemas(column_schemas: Sequence[ColumnSchema]) -> str:
+    return json.dumps(
+        {
+            "version": SCHEMA_VERSION,
+            "columns": [column_schema.to_dict() for column_schema in column_schemas],
+        },
+        indent=4,
+    )
+
+
+def loads_column_schemas(schema: Union[str, Mapping[str, Any]]) -> list[ColumnSchema]:
+    """
+    Raises:
+        TypeError: If the schema is not a JSON object.
+        ValueError: If the schema is invalid.
+    """
+
+    if isinstance(schema, str):
+        try:
+            schema = json.loads(schema)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid schema: {e}") from e
+
+    if not isinstance(schema, Mapping):
+        raise TypeError(f"schema must be a JSON object: actual={type(schema)}")
+
+    version = schema.get("version")
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"unsupported schema version: expected={SCHEMA_VERSION}, actual={version}")
+
+    column_schemas = []
+    for column in schema.get("columns", []):
+        try:
+            column_schemas.append(
+                ColumnSchema(
+                    header=str(column["header"]),
+                    typecode=Typecode[column["type"]],
+                    width=int(column["width"]),
+                    decimal_places=_to_optional_int(column.get("decimal_places")),
+                    integer_digits=_to_optional_int(column.get("integer_digits")),
+                    additional_format_len=int(column.get("additional_format_len") or 0),
+                )
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"invalid column schema: {column}") from e
+
+        if column_schemas[-1].typecode not in _TYPE_CLASSES:
+            raise ValueError(f"unsupported column type: {column['type']}")
+
+    return column_schemas
+
+
+def _to_optional_int(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+
+    return int(value)
@@ -3,11 +3,14 @@
 """
 
 import abc
+import bisect
 import copy
 import math
+import pickle
 import warnings
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, Optional, Union
 
 import typepy
 from dataproperty import (
@@ -29,23 +32,51 @@ from ..style import (
     Cell,
     CheckStyleFilterKeywordArgsFunc,
     ColSeparatorStyleFilterFunc,
+    DecorationLine,
+    FontSize,
+    FontStyle,
+    FontWeight,
     Style,
     StyleFilterFunc,
     StylerInterface,
     ThousandSeparator,
     fetch_theme,
 )
-from ..typehint import Integer, TypeHint
+from ..typehint import Integer, RealNumber, TypeHint
+from ._arrow import RecordBatchMatrices, split_arrow_data, to_type_hint
+from ._columnar import ColumnarValueStore, DataPropertyMatrixView
 from ._common import HEADER_ROW
 from ._interface import TableWriterInterface
 from ._msgfy import to_error_message
+from ._numeric import get_numeric_type_hint, is_same_dp, to_numeric_dp_list
+from ._schema import (
+    ColumnSchema,
+    SchemaOverflow,
+    dumps_column_schemas,
+    is_fit_to_column,
+    loads_column_schemas,
+    to_column_schemas,
+)
+from ._width import get_str_padding_len
+from ._write_stats import (
+    PHASE_HEADER,
+    PHASE_TABLE_DP,
+    PHASE_TABLE_PROPERTY,
+    PHASE_VALUE_MATRIX,
+    WriteStats,
+    WriteStatsCallback,
+    WriteStatsRecorder,
+    measure_phase,
+)
 
 
 if TYPE_CHECKING:
+    import numpy
     import pandas
     import tablib
 
     from .._table_format import TableFormat
+    from ._arrow import ArrowData
 
 _ts_to_flag: dict[ThousandSeparator, int] = {
     ThousandSeparator.NONE: Format.NONE,
@@ -62,8 +93,95 @@ def header_style_filter(cell: Cell, **kwargs: Any) -> Optional[Style]:
     return None
 
 
+header_style_filter.is_row_dependent = False  # type: ignore[attr-defined]
+
 DEFAULT_STYLE_FILTERS: list[StyleFilterFunc] = [header_style_filter]
 
+# the minimum number of rows to preprocess in parallel when max_workers is greater than one:
+# starting worker processes costs more than formatting a small table
+_MIN_PARALLEL_ROWS: Final = 1000
+
+# the number of rows to convert to data properties at once:
+# converted rows are stored in a columnar store that shares data properties of the same values
+_DP_CHUNK_SIZE: Final = 1024
+
+_DEFAULT_QUOTING_FLAGS: Final[Mapping[Typecode, bool]] = {
+    Typecode.BOOL: False,
+    Typecode.DATETIME: True,
+    Typecode.DICTIONARY: False,
+    Typecode.INFINITY: False,
+    Typecode.INTEGER: False,
+    Typecode.IP_ADDRESS: True,
+    Typecode.LIST: False,
+    Typecode.NAN: False,
+    Typecode.NONE: False,
+    Typecode.NULL_STRING: True,
+    Typecode.REAL_NUMBER: False,
+    Typecode.STRING: True,
+}
+
+# configured data property extractors that are shared by the writers of the same class
+# as the defaults: (writer class, max_precision, dequote) -> extractor.
+# the extractors are never modified: each writer takes a copy of it.
+_default_dp_extractors: dict[tuple[type, Optional[int], bool], DataPropertyExtractor] = {}
+
+
+def _is_row_dependent_style_filter(style_filter: StyleFilterFunc) -> bool:
+    return getattr(style_filter, "is_row_dependent", True)
+
+
+class _CompiledColumnStyle(NamedTuple):
+    style: Style
+    align: Optional[Align]  # None: resolve the align for each cell
+    padding: Optional[int]  # None: resolve the padding for each cell
+
+
+def _is_plain_style(style: Style) -> bool:
+    """Return |True| if stylers do not decorate values with the style."""
+
+    return all(
+        [
+            style.fg_color is None,
+            style.bg_color is None,
+            style.decoration_line == DecorationLine.NONE,
+            style.font_size == FontSize.NONE,
+            style.font_style == FontStyle.NORMAL,
+            style.font_weight == FontWeight.NORMAL,
+            style.thousand_separator == ThousandSeparator.NONE,
+        ]
+    )
+
+
+def _to_row_items_helper(
+    pickled_writer: bytes, start_row_idx: int, value_dp_matrix: Sequence[Sequence[DataProperty]]
+) -> list:
+    writer: AbstractTableWriter = pickle.loads(pickled_writer)
+
+    return writer._to_row_items(start_row_idx, value_dp_matrix)
+
+
+def _chunk_rows(rows: Iterable, chunk_size: int) -> Iterator[list]:
+    row_iter = iter(rows)
+
+    while True:
+        chunk = list(islice(row_iter, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _has_column_type_hints(extractor: DataPropertyExtractor, num_columns: int) -> bool:
+    # the extractor infers the type of a cell from the types of the preceding cells in the column
+    # when the column has no type hint: such columns must be converted at once
+    type_hints = extractor.column_type_hints
+
+    return all(
+        (type_hints[col_idx] if col_idx < len(type_hints) else extractor.default_type_hint)
+        is not None
+        for col_idx in range(num_columns)
+    )
+
 
 class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
     """
@@ -99,7 +217,8 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         The number of iterations to write a table.
         This value is used in :py:meth:`.write_table_iter` method.
-        (defaults to ``-1``, which means the number of iterations is indefinite)
+        (defaults to ``-1``, which means the number of iterations is indefinite:
+        the final iteration is found by reading one matrix ahead)
 
     .. py:attribute:: style_filter_kwargs
         :type: Dict[str, Any]
@@ -138,6 +257,13 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         - first argument: current iteration number (start from ``1``)
         - second argument: a total number of iteration
+
+    .. py:attribute:: write_stats_callback
+
+        A function that is called with a |WriteStats| instance
+        when each write of a table completed (each iteration for :py:meth:`.write_table_iter`).
+        The callback is called only if :py:attr:`.enable_write_stats` is |True|.
+        (defaults to |None|)
     """
 
     FORMAT_NAME = "abstract"
@@ -186,8 +312,12 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
     def __init__(self, **kwargs: Any) -> None:
         self._logger = WriterLogger(self)
+        self._write_stats_recorder = WriteStatsRecorder(self)
+        self.enable_write_stats = kwargs.get("enable_write_stats", False)
+        self.write_stats_callback = kwargs.get("write_stats_callback")
 
         self.table_name = kwargs.get("table_name", "")
+        self.__has_trans_func = False
         self.value_matrix = kwargs.get("value_matrix", [])
 
         self.is_write_header = kwargs.get("is_write_header", True)
@@ -198,33 +328,15 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         self._use_default_header = False
 
-        self._dp_extractor = DataPropertyExtractor(max_precision=kwargs.get("max_precision"))
-        self._dp_extractor.min_column_width = 1
-        self._dp_extractor.strip_str_header = '"'
-        self._dp_extractor.preprocessor = Preprocessor(dequote=kwargs.get("dequote", True))
-        self._dp_extractor.set_type_value(Typecode.NONE, "")
-        self._dp_extractor.matrix_formatting = MatrixFormatting.HEADER_ALIGNED
-        self._dp_extractor.update_strict_level_map({Typecode.BOOL: 1})
+        self._dp_extractor = self.__create_dp_extractor(
+            max_precision=kwargs.get("max_precision"), dequote=kwargs.get("dequote", True)
+        )
 
         self.is_formatting_float = kwargs.get("is_formatting_float", True)
         self.is_padding = kwargs.get("is_padding", True)
 
         self.headers = kwargs.get("headers", [])
         self.type_hints = kwargs.get("type_hints", [])
-        self._quoting_flags = {
-            Typecode.BOOL: False,
-            Typecode.DATETIME: True,
-            Typecode.DICTIONARY: False,
-            Typecode.INFINITY: False,
-            Typecode.INTEGER: False,
-            Typecode.IP_ADDRESS: True,
-            Typecode.LIST: False,
-            Typecode.NAN: False,
-            Typecode.NONE: False,
-            Typecode.NULL_STRING: True,
-            Typecode.REAL_NUMBER: False,
-            Typecode.STRING: True,
-        }
 
         self._is_require_table_name = False
         self._is_require_header = False
@@ -235,6 +347,9 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             lambda _iter_count, _iter_length: None,  # defaults to NOP callback
         )
         self._iter_count: Optional[int] = None
+        self.__is_column_dp_frozen = False
+        self.__pinned_column_schemas: Optional[list[ColumnSchema]] = None
+        self.__schema_overflow = SchemaOverflow.EXTEND
 
         self.__default_style: Style
         self.default_style = kwargs.get("default_style", Style())
@@ -242,7 +357,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self.__col_style_list: list[Optional[Style]] = []
         self.column_styles = kwargs.get("column_styles", [])
 
-        self._style_filters: list[StyleFilterFunc] = copy.deepcopy(DEFAULT_STYLE_FILTERS)
+        self._style_filters: list[StyleFilterFunc] = list(DEFAULT_STYLE_FILTERS)
         self._enable_style_filter = True
         self._styler = self._create_styler(self)
         self.style_filter_kwargs: dict[str, Any] = kwargs.get("style_filter_kwargs", {})
@@ -257,6 +372,44 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         self.__clear_preprocess()
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: DataPropertyExtractor) -> None:
+        """
+        Apply the settings of the writer class to a data property extractor.
+        The configured extractor is the default of the writers of the class:
+        each writer holds a copy of the extractor.
+        Settings that depend on arguments of a writer instance should be applied in
+        ``__init__`` instead.
+        Subclasses that override this method should call the method of the superclass first.
+        """
+
+        extractor.min_column_width = 1
+        extractor.strip_str_header = '"'
+        extractor.set_type_value(Typecode.NONE, "")
+        extractor.matrix_formatting = MatrixFormatting.HEADER_ALIGNED
+        extractor.update_strict_level_map({Typecode.BOOL: 1})
+        extractor.quoting_flags = dict(_DEFAULT_QUOTING_FLAGS)
+
+    @classmethod
+    def __create_dp_extractor(
+        cls, max_precision: Optional[int], dequote: bool
+    ) -> DataPropertyExtractor:
+        # configuring an extractor costs much more than copying a configured one:
+        # copy the default of the class.
+        # the copy is not deferred until the first change (copy-on-write): writers change
+        # the extractor in __init__ (headers, type hints, etc.), and changes of extractors
+        # (e.g. quoting flags) are made in place without notifications.
+        key = (cls, max_precision, dequote)
+        default_extractor = _default_dp_extractors.get(key)
+
+        if default_extractor is None:
+            default_extractor = DataPropertyExtractor(max_precision=max_precision)
+            default_extractor.preprocessor = Preprocessor(dequote=dequote)
+            cls._configure_dp_extractor(default_extractor)
+            _default_dp_extractors[key] = default_extractor
+
+        return copy.deepcopy(default_extractor)
+
     def _repr_html_(self) -> str:
         from .text._html import HtmlTableWriter
 
@@ -272,6 +425,39 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         return writer.dumps()
 
+    @property
+    def enable_write_stats(self) -> bool:
+        """
+        If |True|, measure wall time and the number of processed cells of each phase
+        (preprocesses and the write) when writing a table.
+        The measurement is available via :py:attr:`.last_write_stats`
+        and :py:attr:`.write_stats_callback`.
+        Defaults to |False|.
+        """
+
+        return self._write_stats_recorder.is_enabled
+
+    @enable_write_stats.setter
+    def enable_write_stats(self, value: bool) -> None:
+        self._write_stats_recorder.is_enabled = value
+
+    @property
+    def write_stats_callback(self) -> Optional[WriteStatsCallback]:
+        return self._write_stats_recorder.callback
+
+    @write_stats_callback.setter
+    def write_stats_callback(self, value: Optional[WriteStatsCallback]) -> None:
+        self._write_stats_recorder.callback = value
+
+    @property
+    def last_write_stats(self) -> Optional[WriteStats]:
+        """
+        Optional[WriteStats]: Measurement of the last completed write.
+        |None| if no table has been written with :py:attr:`.enable_write_stats`.
+        """
+
+        return self._write_stats_recorder.last_stats
+
     @property
     def value_preprocessor(self) -> Preprocessor:
         return self._dp_extractor.preprocessor
@@ -287,6 +473,44 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self._table_headers: list[str] = []
         self._table_value_matrix: list[Union[list[str], dict]] = []
         self._table_value_dp_matrix: Sequence[Sequence[DataProperty]] = []
+        self.__compiled_col_styles: dict[int, _CompiledColumnStyle] = {}
+        self.__compiled_item_caches: dict[int, dict[int, tuple[DataProperty, str]]] = {}
+        self.__filter_style_cache: dict[tuple[int, bool, Typecode], Optional[Style]] = {}
+        self.__resolved_style_cache: dict[tuple[int, Align, int], tuple[Style, Style]] = {}
+
+        # matrices that are created by the writer: append_rows extends them in place.
+        # other matrices may be shared with callers or other writers
+        self.__owned_matrices: tuple[Sequence, ...] = ()
+
+    def __is_owned_matrix(self, matrix: Sequence) -> bool:
+        return any(matrix is owned_matrix for owned_matrix in self.__owned_matrices)
+
+    def __own_matrix(self, matrix: Sequence) -> None:
+        # matrices that are replaced are released
+        current_matrices = (
+            self.__value_matrix_org,
+            self._table_value_dp_matrix,
+            self._table_value_matrix,
+        )
+        self.__owned_matrices = tuple(
+            owned_matrix
+            for owned_matrix in self.__owned_matrices
+            if any(owned_matrix is current_matrix for current_matrix in current_matrices)
+        ) + (matrix,)
+
+    def __to_owned_list(self, matrix: Sequence) -> list:
+        if isinstance(matrix, list) and self.__is_owned_matrix(matrix):
+            return matrix
+
+        # copy the matrix once: the copy is extended in place by later calls
+        owned_list = list(matrix)
+        self.__own_matrix(owned_list)
+
+        return owned_list
+
+    def __release_owned_matrices(self) -> None:
+        # the matrices are shared with another writer
+        self.__owned_matrices = ()
 
     @property
     def headers(self) -> Sequence[str]:
@@ -497,6 +721,15 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
                 :py:attr:`~.style_filter_kwargs`. In default, the attribute includes:
 
                     - ``writer``: the writer instance that the caller of a ``style_filter function``
+
+                A style filter function can declare that the returned style does not depend
+                on rows by setting ``is_row_dependent`` attribute of the function to |False|.
+                Such a function must return the same style for the cells that have
+                the same column index, the same header/value row kind,
+                and the same data type of values.
+                If all of the style filter functions are declared as row-independent,
+                the writer calls the functions only once for each of the combinations and
+                reuses the results.
         """
 
         self._style_filters.insert(0, style_filter)
@@ -513,7 +746,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         if not self._style_filters:
             return
 
-        self._style_filters = copy.deepcopy(DEFAULT_STYLE_FILTERS)
+        self._style_filters = list(DEFAULT_STYLE_FILTERS)
         self._check_style_filter_kwargs_funcs = []
         self.__clear_preprocess()
 
@@ -804,8 +1037,70 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             self.value_matrix = [
                 [index] + list(row) for index, row in zip(df.index.tolist(), df.values.tolist())
             ]
+            arrays = [df.index.to_numpy()]
         else:
             self.value_matrix = df.values.tolist()
+            arrays = []
+
+        arrays.extend(df.iloc[:, col_idx].to_numpy() for col_idx in range(df.shape[1]))
+
+        # keep numeric columns as arrays to convert them to data properties in vector
+        self.__numeric_columns = {
+            col_idx: array
+            for col_idx, array in enumerate(arrays)
+            if get_numeric_type_hint(array) is not None
+        }
+
+    def from_arrow(self, data: "ArrowData", overwrite_type_hints: bool = True) -> None:
+        """
+        Set tabular attributes to the writer from Apache Arrow data.
+        The following attributes are set by the method:
+
+            - :py:attr:`~.headers`
+            - :py:attr:`~.value_matrix`
+            - :py:attr:`~.type_hints`
+            - :py:attr:`~.iteration_length`
+
+        The :py:attr:`~.value_matrix` is set to an iterable of the record batches of the data.
+        Write the data with :py:meth:`.write_table_iter`:
+        record batches are converted to rows one at a time,
+        and integer/float columns without nulls are read from the Arrow buffers.
+        :py:meth:`.write_table` and ``dumps`` concatenate all of the record batches
+        and write them as a table.
+
+        Args:
+            data(pyarrow.Table, pyarrow.RecordBatch, pyarrow.RecordBatchReader, or iterable):
+                Input Arrow data: an iterable of ``pyarrow.RecordBatch`` is also accepted.
+            overwrite_type_hints(bool):
+                If |True|, Overwrite type hints with types within the Arrow schema.
+
+        Example:
+            .. code-block:: python
+
+                import pyarrow as pa
+                import pytablewriter as ptw
+
+                table = pa.table({"a": [1, 2, 3], "b": [0.1, 0.2, 0.3]})
+                writer = ptw.CsvTableWriter()
+                writer.from_arrow(table)
+                writer.write_table_iter()
+        """
+
+        schema, batches, num_batches = split_arrow_data(data)
+
+        if schema is None:
+            self.headers = []
+            self.value_matrix = []
+            self.iteration_length = 0
+            return
+
+        self.headers = list(schema.names)
+
+        if not self.type_hints or overwrite_type_hints:
+            self.type_hints = [to_type_hint(field.type) for field in schema]
+
+        self.value_matrix = RecordBatchMatrices(batches)  # type: ignore
+        self.iteration_length = -1 if num_batches is None else num_batches
 
     def from_series(self, series: "pandas.Series", add_index_column: bool = True) -> None:
         """
@@ -882,6 +1177,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self._table_value_dp_matrix = writer._table_value_dp_matrix
         self._column_dp_list = writer._column_dp_list
         self._table_value_matrix = writer._table_value_matrix
+        writer.__release_owned_matrices()
 
         self.stream = writer.stream
 
@@ -890,8 +1186,153 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         self._is_complete_header_preprocess = writer._is_complete_header_preprocess
         self._is_complete_value_matrix_preprocess = writer._is_complete_value_matrix_preprocess
 
+    def _get_dp_extraction_key(self) -> Optional[tuple]:
+        """
+        Return a key of the settings that determine the value data properties of the writer:
+        writers that have the same key convert the same tabular data to
+        the same data properties.
+        |None| if the data properties can not be shared with other writers.
+        """
+
+        # trans functions may depend on the writer
+        if self.__has_trans_func or typepy.is_empty_sequence(self.headers):
+            return None
+
+        extractor = self._dp_extractor
+
+        try:
+            return (
+                id(self.__value_matrix_org),
+                tuple(self.headers),
+                tuple(extractor.column_type_hints),
+                extractor.datetime_format_str,
+                extractor.datetime_formatter,
+                extractor.default_format_flags,
+                tuple(extractor.format_flags_list),
+                extractor.default_type_hint,
+                extractor.east_asian_ambiguous_width,
+                extractor.float_type,
+                extractor.is_formatting_float,
+                extractor.matrix_formatting,
+                extractor.max_precision,
+                repr(extractor.preprocessor),
+                frozenset(extractor.quoting_flags.items()),
+                frozenset(extractor.strict_level_map.items()),
+                extractor.strip_str_header,
+                frozenset(extractor.type_value_map.items()),
+            )
+        except TypeError:
+            # unhashable settings
+            return None
+
+    def _share_table_dp(self, writer: "AbstractTableWriter") -> bool:
+        """
+        Reuse the value data properties of another writer that converted
+        the same tabular data with the same settings.
+        Column properties are calculated by the writer itself.
+
+        Returns:
+            bool: |True| if the data properties are reused.
+        """
+
+        if not writer._is_complete_table_dp_preprocess or self.__is_column_dp_frozen:
+            return False
+
+        key = self._get_dp_extraction_key()
+        if key is None or key != writer._get_dp_extraction_key():
+            return False
+
+        self._table_value_dp_matrix = writer._table_value_dp_matrix
+        writer.__release_owned_matrices()
+        self._column_dp_list = self.__to_column_dp_list(None)
+        self._is_complete_table_dp_preprocess = True
+
+        return True
+
+    def dumps_schema(self) -> str:
+        """
+        Get the column properties (types, alignments, widths, decimal places, etc.)
+        of the table as a JSON text.
+        The schema can be loaded to another writer by :py:meth:`.load_schema`.
+
+        Returns:
+            str: Schema of the table.
+
+        Raises:
+            pytablewriter.EmptyTableDataError:
+                If the |headers| and the |value_matrix| is empty.
+        """
+
+        self._verify_header()
+        self._preprocess_table_dp()
+
+        # widths of the column properties may be extended for each format after the preprocess:
+        # calculate the column properties again
+        if self.__pinned_column_schemas is None:
+            column_dp_list = self.__to_column_dp_list(None)
+        else:
+            column_dp_list = self.__to_fitted_column_dp_list(self.__pinned_column_schemas)
+
+        return dumps_column_schemas(to_column_schemas(self.headers, column_dp_list))
+
+    def load_schema(
+        self,
+        schema: Union[str, Mapping[str, Any], None],
+        overflow: Union[str, SchemaOverflow] = SchemaOverflow.EXTEND,
+    ) -> None:
+        """
+        Pin the column properties of the table to a schema that created by
+        :py:meth:`.dumps_schema`.
+        The writer uses column properties of the schema instead of calculating them from values,
+        and converts values of number columns without detecting the types of values
+        (the :py:attr:`.type_hints` are set to the types of the schema).
+        The |headers| are set to the headers of the schema if the |headers| are empty.
+
+        Args:
+            schema:
+                A JSON text or a dictionary of a schema.
+                |None| to unpin the column properties.
+            overflow:
+                A policy for values that do not fit the schema:
+                values of different types, wider values, or values with more decimal places.
+
+                - ``"extend"``: extend the column properties to fit the values
+                - ``"error"``: raise a :py:class:`ValueError` when writing a table
+                - ``"ignore"``: use the column properties of the schema without
+                  checking the values. Numbers are rounded to the decimal places of
+                  the schema (e.g. ``2.5`` is written as ``2`` to an integer column),
+                  and wider values are written as they are,
+                  which breaks the alignment of the columns.
+
+                Defaults to ``"extend"``.
+                ``"extend"`` and ``"error"`` check the type, decimal places, and width of
+                each value against the schema instead of calculating column properties
+                from the values.
+
+        Raises:
+            ValueError: If the schema is invalid.
+        """
+
+        from .._function import normalize_enum
+
+        self.__schema_overflow = normalize_enum(overflow, SchemaOverflow)
+
+        if schema is None:
+            self.__pinned_column_schemas = None
+            self.__clear_preprocess()
+            return
+
+        column_schemas = loads_column_schemas(schema)
+        if typepy.is_empty_sequence(self.headers):
+            self.headers = [column_schema.header for column_schema in column_schemas]
+
+        self.__pinned_column_schemas = column_schemas
+        self.type_hints = [column_schema.type_hint for column_schema in column_schemas]
+        self.__clear_preprocess()
+
     def register_trans_func(self, trans_func: TransFunc) -> None:
         self._dp_extractor.register_trans_func(trans_func)
+        self.__has_trans_func = True
         self.__clear_preprocess()
 
     def update_preprocessor(self, **kwargs: Any) -> None:
@@ -903,6 +1344,100 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         self.__clear_preprocess()
 
+    def append_rows(self, rows: Iterable[Sequence[Any]]) -> bool:
+        """
+        Append rows to the :py:attr:`~.value_matrix`.
+
+        Unlike setting the :py:attr:`~.value_matrix`, preprocessed results of the existing rows
+        are reused if the table is already written (or preprocessed):
+        only the appended rows are converted and formatted
+        as long as the types and widths of columns are not changed by the rows.
+        Otherwise, the existing rows are formatted again at the next write.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): Rows to append.
+
+        Returns:
+            bool:
+            |True| if the appended rows are formatted incrementally.
+            |False| if the whole table will be formatted again at the next write.
+
+        :Example:
+            .. code:: python
+
+                writer = MarkdownTableWriter(headers=["a", "b"], value_matrix=[[1, 2]])
+                writer.dumps()
+                writer.append_rows([[3, 4]])  # -> True
+                writer.dumps()  # formats only the appended row
+        """
+
+        rows = list(rows)
+        if not rows:
+            return True
+
+        value_matrix = self.__to_owned_list(self.__value_matrix_org)
+        value_matrix.extend(rows)
+        if value_matrix is not self.__value_matrix_org:
+            self.__set_value_matrix(value_matrix)
+
+        if not self._is_complete_table_dp_preprocess or self.__is_column_dp_frozen:
+            self.__clear_preprocess()
+            return False
+
+        try:
+            append_dp_matrix = self._dp_extractor.to_dp_matrix(to_value_matrix(self.headers, rows))
+        except TypeError as e:
+            self._logger.logger.debug(to_error_message(e))
+            self.__clear_preprocess()
+            return False
+
+        num_rows = len(self._table_value_dp_matrix)
+        merged_column_dp_list = self._dp_extractor.to_column_dp_list(
+            append_dp_matrix, self._column_dp_list
+        )
+
+        if isinstance(
+            self._table_value_dp_matrix, DataPropertyMatrixView
+        ) and self.__is_owned_matrix(self._table_value_dp_matrix):
+            self._table_value_dp_matrix.store.extend(append_dp_matrix)
+        else:
+            value_dp_matrix = self.__to_owned_list(self._table_value_dp_matrix)
+            value_dp_matrix.extend(append_dp_matrix)
+            self._table_value_dp_matrix = value_dp_matrix
+
+        if not self.__is_column_dp_compatible(merged_column_dp_list):
+            self._logger.logger.debug(
+                f"append_rows: column properties changed: reformat all of the {num_rows} rows"
+            )
+
+            # data properties of the existing rows are still valid: skip extracting them
+            self.__clear_preprocess_status()
+            self._column_dp_list = self.__to_column_dp_list(None)
+            self._is_complete_table_dp_preprocess = True
+
+            return False
+
+        self._logger.logger.debug(f"append_rows: format {len(append_dp_matrix)} rows")
+
+        if self._is_complete_value_matrix_preprocess:
+            table_value_matrix = self.__to_owned_list(self._table_value_matrix)
+            table_value_matrix.extend(self.__format_value_rows(num_rows, append_dp_matrix))
+            self._table_value_matrix = table_value_matrix
+
+        return True
+
+    def __is_column_dp_compatible(self, column_dp_list: Sequence[ColumnDataProperty]) -> bool:
+        if len(column_dp_list) != len(self._column_dp_list):
+            return False
+
+        # widths of the existing columns may be extended by the table property preprocess
+        return all(
+            new_col_dp.typecode == col_dp.typecode
+            and new_col_dp.decimal_places == col_dp.decimal_places
+            and new_col_dp.ascii_char_width <= col_dp.ascii_char_width
+            for new_col_dp, col_dp in zip(column_dp_list, self._column_dp_list)
+        )
+
     def write_table(self, **kwargs: Any) -> None:
         """
         |write_table|.
@@ -921,6 +1456,10 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         if not self.support_split_write:
             raise NotSupportedError("the class not supported the write_table_iter method")
 
+        warmup_rows: Optional[int] = kwargs.pop("warmup_rows", None)
+        if warmup_rows is not None and warmup_rows <= 0:
+            raise ValueError(f"warmup_rows must be greater than zero: actual={warmup_rows}")
+
         self._verify_style_filter_kwargs()
         self._verify_table_name()
         self._verify_stream()
@@ -933,7 +1472,10 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         self._verify_header()
 
-        self._logger.logger.debug(f"_write_table_iter: iteration-length={self.iteration_length:d}")
+        self._logger.logger.debug(
+            f"_write_table_iter: iteration-length={self.iteration_length:d}, "
+            f"warmup-rows={warmup_rows}"
+        )
 
         stash_is_write_header = self.is_write_header
         stach_is_write_opening_row = self.is_write_opening_row
@@ -943,11 +1485,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             self.is_write_closing_row = False
             self._iter_count = 1
 
-            for work_matrix in self.value_matrix:
-                is_final_iter = all(
-                    [self.iteration_length > 0, self._iter_count >= self.iteration_length]
-                )
-
+            for work_matrix, is_final_iter in self.__iter_work_matrix(warmup_rows):
                 if is_final_iter:
                     self.is_write_closing_row = True
 
@@ -965,13 +1503,8 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
                 self.write_callback(self._iter_count, self.iteration_length)
 
-                # update typehint for the next iteration
-                """
-                if self.type_hints is None:
-                    self.__set_type_hints([
-                        column_dp.type_class for column_dp in self._column_dp_list
-                    ])
-                """
+                if warmup_rows is not None and not self.__is_column_dp_frozen:
+                    self.__freeze_column_dp()
 
                 if is_final_iter:
                     break
@@ -982,6 +1515,67 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             self.is_write_opening_row = stach_is_write_opening_row
             self.is_write_closing_row = stash_is_write_closing_row
             self._iter_count = None
+            self.__is_column_dp_frozen = False
+
+    def __iter_work_matrix(self, warmup_rows: Optional[int]) -> Iterator[tuple[Sequence, bool]]:
+        if warmup_rows is None and self.iteration_length > 0:
+            for iter_count, work_matrix in enumerate(self.value_matrix, start=1):
+                yield work_matrix, iter_count >= self.iteration_length
+
+            return
+
+        if warmup_rows is None:
+            # the number of iterations is unknown:
+            # read one matrix ahead to find out the final iteration
+            chunk_iter = iter(self.value_matrix)
+        else:
+            # read one chunk ahead to find out the final iteration of the row iterator
+            chunk_iter = _chunk_rows(self.value_matrix, warmup_rows)
+
+        work_matrix = next(chunk_iter, None)
+        if work_matrix is None:
+            # write the headers of an empty row iterator
+            yield [], True
+            return
+
+        while work_matrix is not None:
+            next_matrix = next(chunk_iter, None)
+            yield work_matrix, next_matrix is None
+            work_matrix = next_matrix
+
+    def __freeze_column_dp(self) -> None:
+        if not self._column_dp_list:
+            return
+
+        self._logger.logger.debug(
+            "freeze column properties: {}".format(
+                [col_dp.typecode.name for col_dp in self._column_dp_list]
+            )
+        )
+
+        self.__is_column_dp_frozen = True
+
+    def __fit_frozen_column_dp(self) -> None:
+        # types of cells are detected for each cell even after the warm-up:
+        # the frozen column properties are kept as long as they fit the cells of the chunk.
+        # cells that are wider than the frozen columns are written as they are.
+        merged_column_dp_list = self.__to_column_dp_list(self._column_dp_list)
+
+        if all(
+            merged_col_dp.typecode == col_dp.typecode
+            and merged_col_dp.decimal_places == col_dp.decimal_places
+            for merged_col_dp, col_dp in zip(merged_column_dp_list, self._column_dp_list)
+        ):
+            # column widths are already determined by the warm-up rows
+            self._is_complete_table_property_preprocess = True
+            return
+
+        # cells that do not fit the types or the decimal places of the frozen columns
+        # are not coerced: the column properties are recalculated with the cells of the chunk
+        self._logger.logger.debug(
+            f"the frozen column properties do not fit the rows of iteration {self._iter_count}"
+        )
+        self._column_dp_list = merged_column_dp_list
 
     def _get_padding_len(
         self, column_dp: ColumnDataProperty, value_dp: Optional[DataProperty] = None
@@ -989,11 +1583,23 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         if not self.is_padding:
             return 0
 
-        try:
-            return cast(DataProperty, value_dp).get_padding_len(column_dp.ascii_char_width)
-        except AttributeError:
+        if value_dp is None:
             return column_dp.ascii_char_width
 
+        if (
+            value_dp.typecode == Typecode.STRING
+            and isinstance(value_dp.data, str)
+            and not value_dp.is_include_ansi_escape
+        ):
+            # widths of strings may be found in the process-wide width cache
+            return get_str_padding_len(
+                value_dp.data,
+                column_dp.ascii_char_width,
+                self._dp_extractor.east_asian_ambiguous_width,
+            )
+
+        return value_dp.get_padding_len(column_dp.ascii_char_width)
+
     def _to_header_item(self, col_dp: ColumnDataProperty, value_dp: DataProperty) -> str:
         style = self._fetch_style(HEADER_ROW, col_dp, value_dp)
         header = self._apply_style_to_header_item(col_dp, value_dp, style)
@@ -1009,6 +1615,10 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
         )
 
     def _to_row_item(self, row_idx: int, col_dp: ColumnDataProperty, value_dp: DataProperty) -> str:
+        compiled_style = self.__compiled_col_styles.get(col_dp.column_index)
+        if compiled_style is not None:
+            return self.__to_row_item_from_compiled_style(row_idx, col_dp, value_dp, compiled_style)
+
         style = self._fetch_style(row_idx, col_dp, value_dp)
         value = self._apply_style_to_row_item(row_idx, col_dp, value_dp, style)
 
@@ -1021,6 +1631,67 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             self._styler.apply(col_dp.dp_to_str(value_dp), style=style), style=style
         )
 
+    def __to_row_item_from_compiled_style(
+        self,
+        row_idx: int,
+        col_dp: ColumnDataProperty,
+        value_dp: DataProperty,
+        compiled_style: _CompiledColumnStyle,
+    ) -> str:
+        # cells of the same value in a column share a data property in the columnar store,
+        # and items formatted with a compiled style do not depend on rows
+        item_cache = self.__compiled_item_caches.get(col_dp.column_index)
+        if item_cache is not None:
+            cached = item_cache.get(id(value_dp))
+            if cached is not None and cached[0] is value_dp:
+                return cached[1]
+
+        style = compiled_style.style
+
+        if compiled_style.align is None:
+            style.align = self.__retrieve_align_from_data(col_dp, value_dp)
+        if compiled_style.padding is None:
+            style.padding = self._get_padding_len(col_dp, value_dp)
+
+        # terminal styles are not required to apply: the style is a plain style
+        row_item = self._apply_style_to_row_item(row_idx, col_dp, value_dp, style)
+
+        if item_cache is not None:
+            item_cache[id(value_dp)] = (value_dp, row_item)
+
+        return row_item
+
+    def __compile_col_styles(self) -> dict[int, _CompiledColumnStyle]:
+        if self._enable_style_filter and any(
+            style_filter is not header_style_filter for style_filter in self._style_filters
+        ):
+            # style filters may return different styles for each cell
+            return {}
+
+        compiled_styles: dict[int, _CompiledColumnStyle] = {}
+
+        for col_dp in self._column_dp_list:
+            col_style = self._get_col_style(col_dp.column_index)
+            if not _is_plain_style(col_style):
+                continue
+
+            style = copy.deepcopy(col_style)
+
+            align: Optional[Align] = style.align
+            if align is None or align == Align.AUTO:
+                align = None if col_dp.typecode == Typecode.STRING else col_dp.align
+            if align is not None:
+                style.align = align
+
+            padding = style.padding
+            if padding is None and not self.is_padding:
+                padding = 0
+                style.padding = padding
+
+            compiled_styles[col_dp.column_index] = _CompiledColumnStyle(style, align, padding)
+
+        return compiled_styles
+
     def _fetch_style_from_filter(
         self, row_idx: int, col_dp: ColumnDataProperty, value_dp: DataProperty, default_style: Style
     ) -> Style:
@@ -1029,7 +1700,34 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         self.style_filter_kwargs.update({"writer": self})
 
-        style: Optional[Style] = None
+        if any(
+            _is_row_dependent_style_filter(style_filter) for style_filter in self._style_filters
+        ):
+            style = self.__apply_style_filters(row_idx, col_dp, value_dp, default_style)
+            if style is not None:
+                # the style is created for the cell by a filter: resolve it in place
+                if style.align is None or (style.align == Align.AUTO and row_idx >= 0):
+                    style.align = self.__retrieve_align_from_data(col_dp, value_dp)
+
+                if style.padding is None:
+                    style.padding = self._get_padding_len(col_dp, value_dp)
+
+                return style
+        else:
+            filter_key = (col_dp.column_index, row_idx < 0, value_dp.typecode)
+            try:
+                style = self.__filter_style_cache[filter_key]
+            except KeyError:
+                style = self.__apply_style_filters(row_idx, col_dp, value_dp, default_style)
+                self.__filter_style_cache[filter_key] = style
+
+        return self.__resolve_style(
+            row_idx, col_dp, value_dp, default_style if style is None else style
+        )
+
+    def __apply_style_filters(
+        self, row_idx: int, col_dp: ColumnDataProperty, value_dp: DataProperty, default_style: Style
+    ) -> Optional[Style]:
         for style_filter in self._style_filters:
             style = style_filter(
                 Cell(
@@ -1041,18 +1739,40 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
                 **self.style_filter_kwargs,
             )
             if style:
-                break
+                return style
 
-        if style is None:
-            style = copy.deepcopy(default_style)
+        return None
 
-        if style.align is None or (style.align == Align.AUTO and row_idx >= 0):
-            style.align = self.__retrieve_align_from_data(col_dp, value_dp)
+    def __resolve_style(
+        self, row_idx: int, col_dp: ColumnDataProperty, value_dp: DataProperty, base_style: Style
+    ) -> Style:
+        """
+        Return a style that resolved the align and the padding of the ``base_style`` for a cell.
+        Resolved styles are shared between cells: the returned style must not be modified.
+        """
 
-        if style.padding is None:
-            style.padding = self._get_padding_len(col_dp, value_dp)
+        align = base_style.align
+        if align is None or (align == Align.AUTO and row_idx >= 0):
+            align = self.__retrieve_align_from_data(col_dp, value_dp)
+
+        padding = base_style.padding
+        if padding is None:
+            padding = self._get_padding_len(col_dp, value_dp)
+
+        resolved_key = (id(base_style), align, padding)
+        try:
+            return self.__resolved_style_cache[resolved_key][1]
+        except KeyError:
+            pass
+
+        resolved_style = copy.deepcopy(base_style)
+        resolved_style.align = align
+        resolved_style.padding = padding
 
-        return style
+        # hold the base style as well to prevent the id of the base style from being reused
+        self.__resolved_style_cache[resolved_key] = (base_style, resolved_style)
+
+        return resolved_style
 
     def _get_col_style(self, col_idx: int) -> Style:
         try:
@@ -1111,6 +1831,11 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
     def __set_value_matrix(self, value_matrix: Sequence) -> None:
         self.__value_matrix_org = value_matrix
 
+        # value matrices may hold numeric columns as arrays: e.g. Arrow record batches
+        self.__numeric_columns: dict[int, "numpy.ndarray"] = dict(
+            getattr(value_matrix, "numeric_columns", {})
+        )
+
     def __set_type_hints(self, type_hints: Sequence[Union[str, TypeHint]]) -> None:
         self._dp_extractor.column_type_hints = type_hints
 
@@ -1150,36 +1875,310 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         return NullStyler(writer)
 
+    @measure_phase(PHASE_TABLE_DP)
     def _preprocess_table_dp(self) -> None:
         if self._is_complete_table_dp_preprocess:
             return
 
         self._logger.logger.debug("_preprocess_table_dp")
 
+        value_matrix = self._get_table_value_matrix()
+
         if typepy.is_empty_sequence(self.headers) and self._use_default_header:
             self.headers = [
-                convert_idx_to_alphabet(col_idx)
-                for col_idx in range(len(self.__value_matrix_org[0]))
+                convert_idx_to_alphabet(col_idx) for col_idx in range(len(value_matrix[0]))
             ]
 
         try:
-            self._table_value_dp_matrix = self._dp_extractor.to_dp_matrix(
-                to_value_matrix(self.headers, self.__value_matrix_org)
-            )
+            self._table_value_dp_matrix = self.__to_value_dp_matrix(value_matrix)
+            self.__own_matrix(self._table_value_dp_matrix)
         except TypeError as e:
             self._logger.logger.debug(to_error_message(e))
             self._table_value_dp_matrix = []
 
-        self._column_dp_list = self._dp_extractor.to_column_dp_list(
-            self._table_value_dp_matrix, self._column_dp_list
-        )
+        if self.__is_column_dp_frozen:
+            self.__fit_frozen_column_dp()
+        elif self.__pinned_column_schemas is not None:
+            self._column_dp_list = self.__to_fitted_column_dp_list(self.__pinned_column_schemas)
+        else:
+            self._column_dp_list = self.__to_column_dp_list(self._column_dp_list)
 
         self._is_complete_table_dp_preprocess = True
 
+    def _get_table_value_matrix(self) -> Sequence:
+        # record batches of from_arrow are written as a table
+        if isinstance(self.__value_matrix_org, RecordBatchMatrices):
+            return self.__value_matrix_org.to_matrix()
+
+        return self.__value_matrix_org
+
+    def __to_value_dp_matrix(self, value_matrix: Sequence) -> Sequence[Sequence[DataProperty]]:
+        store = ColumnarValueStore()
+        numeric_columns = self.__get_numeric_columns(value_matrix)
+
+        if numeric_columns:
+            self.__extend_store_with_numeric_columns(store, value_matrix, numeric_columns)
+        elif (
+            self.headers
+            and self._dp_extractor.max_workers <= 1
+            and _has_column_type_hints(self._dp_extractor, len(self.headers))
+        ):
+            # rows are aligned to the headers: convert rows chunk by chunk to limit the number of
+            # data properties that are alive at the same time
+            for rows in _chunk_rows(value_matrix, _DP_CHUNK_SIZE):
+                store.extend(self._dp_extractor.to_dp_matrix(to_value_matrix(self.headers, rows)))
+        else:
+            store.extend(
+                self._dp_extractor.to_dp_matrix(to_value_matrix(self.headers, value_matrix))
+            )
+
+        self._logger.logger.debug(
+            f"value dp store: cells={store.num_cells}, unique-cells={store.num_unique_cells}"
+        )
+
+        return DataPropertyMatrixView(store)
+
+    def __get_numeric_columns(self, value_matrix: Sequence) -> dict[int, "numpy.ndarray"]:
+        # trans functions may convert each value to any types
+        if self.__has_trans_func or not self.headers:
+            return {}
+
+        type_hints = self._dp_extractor.column_type_hints
+        numeric_columns = getattr(value_matrix, "numeric_columns", None)
+        if numeric_columns is None:
+            numeric_columns = self.__numeric_columns
+
+        return {
+            col_idx: array
+            for col_idx, array in numeric_columns.items()
+            if col_idx < min(len(self.headers), len(type_hints))
+            and len(array) == len(value_matrix)
+            and (
+                type_hints[col_idx] is get_numeric_type_hint(array)
+                # integers are converted to integers with the real number type hint
+                or (type_hints[col_idx] is RealNumber and get_numeric_type_hint(array) is Integer)
+            )
+        }
+
+    def __make_sub_extractor(self, col_indices: Sequence[int]) -> DataPropertyExtractor:
+        # an extractor for a subset of the columns
+        extractor = copy.deepcopy(self._dp_extractor)
+        type_hints = extractor.column_type_hints
+        format_flags_list = extractor.format_flags_list
+
+        extractor.headers = [self.headers[col_idx] for col_idx in col_indices]
+        extractor.column_type_hints = [
+            type_hints[col_idx] if col_idx < len(type_hints) else extractor.default_type_hint
+            for col_idx in col_indices
+        ]
+        extractor.format_flags_list = [
+            format_flags_list[col_idx]
+            if col_idx < len(format_flags_list)
+            else extractor.default_format_flags
+            for col_idx in col_indices
+        ]
+
+        return extractor
+
+    def __to_sub_column_dp_lists(
+        self, extractor: DataPropertyExtractor, col_indices: Sequence[int], rows: Sequence
+    ) -> list[Sequence[DataProperty]]:
+        if not rows:
+            return [[] for _ in col_indices]
+
+        dp_matrix = extractor.to_dp_matrix(
+            [[row[col_idx] for col_idx in col_indices] for row in rows]
+        )
+
+        return list(zip(*dp_matrix))
+
+    def __extend_store_with_numeric_columns(
+        self,
+        store: ColumnarValueStore,
+        value_matrix: Sequence,
+        numeric_columns: dict[int, "numpy.ndarray"],
+    ) -> None:
+        column_dp_lists: dict[int, list] = {}
+        representative_rows: dict[int, list[int]] = {}
+
+        for col_idx, array in numeric_columns.items():
+            dp_list, rep_rows = to_numeric_dp_list(array)
+
+            # cells that are not converted in vector (NaN, infinity, etc.) are converted by
+            # the extractor: the cells of the same value share a data property
+            fallback_rows: dict[str, list[int]] = {}
+            for row_idx, value_dp in enumerate(dp_list):
+                if value_dp is None:
+                    fallback_rows.setdefault(str(array[row_idx]), []).append(row_idx)
+            check_rows = rep_rows + [row_indices[0] for row_indices in fallback_rows.values()]
+
+            # verify the data properties that determine the properties of the column with
+            # the extractor: the extractor settings (e.g. format flags, type value map)
+            # may change the data properties from the defaults
+            value_dp_list = self.__to_sub_column_dp_lists(
+                self.__make_sub_extractor([col_idx]),
+                [col_idx],
+                to_value_matrix(self.headers, [value_matrix[row_idx] for row_idx in check_rows]),
+            )[0]
+            if not all(
+                is_same_dp(dp_list[row_idx], value_dp)
+                for row_idx, value_dp in zip(rep_rows, value_dp_list)
+            ):
+                self._logger.logger.debug(f"fallback to per-cell conversion: column={col_idx}")
+                continue
+
+            for row_indices, value_dp in zip(
+                fallback_rows.values(), value_dp_list[len(rep_rows) :]
+            ):
+                for row_idx in row_indices:
+                    dp_list[row_idx] = value_dp
+
+            column_dp_lists[col_idx] = dp_list
+            representative_rows[col_idx] = sorted(check_rows)
+
+        num_columns = len(self.headers)
+        object_col_indices = [
+            col_idx for col_idx in range(num_columns) if col_idx not in column_dp_lists
+        ]
+        extractor = self.__make_sub_extractor(object_col_indices)
+        if extractor.max_workers <= 1 and _has_column_type_hints(
+            extractor, len(object_col_indices)
+        ):
+            chunk_size = _DP_CHUNK_SIZE
+        else:
+            chunk_size = max(len(value_matrix), 1)
+
+        for start in range(0, len(value_matrix), chunk_size):
+            stop = min(start + chunk_size, len(value_matrix))
+            object_dp_lists = iter(
+                self.__to_sub_column_dp_lists(
+                    extractor,
+                    object_col_indices,
+                    to_value_matrix(self.headers, value_matrix[start:stop]),
+                )
+            )
+
+            chunk_dp_lists: list[Sequence[DataProperty]] = []
+            representatives: dict[int, list[DataProperty]] = {}
+            for col_idx in range(num_columns):
+                if col_idx not in column_dp_lists:
+                    chunk_dp_lists.append(next(object_dp_lists))
+                    continue
+
+                dp_list = column_dp_lists[col_idx]
+                rep_rows = representative_rows[col_idx]
+                chunk_dp_lists.append(dp_list[start:stop])
+                representatives[col_idx] = [
+                    dp_list[row_idx]
+                    for row_idx in rep_rows[
+                        bisect.bisect_left(rep_rows, start) : bisect.bisect_left(rep_rows, stop)
+                    ]
+                ]
+
+            store.extend_columns(chunk_dp_lists, representatives)
+
+        self._logger.logger.debug(f"numeric columns: {sorted(column_dp_lists)}")
+
+    def __to_column_dp_list(
+        self, previous_column_dp_list: Optional[Sequence[ColumnDataProperty]]
+    ) -> list[ColumnDataProperty]:
+        value_dp_matrix = self._table_value_dp_matrix
+        if isinstance(value_dp_matrix, DataPropertyMatrixView):
+            # column properties are the same as calculated from all of the rows
+            value_dp_matrix = value_dp_matrix.store.to_unique_dp_matrix()
+
+        return self._dp_extractor.to_column_dp_list(value_dp_matrix, previous_column_dp_list)
+
+    def __to_pinned_column_dp_list(
+        self, column_schemas: Sequence[ColumnSchema]
+    ) -> list[ColumnDataProperty]:
+        if len(column_schemas) != len(self.headers):
+            raise ValueError(
+                "the number of columns differs from the schema: expected={}, actual={}".format(
+                    len(column_schemas), len(self.headers)
+                )
+            )
+
+        datetime_format_str = self._dp_extractor.datetime_format_str
+        column_dp_list = self._dp_extractor.to_column_dp_list(
+            [[column_schema.to_dp(datetime_format_str) for column_schema in column_schemas]]
+        )
+
+        for column_dp, column_schema in zip(column_dp_list, column_schemas):
+            # the body width is extended until the column width reaches the schema:
+            # column widths are the maximum of the header and the body widths
+            while column_dp.ascii_char_width < column_schema.width:
+                column_dp.extend_body_width(column_schema.width - column_dp.ascii_char_width)
+
+        return column_dp_list
+
+    def __to_fitted_column_dp_list(
+        self, column_schemas: Sequence[ColumnSchema]
+    ) -> list[ColumnDataProperty]:
+        pinned_column_dp_list = self.__to_pinned_column_dp_list(column_schemas)
+        if self.__schema_overflow == SchemaOverflow.IGNORE:
+            return pinned_column_dp_list
+
+        overflow_dp_lists = self.__find_overflow_dp_lists(pinned_column_dp_list)
+        if not overflow_dp_lists:
+            return pinned_column_dp_list
+
+        overflow_columns = sorted(overflow_dp_lists)
+
+        if self.__schema_overflow == SchemaOverflow.ERROR:
+            raise ValueError(
+                "values do not fit the schema: columns={}".format(
+                    [self.headers[col_idx] for col_idx in overflow_columns]
+                )
+            )
+
+        self._logger.logger.debug(f"extend columns to fit the values: {overflow_columns}")
+
+        for col_idx in overflow_columns:
+            pinned_col_dp = pinned_column_dp_list[col_idx]
+            pinned_col_dp.begin_update()
+            for value_dp in overflow_dp_lists[col_idx]:
+                pinned_col_dp.update_body(value_dp)
+            pinned_col_dp.end_update()
+
+        return pinned_column_dp_list
+
+    def __find_overflow_dp_lists(
+        self, pinned_column_dp_list: Sequence[ColumnDataProperty]
+    ) -> dict[int, list[DataProperty]]:
+        """
+        Check each value against the type, decimal places, and width of the pinned column,
+        without calculating column properties from the values.
+
+        Returns:
+            Data properties of the values that do not fit the columns: the key is the column index.
+        """
+
+        value_dp_matrix = self._table_value_dp_matrix
+        if isinstance(value_dp_matrix, DataPropertyMatrixView):
+            # the maximum/minimum values of each column are included in the matrix
+            value_dp_matrix = value_dp_matrix.store.to_unique_dp_matrix()
+
+        east_asian_ambiguous_width = self._dp_extractor.east_asian_ambiguous_width
+        overflow_dp_lists: dict[int, list[DataProperty]] = {}
+
+        for value_dp_list in value_dp_matrix:
+            for col_dp, value_dp in zip(pinned_column_dp_list, value_dp_list):
+                if value_dp.is_include_ansi_escape and value_dp.no_ansi_escape_dp:
+                    value_dp = value_dp.no_ansi_escape_dp
+
+                if is_fit_to_column(col_dp, value_dp, east_asian_ambiguous_width):
+                    continue
+
+                overflow_dp_lists.setdefault(col_dp.column_index, []).append(value_dp)
+
+        return overflow_dp_lists
+
     def _fetch_style(self, row: int, col_dp: ColumnDataProperty, value_dp: DataProperty) -> Style:
         default_style = self._get_col_style(col_dp.column_index)
         return self._fetch_style_from_filter(row, col_dp, value_dp, default_style)
 
+    @measure_phase(PHASE_TABLE_PROPERTY)
     def _preprocess_table_property(self) -> None:
         if self._is_complete_table_property_preprocess:
             return
@@ -1205,6 +2204,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         self._is_complete_table_property_preprocess = True
 
+    @measure_phase(PHASE_HEADER)
     def _preprocess_header(self) -> None:
         if self._is_complete_header_preprocess:
             return
@@ -1220,6 +2220,7 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
 
         self._is_complete_header_preprocess = True
 
+    @measure_phase(PHASE_VALUE_MATRIX)
     def _preprocess_value_matrix(self) -> None:
         if self._is_complete_value_matrix_preprocess:
             return
@@ -1228,15 +2229,159 @@ class AbstractTableWriter(TableWriterInterface, metaclass=abc.ABCMeta):
             f"_preprocess_value_matrix: value-rows={len(self._table_value_dp_matrix)}"
         )
 
-        self._table_value_matrix = [
+        self._table_value_matrix = self.__format_value_rows(0, self._table_value_dp_matrix)
+        self.__own_matrix(self._table_value_matrix)
+
+        self._is_complete_value_matrix_preprocess = True
+
+    def __format_value_rows(
+        self, start_row_idx: int, value_dp_matrix: Sequence[Sequence[DataProperty]]
+    ) -> list:
+        # resolve styles for each column in advance when the styles are the same for all cells
+        # in a column: skip creating cells, calling style filters, and copying styles per cell
+        self.__compiled_col_styles = self.__compile_col_styles()
+        self.__compiled_item_caches = self.__make_compiled_item_caches()
+
+        try:
+            if self.max_workers > 1 and len(value_dp_matrix) >= _MIN_PARALLEL_ROWS:
+                row_items = self.__to_row_items_mt(start_row_idx, value_dp_matrix)
+                if row_items is not None:
+                    return row_items
+
+            return self._to_row_items(start_row_idx, value_dp_matrix)
+        finally:
+            self.__compiled_col_styles = {}
+            self.__compiled_item_caches = {}
+
+    def _iter_value_rows(self) -> Iterator[Sequence[str]]:
+        """
+        Yield formatted value rows.
+        Rows formatted by :py:meth:`._preprocess_value_matrix` are reused if exist,
+        otherwise rows are formatted one at a time and not retained in the writer.
+        """
+
+        if self._is_complete_value_matrix_preprocess:
+            yield from self._table_value_matrix
+            return
+
+        self.__compiled_col_styles = self.__compile_col_styles()
+        self.__compiled_item_caches = self.__make_compiled_item_caches()
+
+        try:
+            for row_idx, value_dp_list in enumerate(self._table_value_dp_matrix):
+                yield self._to_row_items(row_idx, (value_dp_list,))[0]
+        finally:
+            self.__compiled_col_styles = {}
+            self.__compiled_item_caches = {}
+
+    def __make_compiled_item_caches(self) -> dict[int, dict[int, tuple[DataProperty, str]]]:
+        # cache formatted items only for the columns that share data properties between cells
+        if not isinstance(self._table_value_dp_matrix, DataPropertyMatrixView):
+            return {}
+
+        store = self._table_value_dp_matrix.store
+
+        return {
+            col_idx: {}
+            for col_idx in self.__compiled_col_styles
+            if store.is_sharing_column(col_idx)
+        }
+
+    def _to_row_items(
+        self, start_row_idx: int, value_dp_matrix: Sequence[Sequence[DataProperty]]
+    ) -> list:
+        return [
             [
                 self._to_row_item(row_idx, col_dp, value_dp)
                 for col_dp, value_dp in zip(self._column_dp_list, value_dp_list)
             ]
-            for row_idx, value_dp_list in enumerate(self._table_value_dp_matrix)
+            for row_idx, value_dp_list in enumerate(value_dp_matrix, start=start_row_idx)
         ]
 
-        self._is_complete_value_matrix_preprocess = True
+    def __to_row_items_mt(
+        self, start_row_idx: int, value_dp_matrix: Sequence[Sequence[DataProperty]]
+    ) -> Optional[list]:
+        from concurrent import futures
+
+        try:
+            pickled_worker = pickle.dumps(self.__create_preprocess_worker())
+        except (AttributeError, TypeError, pickle.PicklingError) as e:
+            # e.g. style filters defined as lambdas or local functions
+            self._logger.logger.debug(
+                f"fallback to serial preprocessing: failed to pickle the writer: {e}"
+            )
+            return None
+
+        chunk_size = int(math.ceil(len(value_dp_matrix) / self.max_workers))
+
+        with futures.ProcessPoolExecutor(self.max_workers) as executor:
+            future_list = [
+                executor.submit(
+                    _to_row_items_helper,
+                    pickled_worker,
+                    start_row_idx + chunk_start,
+                    value_dp_matrix[chunk_start : chunk_start + chunk_size],
+                )
+                for chunk_start in range(0, len(value_dp_matrix), chunk_size)
+            ]
+
+            table_value_matrix: list = []
+            for future in future_list:
+                table_value_matrix.extend(future.result())
+
+        return table_value_matrix
+
+    def __create_preprocess_worker(self) -> "AbstractTableWriter":
+        # a shallow copy of the writer to send to worker processes:
+        # exclude the output stream, callbacks, and tabular data that workers do not use
+        worker = copy.copy(self)
+        worker._stream = None
+        worker._logger = WriterLogger(worker)
+        worker._write_stats_recorder = WriteStatsRecorder(worker)
+        worker._styler = worker._create_styler(worker)
+        worker.write_callback = None
+        worker.style_filter_kwargs = {
+            key: value for key, value in self.style_filter_kwargs.items() if key != "writer"
+        }
+        worker.__value_matrix_org = []
+        worker._table_value_dp_matrix = []
+        worker._table_value_matrix = []
+        worker.__owned_matrices = ()
+
+        return worker
+
+    def _create_detached_copy(self) -> "AbstractTableWriter":
+        """
+        Create a copy of the writer that has the configuration of the writer
+        (styles, style filters, theme, type hints, quoting flags, and format characters),
+        and that shares no mutable state with the writer.
+        The tabular data, the output stream, and the preprocessed results are not copied.
+        """
+
+        writer = copy.copy(self)
+        writer._stream = None
+        writer._logger = WriterLogger(writer)
+        writer._styler = writer._create_styler(writer)
+
+        recorder = WriteStatsRecorder(writer)
+        recorder.is_enabled = self.enable_write_stats
+        recorder.callback = self.write_stats_callback
+        writer._write_stats_recorder = recorder
+
+        # the extractor holds headers, type hints, and value conversion caches
+        writer._dp_extractor = copy.deepcopy(self._dp_extractor)
+        writer._quoting_flags = dict(self._quoting_flags)
+        writer._style_filters = list(self._style_filters)
+        writer._check_style_filter_kwargs_funcs = list(self._check_style_filter_kwargs_funcs)
+        writer.style_filter_kwargs = {
+            key: value for key, value in self.style_filter_kwargs.items() if key != "writer"
+        }
+        writer.__default_style = copy.deepcopy(self.__default_style)
+        writer.__col_style_list = copy.deepcopy(self.__col_style_list)
+        writer.__value_matrix_org = []
+        writer._clear_preprocess()
+
+        return writer
 
     def _preprocess(self) -> None:
         self._preprocess_table_dp()
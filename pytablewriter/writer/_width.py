@@ -0,0 +1,124 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Process-wide caches of the display widths of strings and aligned strings.
+"""
+
+import functools
+from typing import Final, NamedTuple
+
+from dataproperty import calc_ascii_char_width as _calc_ascii_char_width
+
+
+# the maximum number of distinct (non-ASCII) strings of which widths are cached
+MAX_WIDTH_CACHE_SIZE: Final = 64 * 1024
+
+# the maximum number of distinct (string, format) pairs of which aligned strings are cached
+MAX_ALIGNED_STR_CACHE_SIZE: Final = 64 * 1024
+
+
+class WidthCacheCounts(NamedTuple):
+    hits: int
+    misses: int
+
+
+class _WidthCacheSwitch:
+    def __init__(self) -> None:
+        self.is_enabled = False
+
+
+_width_cache_switch: Final = _WidthCacheSwitch()
+
+
+@functools.lru_cache(maxsize=MAX_WIDTH_CACHE_SIZE)
+def _calc_cached_char_width(unicode_str: str, east_asian_ambiguous_width: int) -> int:
+    return _calc_ascii_char_width(unicode_str, east_asian_ambiguous_width)
+
+
+@functools.lru_cache(maxsize=MAX_ALIGNED_STR_CACHE_SIZE)
+def _align_cached_str(value: str, align_format: str) -> str:
+    return align_format.format(value)
+
+
+def calc_ascii_char_width(unicode_str: str, east_asian_ambiguous_width: int = 1) -> int:
+    """
+    The same as ``dataproperty.calc_ascii_char_width``: widths of non-ASCII strings are
+    memoized in a bounded LRU cache that is shared by all of the writers in a process
+    if the cache is enabled by :py:func:`.set_width_cache`.
+    Widths of ASCII strings are the lengths of the strings (not cached).
+    """
+
+    if unicode_str.isascii():
+        return len(unicode_str)
+
+    if not _width_cache_switch.is_enabled:
+        return _calc_ascii_char_width(unicode_str, east_asian_ambiguous_width)
+
+    return _calc_cached_char_width(unicode_str, east_asian_ambiguous_width)
+
+
+def get_str_padding_len(
+    unicode_str: str, ascii_char_width: int, east_asian_ambiguous_width: int = 1
+) -> int:
+    """
+    The same as ``DataProperty.get_padding_len`` of a string:
+    the padding length to format the string to the width with ``str.format``.
+    """
+
+    return max(
+        ascii_char_width
+        - (calc_ascii_char_width(unicode_str, east_asian_ambiguous_width) - len(unicode_str)),
+        0,
+    )
+
+
+def align_str(value: str, align_format: str) -> str:
+    """
+    Format a string with an align format (e.g. ``"{:<10s}"``).
+    The results are memoized in a bounded LRU cache if the cache is enabled by
+    :py:func:`.set_width_cache`.
+    """
+
+    if not _width_cache_switch.is_enabled:
+        return align_format.format(value)
+
+    return _align_cached_str(value, align_format)
+
+
+def get_width_cache_counts() -> WidthCacheCounts:
+    cache_info = _calc_cached_char_width.cache_info()
+
+    return WidthCacheCounts(hits=cache_info.hits, misses=cache_info.misses)
+
+
+def set_width_cache(is_enable: bool) -> None:
+    """
+    Enable/Disable the process-wide caches of the display widths of strings and
+    aligned (padded) strings that are used by text writers to pad cells.
+    The caches are disabled by default.
+    The caches hold the text of cells until they are cleared by :py:func:`.clear_width_cache`
+    or the caches reach their maximum sizes.
+    Hits and misses of the width cache are reported by
+    :py:class:`~pytablewriter.WriteStats` of writers.
+
+    Widths of columns are calculated by dataproperty, which does not use the caches.
+
+    Args:
+        is_enable:
+            |True| to enable the caches.
+            Disabling the caches also clears the caches.
+    """
+
+    _width_cache_switch.is_enabled = is_enable
+
+    if not is_enable:
+        clear_width_cache()
+
+
+def clear_width_cache() -> None:
+    """
+    Clear the process-wide caches of the display widths of strings and aligned strings.
+    """
+
+    _calc_cached_char_width.cache_clear()
+    _align_cached_str.cache_clear()
@@ -0,0 +1,257 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import functools
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Final, Optional, TypeVar, cast
+
+from ._width import WidthCacheCounts, get_width_cache_counts
+
+
+if TYPE_CHECKING:
+    from ._table_writer import AbstractTableWriter
+
+
+PHASE_TABLE_DP: Final = "table_dp"
+PHASE_TABLE_PROPERTY: Final = "table_property"
+PHASE_HEADER: Final = "header"
+PHASE_VALUE_MATRIX: Final = "value_matrix"
+PHASE_WRITE: Final = "write"
+
+_PREPROCESS_COMPLETE_FLAGS: Final = {
+    PHASE_TABLE_DP: "_is_complete_table_dp_preprocess",
+    PHASE_TABLE_PROPERTY: "_is_complete_table_property_preprocess",
+    PHASE_HEADER: "_is_complete_header_preprocess",
+    PHASE_VALUE_MATRIX: "_is_complete_value_matrix_preprocess",
+}
+
+WriteStatsCallback = Callable[["WriteStats"], None]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """
+    A data class representing the measurement of a phase of writing a table.
+    """
+
+    name: str
+    """phase name: ``table_dp``, ``table_property``, ``header``, ``value_matrix``, or ``write``."""
+
+    elapsed_sec: float
+    """wall time spent in the phase in seconds."""
+
+    num_cells: int
+    """the number of cells (or columns for ``table_property``) processed in the phase."""
+
+
+@dataclass(frozen=True)
+class WriteStats:
+    """
+    A data class representing the measurement of a table writing.
+    Preprocess phases that are skipped because of cached results are not included.
+    """
+
+    format_name: str
+    """format name of the writer."""
+
+    table_name: str
+    """table name of the written table."""
+
+    iteration: Optional[int]
+    """iteration number of :py:meth:`~.AbstractTableWriter.write_table_iter`
+    (|None| for :py:meth:`~.AbstractTableWriter.write_table`)."""
+
+    elapsed_sec: float
+    """total wall time of the write in seconds."""
+
+    phases: Mapping[str, PhaseStats]
+    """measurements of each phase in the executed order."""
+
+    width_cache_hits: int = 0
+    """the number of display widths of non-ASCII strings that are found in
+    the process-wide width cache during the write.
+    Always ``0`` unless the cache is enabled by :py:func:`~pytablewriter.set_width_cache`."""
+
+    width_cache_misses: int = 0
+    """the number of display widths of non-ASCII strings that are calculated
+    (not found in the process-wide width cache) during the write.
+    Always ``0`` unless the cache is enabled by :py:func:`~pytablewriter.set_width_cache`."""
+
+    @property
+    def width_cache_hit_rate(self) -> float:
+        """
+        The ratio of :py:attr:`.width_cache_hits` to the lookups of the width cache.
+        ``0.0`` if the width cache is not used during the write.
+        """
+
+        num_lookups = self.width_cache_hits + self.width_cache_misses
+        if num_lookups == 0:
+            return 0.0
+
+        return self.width_cache_hits / num_lookups
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Return the measurement as a dictionary.
+        """
+
+        return {
+            "format_name": self.format_name,
+            "table_name": self.table_name,
+            "iteration": self.iteration,
+            "elapsed_sec": self.elapsed_sec,
+            "phases": {
+                name: {"elapsed_sec": phase.elapsed_sec, "num_cells": phase.num_cells}
+                for name, phase in self.phases.items()
+            },
+            "width_cache": {
+                "hits": self.width_cache_hits,
+                "misses": self.width_cache_misses,
+                "hit_rate": self.width_cache_hit_rate,
+            },
+        }
+
+
+def _count_cells(matrix: Any) -> int:
+    num_cells = getattr(matrix, "num_cells", None)
+    if num_cells is not None:
+        return num_cells
+
+    return sum(len(row) for row in matrix)
+
+
+def _count_phase_cells(writer: "AbstractTableWriter", phase: str) -> int:
+    if phase == PHASE_TABLE_DP:
+        return _count_cells(writer._table_value_dp_matrix)
+    if phase == PHASE_TABLE_PROPERTY:
+        return len(writer._column_dp_list)
+    if phase == PHASE_HEADER:
+        return len(writer._table_headers)
+    if phase == PHASE_VALUE_MATRIX:
+        return _count_cells(writer._table_value_matrix)
+
+    return _count_cells(writer._table_value_dp_matrix)
+
+
+class WriteStatsRecorder:
+    """
+    Record elapsed time of each phase while a writer writing a table.
+    A write is the outermost ``with writer._logger:`` block.
+    The time of the write phase is the remaining time that is not spent in preprocess phases.
+    Counts of the width cache are the differences of the process-wide counts during a write:
+    the counts include the lookups of other threads that write tables at the same time.
+    """
+
+    def __init__(self, writer: "AbstractTableWriter") -> None:
+        self.__writer = writer
+
+        self.is_enabled = False
+        self.callback: Optional[WriteStatsCallback] = None
+        self.last_stats: Optional[WriteStats] = None
+
+        self.__depth = 0
+        self.__is_recording = False
+        self.__start_time = 0.0
+        self.__start_width_cache_counts = WidthCacheCounts(hits=0, misses=0)
+        self.__phases: dict[str, PhaseStats] = {}
+        self.__active_phases: set[str] = set()
+
+    def begin_write(self) -> None:
+        self.__depth += 1
+        if self.__depth > 1:
+            return
+
+        self.__is_recording = self.is_enabled
+        if not self.__is_recording:
+            return
+
+        self.__phases = {}
+        self.__active_phases = set()
+        self.__start_width_cache_counts = get_width_cache_counts()
+        self.__start_time = time.perf_counter()
+
+    def end_write(self, is_succeeded: bool) -> None:
+        self.__depth -= 1
+        if self.__depth > 0 or not self.__is_recording:
+            return
+
+        self.__is_recording = False
+
+        if not is_succeeded:
+            return
+
+        elapsed_sec = time.perf_counter() - self.__start_time
+        width_cache_counts = get_width_cache_counts()
+        writer = self.__writer
+        phases = dict(self.__phases)
+        phases[PHASE_WRITE] = PhaseStats(
+            name=PHASE_WRITE,
+            elapsed_sec=max(0.0, elapsed_sec - sum(p.elapsed_sec for p in phases.values())),
+            num_cells=_count_phase_cells(writer, PHASE_WRITE),
+        )
+
+        self.last_stats = WriteStats(
+            format_name=writer.format_name,
+            table_name=writer.table_name,
+            iteration=writer._iter_count,
+            elapsed_sec=elapsed_sec,
+            phases=phases,
+            width_cache_hits=width_cache_counts.hits - self.__start_width_cache_counts.hits,
+            width_cache_misses=width_cache_counts.misses - self.__start_width_cache_counts.misses,
+        )
+
+        if self.callback is not None:
+            self.callback(self.last_stats)
+
+    def is_measurable(self, phase: str) -> bool:
+        if not self.__is_recording or phase in self.__active_phases:
+            # not in a write, or called by an overriding method of the phase (super())
+            return False
+
+        # the phase will be skipped when the result is cached
+        return not getattr(self.__writer, _PREPROCESS_COMPLETE_FLAGS[phase])
+
+    def measure(self, phase: str, func: Callable[[], Any]) -> Any:
+        self.__active_phases.add(phase)
+        start_time = time.perf_counter()
+        try:
+            result = func()
+        finally:
+            elapsed_sec = time.perf_counter() - start_time
+            self.__active_phases.discard(phase)
+
+        self.__phases[phase] = PhaseStats(
+            name=phase,
+            elapsed_sec=self.__phases[phase].elapsed_sec + elapsed_sec
+            if phase in self.__phases
+            else elapsed_sec,
+            num_cells=_count_phase_cells(self.__writer, phase),
+        )
+
+        return result
+
+
+def measure_phase(phase: str) -> Callable[[F], F]:
+    """
+    A decorator for the preprocess methods of writers to record the elapsed time of the
+    phase when :py:attr:`~.AbstractTableWriter.enable_write_stats` is |True|.
+    """
+
+    def decorator(method: F) -> F:
+        @functools.wraps(method)
+        def wrapper(writer: "AbstractTableWriter", *args: Any, **kwargs: Any) -> Any:
+            recorder = writer._write_stats_recorder
+
+            if not recorder.is_measurable(phase):
+                return method(writer, *args, **kwargs)
+
+            return recorder.measure(phase, lambda: method(writer, *args, **kwargs))
+
+        return cast(F, wrapper)
+
+    return decorator
@@ -1,6 +1,12 @@
-from ._excel import ExcelXlsTableWriter, ExcelXlsxTableWriter
-from ._pandas import PandasDataFramePickleWriter
-from ._sqlite import SqliteTableWriter
+from typing import TYPE_CHECKING
+
+from ..._lazy_import import make_lazy_attrs
+
+
+if TYPE_CHECKING:
+    from ._excel import ExcelXlsTableWriter, ExcelXlsxTableWriter
+    from ._pandas import PandasDataFramePickleWriter
+    from ._sqlite import SqliteTableWriter
 
 
 __all__ = (
@@ -9,3 +15,15 @@ __all__ = (
     "PandasDataFramePickleWriter",
     "SqliteTableWriter",
 )
+
+# import writers and their dependencies at the first access to reduce the import time
+__getattr__, __dir__ = make_lazy_attrs(
+    __name__,
+    globals(),
+    {
+        "ExcelXlsTableWriter": "._excel",
+        "ExcelXlsxTableWriter": "._excel",
+        "PandasDataFramePickleWriter": "._pandas",
+        "SqliteTableWriter": "._sqlite",
+    },
+)
@@ -1,5 +1,4 @@
 import abc
-import copy
 import warnings
 from typing import IO, TYPE_CHECKING, Any, Final, Optional, Union, cast
 
@@ -10,6 +9,7 @@ from tabledata import TableData
 from typepy import Integer
 
 from .._common import import_error_msg_template
+from .._write_stats import PHASE_TABLE_PROPERTY, measure_phase
 from ._excel_workbook import ExcelWorkbookInterface, ExcelWorkbookXls, ExcelWorkbookXlsx
 from ._interface import AbstractBinaryTableWriter
 
@@ -38,11 +38,6 @@ class ExcelTableWriter(AbstractBinaryTableWriter, metaclass=abc.ABCMeta):
 
         self._workbook: Optional[ExcelWorkbookInterface] = None
 
-        self._dp_extractor.type_value_map = {
-            typepy.Typecode.INFINITY: "Inf",
-            typepy.Typecode.NAN: "NaN",
-        }
-
         self._first_header_row = 0
         self._last_header_row = self.first_header_row
         self._first_data_row = self.last_header_row + 1
@@ -52,8 +47,16 @@ class ExcelTableWriter(AbstractBinaryTableWriter, metaclass=abc.ABCMeta):
 
         self._current_data_row = self._first_data_row
 
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
-        self._quoting_flags[typepy.Typecode.DATETIME] = True
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.type_value_map = {
+            typepy.Typecode.INFINITY: "Inf",
+            typepy.Typecode.NAN: "NaN",
+        }
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
+        extractor.quoting_flags[typepy.Typecode.DATETIME] = True
 
     @property
     def first_header_row(self) -> int:
@@ -321,6 +324,30 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
     """
     A table writer class for Excel file format: ``.xlsx`` (newer or equal to Office 2007).
 
+    .. py:attribute:: constant_memory
+        :type: bool
+        :value: False
+
+        Write workbooks with the constant memory mode of ``xlsxwriter`` if the value is |True|:
+        each row of a worksheet is flushed to a temporary file when the next row is written,
+        instead of holding all of the cells in memory until the workbook is closed.
+        Rows must be written in order in this mode: write a table per worksheet.
+        The value is applied to workbooks opened after the change.
+
+        Combined with ``write_table_iter(warmup_rows=N)``, memory usage does not depend on
+        the number of rows: column widths and number formats are determined by the first
+        ``N`` rows (warm-up rows), and the remaining rows are written per ``N`` rows.
+
+        .. code-block:: python
+
+            writer = ptw.ExcelXlsxTableWriter(constant_memory=True)
+            writer.open("large.xlsx")
+            writer.make_worksheet("rows")
+            writer.headers = ["id", "value"]
+            writer.value_matrix = ([i, i * 0.5] for i in range(1_000_000))
+            writer.write_table_iter(warmup_rows=1000)
+            writer.close()
+
     .. py:method:: write_table()
 
         Write a table to the current opened worksheet.
@@ -395,11 +422,25 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
             self.TableFormat.NAN: self.Default.NAN_FORMAT,
         }
 
+        self.constant_memory: bool = kwargs.get("constant_memory", False)
+
         self.__col_cell_format_cache: dict[int, Any] = {}
         self.__col_numprops_table: dict[int, dict[str, str]] = {}
+        self.__is_keep_formats = False
 
     def _open(self, workbook_path: str) -> None:
-        self._workbook = ExcelWorkbookXlsx(workbook_path)
+        self._workbook = ExcelWorkbookXlsx(workbook_path, constant_memory=self.constant_memory)
+
+    def _write_table_iter(self, **kwargs: Any) -> None:
+        # column properties are frozen after the warm-up rows:
+        # reuse the cell formats of the columns for the rest of the rows
+        self.__is_keep_formats = kwargs.get("warmup_rows") is not None
+
+        try:
+            super()._write_table_iter(**kwargs)
+        finally:
+            self.__is_keep_formats = False
+            self.__clear_format_caches()
 
     def _write_header(self) -> None:
         if not self.is_write_header or typepy.is_empty_sequence(self.headers):
@@ -484,7 +525,12 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
             width = min(col_dp.ascii_char_width, self.MAX_CELL_WIDTH) * (font_size / 10.0) + 2
             self.stream.set_column(col_idx, col_idx, width=width)
 
+    @measure_phase(PHASE_TABLE_PROPERTY)
     def _preprocess_table_property(self) -> None:
+        if self._iter_count is not None and self._is_complete_table_property_preprocess:
+            # column widths are already determined by the warm-up rows
+            return
+
         super()._preprocess_table_property()
 
         self.__set_cell_width()
@@ -497,5 +543,9 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
         )
         self.stream.freeze_panes(self.first_data_row, self.first_data_col)
 
+        if not self.__is_keep_formats:
+            self.__clear_format_caches()
+
+    def __clear_format_caches(self) -> None:
         self.__col_cell_format_cache = {}
         self.__col_numprops_table = {}
@@ -104,9 +104,11 @@ class ExcelWorkbookXls(ExcelWorkbook):
 
 
 class ExcelWorkbookXlsx(ExcelWorkbook):
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, file_path: str, constant_memory: bool = False) -> None:
         super().__init__(file_path)
 
+        self.__constant_memory = constant_memory
+
         self.open(file_path)
 
     def open(self, file_path: str) -> None:
@@ -116,7 +118,8 @@ class ExcelWorkbookXlsx(ExcelWorkbook):
             warnings.warn(import_error_msg_template.format("excel"))
             raise
 
-        self._workbook = xlsxwriter.Workbook(file_path)
+        # rows of worksheets are flushed to temporary files in order in the constant memory mode
+        self._workbook = xlsxwriter.Workbook(file_path, {"constant_memory": self.__constant_memory})
 
     def close(self) -> None:
         if self.workbook is None:
@@ -1,5 +1,6 @@
 from typing import IO, Any, Optional, Union
 
+import dataproperty
 import tabledata
 
 from ...error import EmptyValueError
@@ -26,20 +27,20 @@ class PandasDataFramePickleWriter(AbstractBinaryTableWriter):
         return False
 
     def __init__(self, **kwargs: Any) -> None:
-        import copy
-
-        import dataproperty
-
         super().__init__(**kwargs)
 
         self.is_padding = False
         self.is_formatting_float = False
         self._use_default_header = True
 
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
-
         self.__filepath: Optional[str] = None
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
+
     def is_opened(self) -> bool:
         return self.__filepath is not None
 
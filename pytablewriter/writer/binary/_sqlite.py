@@ -1,6 +1,7 @@
 from os.path import abspath
 from typing import IO, Any, Union
 
+import dataproperty
 import tabledata
 
 from ...error import EmptyValueError
@@ -28,10 +29,6 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
         return self.FORMAT_NAME
 
     def __init__(self, **kwargs: Any) -> None:
-        import copy
-
-        import dataproperty
-
         super().__init__(**kwargs)
 
         self.is_padding = False
@@ -41,7 +38,11 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
         self._is_require_table_name = True
         self._is_require_header = True
 
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
 
     def open(self, file_path: str) -> None:
         """
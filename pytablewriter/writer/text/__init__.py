@@ -1,20 +1,27 @@
-from ._asciidoc import AsciiDocTableWriter
-from ._borderless import BorderlessTableWriter
-from ._css import CssTableWriter
-from ._csv import CsvTableWriter
-from ._html import HtmlTableWriter
-from ._json import JsonTableWriter
-from ._jsonlines import JsonLinesTableWriter
-from ._latex import LatexMatrixWriter, LatexTableWriter
-from ._ltsv import LtsvTableWriter
-from ._markdown import MarkdownFlavor, MarkdownTableWriter, normalize_md_flavor
-from ._mediawiki import MediaWikiTableWriter
-from ._rst import RstCsvTableWriter, RstGridTableWriter, RstSimpleTableWriter
-from ._spacealigned import SpaceAlignedTableWriter
-from ._toml import TomlTableWriter
-from ._tsv import TsvTableWriter
-from ._unicode import BoldUnicodeTableWriter, UnicodeTableWriter
-from ._yaml import YamlTableWriter
+from typing import TYPE_CHECKING
+
+from ..._lazy_import import make_lazy_attrs
+
+
+if TYPE_CHECKING:
+    from ._asciidoc import AsciiDocTableWriter
+    from ._borderless import BorderlessTableWriter
+    from ._css import CssTableWriter
+    from ._csv import CsvTableWriter
+    from ._html import HtmlTableWriter
+    from ._json import JsonTableWriter
+    from ._jsonlines import JsonLinesTableWriter
+    from ._latex import LatexMatrixWriter, LatexTableWriter
+    from ._ltsv import LtsvTableWriter
+    from ._markdown import MarkdownFlavor, MarkdownTableWriter, normalize_md_flavor
+    from ._mediawiki import MediaWikiTableWriter
+    from ._render_plan import RenderPlan
+    from ._rst import RstCsvTableWriter, RstGridTableWriter, RstSimpleTableWriter
+    from ._spacealigned import SpaceAlignedTableWriter
+    from ._toml import TomlTableWriter
+    from ._tsv import TsvTableWriter
+    from ._unicode import BoldUnicodeTableWriter, UnicodeTableWriter
+    from ._yaml import YamlTableWriter
 
 
 __all__ = (
@@ -33,6 +40,7 @@ __all__ = (
     "MarkdownTableWriter",
     "normalize_md_flavor",
     "MediaWikiTableWriter",
+    "RenderPlan",
     "RstCsvTableWriter",
     "RstGridTableWriter",
     "RstSimpleTableWriter",
@@ -42,3 +50,36 @@ __all__ = (
     "UnicodeTableWriter",
     "YamlTableWriter",
 )
+
+# import writers and their dependencies at the first access to reduce the import time
+__getattr__, __dir__ = make_lazy_attrs(
+    __name__,
+    globals(),
+    {
+        "AsciiDocTableWriter": "._asciidoc",
+        "BorderlessTableWriter": "._borderless",
+        "CssTableWriter": "._css",
+        "CsvTableWriter": "._csv",
+        "HtmlTableWriter": "._html",
+        "JsonTableWriter": "._json",
+        "JsonLinesTableWriter": "._jsonlines",
+        "LatexMatrixWriter": "._latex",
+        "LatexTableWriter": "._latex",
+        "LtsvTableWriter": "._ltsv",
+        "MarkdownFlavor": "._markdown",
+        "MarkdownTableWriter": "._markdown",
+        "normalize_md_flavor": "._markdown",
+        "MediaWikiTableWriter": "._mediawiki",
+        "RenderPlan": "._render_plan",
+        "RstCsvTableWriter": "._rst",
+        "RstGridTableWriter": "._rst",
+        "RstSimpleTableWriter": "._rst",
+        "SpaceAlignedTableWriter": "._spacealigned",
+        "TomlTableWriter": "._toml",
+        "TsvTableWriter": "._tsv",
+        "BoldUnicodeTableWriter": "._unicode",
+        "UnicodeTableWriter": "._unicode",
+        "YamlTableWriter": "._yaml",
+        "sourcecode": None,
+    },
+)
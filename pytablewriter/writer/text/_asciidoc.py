@@ -1,4 +1,3 @@
-import copy
 from collections.abc import Sequence
 from typing import Any, Final
 
@@ -80,7 +79,11 @@ class AsciiDocTableWriter(TextTableWriter):
 
         self.update_preprocessor(line_break_handling=LineBreakHandling.NOP)
 
-        self._quoting_flags = copy.deepcopy(dp.NOT_QUOTING_FLAGS)
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dp.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dp.NOT_QUOTING_FLAGS)
 
     def _create_styler(self, writer: AbstractTableWriter) -> StylerInterface:
         return AsciiDocStyler(writer)
@@ -1,4 +1,3 @@
-import copy
 from typing import Any
 
 import dataproperty as dp
@@ -36,6 +35,10 @@ class BorderlessTableWriter(IndentationTextTableWriter):
         self.is_write_opening_row = False
         self.is_write_closing_row = False
 
-        self._quoting_flags = copy.deepcopy(dp.NOT_QUOTING_FLAGS)
-
         self._init_cross_point_maps()
+
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dp.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dp.NOT_QUOTING_FLAGS)
@@ -0,0 +1,201 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Conversion of texts written to a stream into chunks that are consumed
+by an iterator or by an asyncio coroutine.
+"""
+
+import asyncio
+import queue
+import threading
+from collections.abc import Iterator
+from typing import Any, Callable, Final, NamedTuple, Optional, Union
+
+
+# the maximum number of chunks that are written but not consumed yet:
+# the writing thread waits until a consumer takes chunks
+_MAX_QUEUED_CHUNKS: Final = 16
+
+
+class _IterationClosedError(Exception):
+    """
+    Raised in the writing thread when the consumer of chunks stopped the consumption.
+    """
+
+
+class EndOfChunks(NamedTuple):
+    error: Optional[BaseException]
+
+
+ChunkQueueItem = Union[str, EndOfChunks]
+
+
+class ChunkQueueStream:
+    """
+    A text stream that passes the written texts to a queue in chunks:
+    each chunk consists of at least ``chunk_size`` characters except the last one.
+    An :py:class:`EndOfChunks` is passed after the last chunk.
+    """
+
+    def __init__(self, put: Callable[[ChunkQueueItem], None], chunk_size: int) -> None:
+        self.__put = put
+        self.__chunk_size = chunk_size
+        self.__texts: list[str] = []
+        self.__text_len = 0
+
+        self.closed = False
+
+    def write(self, text: str) -> int:
+        if self.closed:
+            raise _IterationClosedError()
+
+        self.__texts.append(text)
+        self.__text_len += len(text)
+
+        if self.__text_len >= self.__chunk_size:
+            self.__put_chunk()
+
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if not self.closed:
+            self.__put_chunk()
+
+        self.__put(EndOfChunks(error))
+
+    def __put_chunk(self) -> None:
+        if not self.__texts:
+            return
+
+        chunk = "".join(self.__texts)
+        self.__texts = []
+        self.__text_len = 0
+
+        self.__put(chunk)
+
+
+def start_writing(
+    write: Callable[[ChunkQueueStream], None],
+    put: Callable[[ChunkQueueItem], None],
+    chunk_size: int,
+) -> ChunkQueueStream:
+    """
+    Call ``write`` with a :py:class:`ChunkQueueStream` in a separate thread.
+    Exceptions raised by ``write`` are passed to the consumer with the :py:class:`EndOfChunks`.
+    Set ``closed`` of the returned stream to |True| to stop the writing at the next write.
+    """
+
+    stream = ChunkQueueStream(put, chunk_size)
+
+    def run() -> None:
+        error: Optional[BaseException] = None
+
+        try:
+            write(stream)
+        except _IterationClosedError:
+            pass
+        except BaseException as e:
+            error = e
+        finally:
+            stream.end(error)
+
+    threading.Thread(target=run, daemon=True).start()
+
+    return stream
+
+
+def iter_chunks(write: Callable[[ChunkQueueStream], None], chunk_size: int) -> Iterator[str]:
+    """
+    Yield chunks of the texts that ``write`` writes to a stream.
+    The writing thread waits while the chunks that are not consumed fill the queue,
+    thus a table is not rendered in memory at once.
+
+    Raises:
+        Exceptions raised by ``write``.
+    """
+
+    chunk_queue: queue.Queue[ChunkQueueItem] = queue.Queue(maxsize=_MAX_QUEUED_CHUNKS)
+    stream = start_writing(write, chunk_queue.put, chunk_size)
+
+    try:
+        while True:
+            item = chunk_queue.get()
+            if isinstance(item, EndOfChunks):
+                if item.error is not None:
+                    raise item.error
+
+                return
+
+            yield item
+    except GeneratorExit:
+        # the consumer stopped the iteration: stop the writing at the next write,
+        # and take chunks until the end to unblock the writing thread
+        stream.closed = True
+        while not isinstance(chunk_queue.get(), EndOfChunks):
+            pass
+
+        raise
+
+
+async def consume_chunks(
+    write: Callable[[ChunkQueueStream], None],
+    consume: Callable[[str], Any],
+    chunk_size: int,
+) -> None:
+    """
+    Await ``consume`` with each chunk of the texts that ``write`` writes to a stream.
+    ``write`` is called in a separate thread: the event loop is not blocked while rendering.
+
+    Raises:
+        Exceptions raised by ``write`` or ``consume``.
+    """
+
+    loop = asyncio.get_running_loop()
+    chunk_queue: asyncio.Queue[ChunkQueueItem] = asyncio.Queue(maxsize=_MAX_QUEUED_CHUNKS)
+
+    def put(item: ChunkQueueItem) -> None:
+        # called from the writing thread: wait until the queue has room
+        asyncio.run_coroutine_threadsafe(chunk_queue.put(item), loop).result()
+
+    stream = start_writing(write, put, chunk_size)
+    is_end = False
+
+    try:
+        while True:
+            item = await chunk_queue.get()
+            if isinstance(item, EndOfChunks):
+                is_end = True
+                if item.error is not None:
+                    raise item.error
+
+                return
+
+            await consume(item)
+    finally:
+        if not is_end:
+            # stopped by an error of the consumer or a cancellation:
+            # take chunks until the end to unblock the writing thread
+            stream.closed = True
+            while not isinstance(await chunk_queue.get(), EndOfChunks):
+                pass
+
+
+def iter_lines(chunks: Iterator[str]) -> Iterator[str]:
+    """
+    Split chunks into lines. Each line includes the trailing newline character.
+    """
+
+    remainder = ""
+
+    for chunk in chunks:
+        lines = (remainder + chunk).split("\n")
+        remainder = lines.pop()
+
+        for line in lines:
+            yield line + "\n"
+
+    if remainder:
+        yield remainder
@@ -1,7 +1,6 @@
-import copy
 from typing import Any, Final, cast
 
-from dataproperty import NOT_QUOTING_FLAGS, DataProperty
+from dataproperty import NOT_QUOTING_FLAGS, DataProperty, DataPropertyExtractor
 from pathvalidate import replace_symbol
 
 from ...error import EmptyTableDataError
@@ -32,8 +31,12 @@ class CssTableWriter(IndentationTextTableWriter):
         self.is_padding = False
         self.indent_string = kwargs.get("indent_string", "    ")
 
-        self._dp_extractor.preprocessor.is_escape_html_tag = False
-        self._quoting_flags = copy.deepcopy(NOT_QUOTING_FLAGS)
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.preprocessor.is_escape_html_tag = False
+        extractor.quoting_flags = dict(NOT_QUOTING_FLAGS)
 
     def write_table(self, **kwargs: Any) -> None:
         """
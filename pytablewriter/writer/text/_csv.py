@@ -45,6 +45,9 @@ class CsvTableWriter(TextTableWriter):
         self.is_formatting_float = False
         self.is_write_header_separator_row = False
 
+        # the flag is changed in place instead of in _configure_dp_extractor:
+        # data properties of empty strings that the extractor cached while applying
+        # the arguments keep being quoted
         self._quoting_flags[typepy.Typecode.NULL_STRING] = False
 
     def _write_header(self) -> None:
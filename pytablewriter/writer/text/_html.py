@@ -1,4 +1,3 @@
-import copy
 import warnings
 from typing import Any, Final, Optional, cast
 
@@ -51,13 +50,18 @@ class HtmlTableWriter(TextTableWriter):
         self.is_padding = False
         self.indent_string = kwargs.get("indent_string", "    ")
 
-        self._dp_extractor.preprocessor.line_break_repl = "<br>"
-        self._dp_extractor.preprocessor.is_escape_html_tag = False
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
         self._table_tag: Any = None
 
         self.enable_ansi_escape = False
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.preprocessor.line_break_repl = "<br>"
+        extractor.preprocessor.is_escape_html_tag = False
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
+
     def write_table(self, **kwargs: Any) -> None:
         """
         |write_table| with HTML table format.
@@ -1,4 +1,4 @@
-import copy
+from collections.abc import Sequence
 from textwrap import indent
 from typing import Any, Final
 
@@ -10,6 +10,7 @@ from tabledata import to_value_matrix
 from typepy import Typecode
 
 from .._msgfy import to_error_message
+from .._write_stats import PHASE_HEADER, PHASE_TABLE_DP, measure_phase
 from ._common import serialize_dp
 from ._text_writer import IndentationTextTableWriter
 
@@ -76,18 +77,23 @@ class JsonTableWriter(IndentationTextTableWriter):
         self.char_closing_row_cross_point = ""
 
         self._is_require_header = True
-        self._dp_extractor.type_value_map = {
+
+        self._init_cross_point_maps()
+
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.type_value_map = {
             Typecode.INFINITY: "Infinity",
             Typecode.NAN: "NaN",
         }
-        self._dp_extractor.update_strict_level_map({Typecode.BOOL: typepy.StrictLevel.MAX})
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
-
-        self._init_cross_point_maps()
+        extractor.update_strict_level_map({Typecode.BOOL: typepy.StrictLevel.MAX})
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
 
     def write_null_line(self) -> None:
         self._verify_stream()
-        self.stream.write("\n")
+        self._write_raw_string("\n")
 
     def _write_table(self, **kwargs: Any) -> None:
         sort_keys: Final = kwargs.get("sort_keys", False)
@@ -109,12 +115,13 @@ class JsonTableWriter(IndentationTextTableWriter):
             if all([not self.is_write_closing_row, typepy.is_not_null_string(json_text)]):
                 json_text += joint_text
 
-            self.stream.write(indent(json_text, " " * self._indent_level))
+            self._write_raw_string(indent(json_text, " " * self._indent_level))
             self._write_closing_row()
 
     def _to_row_item(self, row_idx: int, col_dp: ColumnDataProperty, value_dp: DataProperty) -> str:
         return value_dp.to_str()
 
+    @measure_phase(PHASE_TABLE_DP)
     def _preprocess_table_dp(self) -> None:
         if self._is_complete_table_dp_preprocess:
             return
@@ -123,7 +130,7 @@ class JsonTableWriter(IndentationTextTableWriter):
 
         try:
             self._table_value_dp_matrix = self._dp_extractor.to_dp_matrix(
-                to_value_matrix(self.headers, self.value_matrix)
+                to_value_matrix(self.headers, self._get_table_value_matrix())
             )
         except TypeError as e:
             self._logger.logger.debug(to_error_message(e))
@@ -131,6 +138,7 @@ class JsonTableWriter(IndentationTextTableWriter):
 
         self._is_complete_table_dp_preprocess = True
 
+    @measure_phase(PHASE_HEADER)
     def _preprocess_header(self) -> None:
         if self._is_complete_header_preprocess:
             return
@@ -143,17 +151,14 @@ class JsonTableWriter(IndentationTextTableWriter):
 
         self._is_complete_header_preprocess = True
 
-    def _preprocess_value_matrix(self) -> None:
-        if self._is_complete_value_matrix_preprocess:
-            return
-
-        self._table_value_matrix = [
+    def _to_row_items(
+        self, start_row_idx: int, value_dp_matrix: Sequence[Sequence[DataProperty]]
+    ) -> list:
+        return [
             dict(zip(self._table_headers, [serialize_dp(dp) for dp in dp_list]))
-            for dp_list in self._table_value_dp_matrix
+            for dp_list in value_dp_matrix
         ]
 
-        self._is_complete_value_matrix_preprocess = True
-
     def _get_opening_row_items(self) -> list[str]:
         if typepy.is_not_null_string(self.table_name):
             return [f'{{ "{MultiByteStrDecoder(self.table_name).unicode_str:s}" : [']
@@ -43,11 +43,15 @@ class JsonLinesTableWriter(JsonTableWriter):
             :ref:`example-jsonl-writer`
         """
 
-        sort_keys: Final = kwargs.get("sort_keys", False)
-
         with self._logger:
             self._verify_property()
-            self._preprocess()
+            self._write_table(**kwargs)
+
+    def _write_table(self, **kwargs: Any) -> None:
+        sort_keys: Final = kwargs.get("sort_keys", False)
+
+        self._preprocess()
 
+        with self._buffered_write():
             for values in self._table_value_matrix:
                 self._write_line(json.dumps(values, ensure_ascii=False, sort_keys=sort_keys))
@@ -1,4 +1,3 @@
-import copy
 import re
 from typing import Any, Final
 
@@ -34,10 +33,14 @@ class LatexWriter(IndentationTextTableWriter):
         self.column_delimiter = " & "
         self.char_right_side_row = r" \\"
 
-        self._quoting_flags = copy.deepcopy(dp.NOT_QUOTING_FLAGS)
-
         self._init_cross_point_maps()
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dp.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dp.NOT_QUOTING_FLAGS)
+
     def _is_math_parts(self, value_dp: DataProperty) -> bool:
         if value_dp.typecode in [Typecode.INTEGER, Typecode.REAL_NUMBER]:
             return False
@@ -183,7 +186,12 @@ class LatexTableWriter(LatexWriter):
         super().__init__(**kwargs)
 
         self.char_right_side_row = r" \\ \hline"
-        self._dp_extractor.set_type_value(Typecode.INFINITY, r"\infty")
+
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dp.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.set_type_value(Typecode.INFINITY, r"\infty")
 
     def _get_opening_row_items(self) -> list[str]:
         return [
@@ -44,8 +44,12 @@ class LtsvTableWriter(CsvTableWriter):
 
         with self._logger:
             self._verify_property()
-            self._preprocess()
+            self._write_table(**kwargs)
 
+    def _write_table(self, **kwargs: Any) -> None:
+        self._preprocess()
+
+        with self._buffered_write():
             for values in self._table_value_matrix:
                 ltsv_item_list = [
                     f"{pathvalidate.sanitize_ltsv_label(header_name):s}:{value}"
@@ -1,4 +1,3 @@
-import copy
 from enum import Enum, unique
 from typing import Any, Final, Union
 
@@ -78,11 +77,16 @@ class MarkdownTableWriter(IndentationTextTableWriter):
         self._use_default_header = True
 
         self._is_require_header = True
-        self._quoting_flags = copy.deepcopy(dp.NOT_QUOTING_FLAGS)
-        self._dp_extractor.min_column_width = 3
 
         self._init_cross_point_maps()
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dp.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dp.NOT_QUOTING_FLAGS)
+        extractor.min_column_width = 3
+
     def _to_header_item(self, col_dp: ColumnDataProperty, value_dp: DataProperty) -> str:
         return self.__escape_vertical_bar_char(super()._to_header_item(col_dp, value_dp))
 
@@ -172,7 +176,7 @@ class MarkdownTableWriter(IndentationTextTableWriter):
 
     def _write_table_iter(self, **kwargs: Any) -> None:
         self.__write_chapter()
-        super()._write_table_iter()
+        super()._write_table_iter(**kwargs)
 
     def __write_chapter(self) -> None:
         if typepy.is_null_string(self.table_name):
@@ -1,4 +1,3 @@
-import copy
 import re
 from collections.abc import Sequence
 from typing import Any, Final
@@ -44,11 +43,15 @@ class MediaWikiTableWriter(TextTableWriter):
 
         self.update_preprocessor(line_break_handling=LineBreakHandling.NOP)
 
-        self._quoting_flags = copy.deepcopy(dp.NOT_QUOTING_FLAGS)
-
         # experimental: This attribute may change in the future release
         self.table_style = kwargs.get("table_style", "")
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dp.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dp.NOT_QUOTING_FLAGS)
+
     def _write_header(self) -> None:
         if not self.is_write_header:
             return
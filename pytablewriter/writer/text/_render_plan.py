@@ -0,0 +1,94 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from collections.abc import Sequence
+from typing import IO, TYPE_CHECKING, Any, cast
+
+
+if TYPE_CHECKING:
+    from ._text_writer import TextTableWriter
+
+
+class RenderPlan:
+    """
+    An immutable snapshot of the configuration of a text table writer
+    (styles, style filters, theme, type hints, quoting flags, and format characters)
+    created by :py:meth:`~pytablewriter.writer.text.TextTableWriter.compile`.
+
+    Changes to the writer after the compilation do not affect the plan.
+    Each rendering uses a writer that is copied from the snapshot,
+    thus :py:meth:`.render` and :py:meth:`.renders` can be called concurrently
+    from multiple threads without locking.
+
+    :Example:
+        .. code-block:: python
+
+            import pytablewriter as ptw
+
+            plan = ptw.MarkdownTableWriter(headers=["a", "b"], margin=1).compile()
+
+            print(plan.renders([[1, 2], [3, 4]]))
+    """
+
+    __slots__ = ("__writer",)
+
+    def __init__(self, writer: "TextTableWriter") -> None:
+        self.__writer = cast("TextTableWriter", writer._create_detached_copy())
+
+    def __repr__(self) -> str:
+        return "{}(format_name={}, table_name={}, headers={})".format(
+            self.__class__.__name__, self.format_name, self.table_name, self.headers
+        )
+
+    @property
+    def format_name(self) -> str:
+        return self.__writer.format_name
+
+    @property
+    def table_name(self) -> str:
+        return self.__writer.table_name
+
+    @property
+    def headers(self) -> tuple[str, ...]:
+        return tuple(self.__writer.headers)
+
+    def render(self, value_matrix: Sequence[Sequence[Any]], stream: IO[str], **kwargs: Any) -> None:
+        """
+        Write a table of the value matrix to the stream with the configuration of the plan.
+
+        Args:
+            value_matrix:
+                Rows of the table.
+            stream:
+                The output stream.
+            **kwargs:
+                Optional arguments that the writer takes.
+        """
+
+        writer = self.__create_writer(value_matrix)
+        writer.stream = stream
+        writer.write_table(**kwargs)
+
+    def renders(self, value_matrix: Sequence[Sequence[Any]], **kwargs: Any) -> str:
+        """
+        Get rendered tabular text of the value matrix with the configuration of the plan.
+
+        Args:
+            value_matrix:
+                Rows of the table.
+            **kwargs:
+                Optional arguments that the writer takes.
+
+        Returns:
+            str: Rendered tabular text.
+        """
+
+        return self.__create_writer(value_matrix).dumps(**kwargs)
+
+    def __create_writer(self, value_matrix: Sequence[Sequence[Any]]) -> "TextTableWriter":
+        # the writer of the plan is never written: copy the writer for each rendering
+        writer = cast("TextTableWriter", self.__writer._create_detached_copy())
+        writer.value_matrix = value_matrix
+
+        return writer
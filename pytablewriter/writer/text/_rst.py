@@ -1,4 +1,3 @@
-import copy
 from typing import Any
 
 import dataproperty
@@ -40,10 +39,14 @@ class RstTableWriter(IndentationTextTableWriter):
         self.is_write_opening_row = True
         self.is_write_closing_row = True
 
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
-
         self._init_cross_point_maps()
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
+
     def write_table(self, **kwargs: Any) -> None:
         with self._logger:
             self._write_line(self._get_table_directive())
@@ -103,7 +106,11 @@ class RstCsvTableWriter(RstTableWriter):
         self.is_write_value_separator_row = False
         self.is_write_closing_row = False
 
-        self._quoting_flags[typepy.Typecode.STRING] = True
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags[typepy.Typecode.STRING] = True
 
     def write_table(self, **kwargs: Any) -> None:
         """
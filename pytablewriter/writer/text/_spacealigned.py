@@ -1,4 +1,3 @@
-import copy
 from typing import Any
 
 import dataproperty
@@ -36,4 +35,8 @@ class SpaceAlignedTableWriter(CsvTableWriter):
         self.is_padding = True
         self.is_formatting_float = kwargs.get("is_formatting_float", True)
 
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
@@ -1,18 +1,35 @@
+import asyncio
 import enum
+import inspect
 import io
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from itertools import chain
-from typing import IO, Any, Optional, Union, cast
+from typing import IO, Any, Final, NamedTuple, Optional, Union, cast
 
 import typepy
-from dataproperty import ColumnDataProperty, DataProperty, LineBreakHandling
+from dataproperty import ColumnDataProperty, DataProperty, DataPropertyExtractor, LineBreakHandling
 
 from ...error import EmptyTableDataError
 from ...style import Cell, ColSeparatorStyleFilterFunc, Style, StylerInterface, TextStyler
 from .._common import HEADER_ROW
-from .._table_writer import AbstractTableWriter
+from .._table_writer import AbstractTableWriter, _is_row_dependent_style_filter
+from .._write_stats import PHASE_TABLE_PROPERTY, measure_phase
+from . import _chunk
 from ._interface import IndentationInterface, TextWriterInterface
+from ._render_plan import RenderPlan
+
+
+DEFAULT_WRITE_BUFFER_SIZE: Final = 64 * 1024
+DEFAULT_ITER_CHUNK_SIZE: Final = 8 * 1024
+
+
+class _RowTemplate(NamedTuple):
+    col_delimiters: list[str]
+
+    # a format string that places the values of a row between the column delimiters
+    format_str: str
 
 
 @enum.unique
@@ -105,6 +122,27 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         Margin size for each cells
 
+    .. py:attribute:: is_stream_value_rows
+        :type: bool
+
+        If |True|, format each value row just before writing the row to the |stream|
+        instead of formatting all of the rows in advance:
+        formatted rows are not retained in the writer.
+        Reduces the peak memory usage of writing large tables, while rows are formatted
+        again at each write.
+        Defaults to |False|.
+
+    .. py:attribute:: write_buffer_size
+        :type: int
+
+        The number of characters to buffer before writing them to the |stream|.
+        Rows of a table are joined and written to the |stream| in chunks of the size,
+        instead of writing each row.
+        Buffered rows are written to the |stream| before the end of a write method
+        (e.g. ``write_table``, ``dump``, and each iteration of ``write_table_iter``).
+        Writes each row to the |stream| if the value is zero or less.
+        Defaults to ``65536``.
+
     """
 
     def __update_template(self) -> None:
@@ -140,16 +178,30 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         self._margin = kwargs.get("margin", 0)
 
-        self._dp_extractor.preprocessor.line_break_handling = LineBreakHandling.REPLACE
         self.is_write_null_line_after_table = kwargs.get("is_write_null_line_after_table", False)
+        self.is_stream_value_rows = kwargs.get("is_stream_value_rows", False)
+        self.write_buffer_size: int = kwargs.get("write_buffer_size", DEFAULT_WRITE_BUFFER_SIZE)
+        self.__write_buffer: Optional[list[str]] = None
+        self.__write_buffer_len = 0
+        self.__write_buffer_stream: Any = None
 
         self._init_cross_point_maps()
 
         self._col_separator_style_filters: list[ColSeparatorStyleFilterFunc] = []
 
+        # templates of header/value rows that compiled while writing a table:
+        # None if column delimiters are resolved for each row
+        self.__row_templates: Optional[dict[bool, _RowTemplate]] = None
+
         if "theme" in kwargs:
             self.set_theme(kwargs["theme"])
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.preprocessor.line_break_handling = LineBreakHandling.REPLACE
+
     def __repr__(self) -> str:
         return self.dumps()
 
@@ -215,6 +267,14 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
                 :py:attr:`~.style_filter_kwargs`. In default, the attribute includes:
 
                     - ``writer``: the writer instance that the caller of a ``style_filter function``
+
+                A style filter function can declare that the returned style does not depend
+                on rows by setting ``is_row_dependent`` attribute of the function to |False|.
+                Such a function must return the same style for the column separators that have
+                the same column indices and the same header/value row kind.
+                If all of the style filter functions are declared as row-independent,
+                the writer resolves the column separators only once for each row kind
+                in a table.
         """
 
         self._col_separator_style_filters.insert(0, style_filter)
@@ -246,13 +306,14 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
             - |None| values are written as an empty string.
         """
 
-        try:
-            super().write_table(**kwargs)
-        except EmptyTableDataError:
-            raise
+        with self._buffered_write():
+            try:
+                super().write_table(**kwargs)
+            except EmptyTableDataError:
+                raise
 
-        if self.is_write_null_line_after_table:
-            self.write_null_line()
+            if self.is_write_null_line_after_table:
+                self.write_null_line()
 
     def dump(self, output: Union[str, IO], close_after_write: bool = True, **kwargs: Any) -> None:
         """Write data to the output with tabular format.
@@ -312,6 +373,154 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         return tabular_text
 
+    def compile(self) -> RenderPlan:
+        """Create an immutable rendering plan from the configuration of the writer.
+
+        The plan holds a snapshot of the configuration of the writer
+        (styles, style filters, theme, type hints, quoting flags, and format characters).
+        The plan can render tables of different rows concurrently from multiple threads,
+        while a writer instance can write only one table at a time.
+
+        Returns:
+            RenderPlan: The rendering plan.
+        """
+
+        return RenderPlan(self)
+
+    def iter_chunks(
+        self, chunk_size: int = DEFAULT_ITER_CHUNK_SIZE, **kwargs: Any
+    ) -> Iterator[str]:
+        """Get rendered tabular text from the table data chunk by chunk.
+
+        The table is rendered while iterating the chunks:
+        the whole rendered text is not held in memory at once.
+        Chunks can be passed to streaming responses (e.g. WSGI/ASGI) as they are.
+        The first chunk is available after the preprocessing of the table,
+        which determines the column widths from all of the values:
+        set :py:attr:`.is_stream_value_rows` to |True| to format value rows
+        while iterating.
+
+        The table is rendered in a separate thread.
+        Do not use the writer until the iteration finished (or the iterator is closed).
+
+        Args:
+            chunk_size:
+                The minimum number of characters of each chunk (except the last chunk).
+                Defaults to ``8192``.
+            **kwargs:
+                Optional arguments that the writer takes.
+
+        Yields:
+            str: A chunk of the rendered tabular text.
+            The concatenation of the chunks is the same as the return value of |dumps|.
+
+        Raises:
+            ValueError: If ``chunk_size`` is zero or less.
+        """
+
+        self.__verify_chunk_size(chunk_size)
+
+        return _chunk.iter_chunks(
+            lambda stream: self.__write_table_to_chunk_stream(stream, **kwargs), chunk_size
+        )
+
+    def iter_lines(self, **kwargs: Any) -> Iterator[str]:
+        """Get rendered tabular text from the table data line by line.
+
+        Lines are rendered in the same way as :py:meth:`.iter_chunks`.
+
+        Args:
+            **kwargs:
+                Optional arguments that the writer takes.
+
+        Yields:
+            str: A line of the rendered tabular text that includes the trailing newline.
+        """
+
+        return _chunk.iter_lines(self.iter_chunks(**kwargs))
+
+    async def write_table_async(
+        self,
+        stream: Any,
+        chunk_size: int = DEFAULT_ITER_CHUNK_SIZE,
+        encoding: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Write a table to an asynchronous stream without blocking the event loop.
+
+        The table is preprocessed and rendered in a separate thread
+        in the same way as :py:meth:`.iter_chunks`,
+        and the rendered text is written to the ``stream`` chunk by chunk:
+        the event loop runs other tasks while the table is rendered.
+        The writing thread waits while the written chunks are not consumed (backpressure).
+        The |stream| attribute of the writer is not used.
+
+        Args:
+            stream:
+                An ``asyncio.StreamWriter`` or an object that has a ``write`` method
+                (a coroutine function or a function).
+                If the object has a ``drain`` coroutine method,
+                the method is awaited after each write.
+            chunk_size:
+                The minimum number of characters of each written chunk
+                (except the last chunk).
+                Defaults to ``8192``.
+            encoding:
+                Encoding to convert chunks to bytes before writing.
+                Defaults to ``utf-8`` for ``asyncio.StreamWriter``.
+                Writes chunks as strings for other streams if the value is |None|.
+            **kwargs:
+                Optional arguments that the writer takes.
+
+        Raises:
+            ValueError: If ``chunk_size`` is zero or less.
+        """
+
+        self.__verify_chunk_size(chunk_size)
+
+        if encoding is None and isinstance(stream, asyncio.StreamWriter):
+            encoding = "utf-8"
+
+        drain = getattr(stream, "drain", None)
+
+        async def consume(chunk: str) -> None:
+            result = stream.write(chunk.encode(encoding) if encoding else chunk)
+            if inspect.isawaitable(result):
+                await result
+
+            if drain is not None:
+                await drain()
+
+        await _chunk.consume_chunks(
+            lambda chunk_stream: self.__write_table_to_chunk_stream(chunk_stream, **kwargs),
+            consume,
+            chunk_size,
+        )
+
+    @staticmethod
+    def __verify_chunk_size(chunk_size: int) -> None:
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be greater than zero: actual={chunk_size}")
+
+    def __write_table_to_chunk_stream(self, stream: _chunk.ChunkQueueStream, **kwargs: Any) -> None:
+        old_stream = self.stream
+        old_write_buffer_size = self.write_buffer_size
+
+        try:
+            self.stream = stream
+            # written texts are joined into chunks by the stream
+            self.write_buffer_size = 0
+            self.write_table(**kwargs)
+        finally:
+            self.stream = old_stream
+            self.write_buffer_size = old_write_buffer_size
+
+    def _create_detached_copy(self) -> AbstractTableWriter:
+        writer = cast(TextTableWriter, super()._create_detached_copy())
+        writer._col_separator_style_filters = list(self._col_separator_style_filters)
+
+        return writer
+
     def _set_chars(self, c: str) -> None:
         self.char_left_side_row = c
         self.char_right_side_row = c
@@ -343,12 +552,37 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
         return TextStyler(writer)
 
     def _write_table_iter(self, **kwargs: Any) -> None:
-        super()._write_table_iter()
+        super()._write_table_iter(**kwargs)
         if self.is_write_null_line_after_table:
             self.write_null_line()
 
     def _write_table(self, **kwargs: Any) -> None:
-        self._preprocess()
+        with self._buffered_write():
+            self.__write_table()
+
+    def __write_table(self) -> None:
+        if not any(
+            _is_row_dependent_style_filter(style_filter)
+            for style_filter in self._col_separator_style_filters
+        ):
+            # column delimiters are the same for all of the value rows in the table
+            self.__row_templates = {}
+
+        try:
+            self.__write_table_rows()
+        finally:
+            self.__row_templates = None
+
+    def __write_table_rows(self) -> None:
+        if self.is_stream_value_rows:
+            # column widths are determined before formatting value rows:
+            # value rows are formatted while writing
+            self._preprocess_table_dp()
+            self._preprocess_table_property()
+            self._preprocess_header()
+        else:
+            self._preprocess()
+
         self._write_opening_row()
 
         try:
@@ -359,7 +593,7 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         is_first_value_row = True
         for row, (values, value_dp_list) in enumerate(
-            zip(self._table_value_matrix, self._table_value_dp_matrix)
+            zip(self._iter_value_rows(), self._table_value_dp_matrix)
         ):
             try:
                 if is_first_value_row:
@@ -406,8 +640,56 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
             super()._apply_style_to_row_item(row_idx, col_dp, value_dp, style)
         )
 
+    @contextmanager
+    def _buffered_write(self) -> Iterator[None]:
+        """
+        Buffer texts written by :py:meth:`._write_raw_string` in the context,
+        and write the buffered texts to the |stream| at the end of the context.
+        """
+
+        if self.write_buffer_size <= 0 or (
+            self.__write_buffer is not None and self.__write_buffer_stream is self.stream
+        ):
+            # buffering is disabled or already started by an outer context
+            yield
+            return
+
+        # the stream may be replaced by an outer context (e.g. dumps):
+        # buffer texts for each stream
+        outer_state = (self.__write_buffer, self.__write_buffer_len, self.__write_buffer_stream)
+        self.__write_buffer = []
+        self.__write_buffer_len = 0
+        self.__write_buffer_stream = self.stream
+
+        try:
+            yield
+        finally:
+            self.__flush_write_buffer()
+            (
+                self.__write_buffer,
+                self.__write_buffer_len,
+                self.__write_buffer_stream,
+            ) = outer_state
+
+    def __flush_write_buffer(self) -> None:
+        if not self.__write_buffer:
+            return
+
+        self.__write_buffer_stream.write("".join(self.__write_buffer))
+        self.__write_buffer.clear()
+        self.__write_buffer_len = 0
+
     def _write_raw_string(self, unicode_text: str) -> None:
-        self.stream.write(unicode_text)
+        if self.__write_buffer is None or self.__write_buffer_stream is not self.stream:
+            self.__flush_write_buffer()
+            self.stream.write(unicode_text)
+            return
+
+        self.__write_buffer.append(unicode_text)
+        self.__write_buffer_len += len(unicode_text)
+
+        if self.__write_buffer_len >= self.write_buffer_size:
+            self.__flush_write_buffer()
 
     def _write_raw_line(self, unicode_text: str = "") -> None:
         self._write_raw_string(unicode_text + "\n")
@@ -461,11 +743,27 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         return self._styler.apply_terminal_style(col_delimiter, style=style)
 
-    def _write_row(self, row: int, values: Sequence[str]) -> None:
-        if typepy.is_empty_sequence(values):
-            return
+    def __get_row_template(self, row: int) -> Optional[_RowTemplate]:
+        if self.__row_templates is None:
+            return None
+
+        is_header_row = row == HEADER_ROW
+        row_template = self.__row_templates.get(is_header_row)
+        if row_template is None:
+            col_delimiters = self.__to_col_delimiters(row)
+            row_template = _RowTemplate(
+                col_delimiters,
+                "{}".join(
+                    col_delimiter.replace("{", "{{").replace("}", "}}")
+                    for col_delimiter in col_delimiters
+                ),
+            )
+            self.__row_templates[is_header_row] = row_template
+
+        return row_template
 
-        col_delimiters = (
+    def __to_col_delimiters(self, row: int) -> list[str]:
+        return (
             [
                 self.__to_column_delimiter(
                     row,
@@ -493,6 +791,19 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
             ]
         )
 
+    def _write_row(self, row: int, values: Sequence[str]) -> None:
+        if typepy.is_empty_sequence(values):
+            return
+
+        row_template = self.__get_row_template(row)
+        if row_template is None:
+            col_delimiters = self.__to_col_delimiters(row)
+        elif len(values) == len(row_template.col_delimiters) - 1:
+            self._write_line(row_template.format_str.format(*values))
+            return
+        else:
+            col_delimiters = row_template.col_delimiters
+
         row_items = [""] * (len(col_delimiters) + len(values))
         row_items[::2] = col_delimiters
         row_items[1::2] = list(values)
@@ -566,6 +877,7 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
 
         return margin_str + "{:s}" + margin_str
 
+    @measure_phase(PHASE_TABLE_PROPERTY)
     def _preprocess_table_property(self) -> None:
         super()._preprocess_table_property()
 
@@ -1,4 +1,3 @@
-import copy
 import warnings
 from typing import Any, Union
 
@@ -24,8 +23,12 @@ class YamlTableWriter(TextTableWriter):
 
         self.is_padding = False
 
-        self._dp_extractor.float_type = float
-        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: dataproperty.DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.float_type = float
+        extractor.quoting_flags = dict(dataproperty.NOT_QUOTING_FLAGS)
 
     @property
     def format_name(self) -> str:
@@ -1,7 +1,13 @@
-from ._javascript import JavaScriptTableWriter
-from ._numpy import NumpyTableWriter
-from ._pandas import PandasDataFrameWriter
-from ._python import PythonCodeTableWriter
+from typing import TYPE_CHECKING
+
+from ...._lazy_import import make_lazy_attrs
+
+
+if TYPE_CHECKING:
+    from ._javascript import JavaScriptTableWriter
+    from ._numpy import NumpyTableWriter
+    from ._pandas import PandasDataFrameWriter
+    from ._python import PythonCodeTableWriter
 
 
 __all__ = (
@@ -10,3 +16,15 @@ __all__ = (
     "PandasDataFrameWriter",
     "PythonCodeTableWriter",
 )
+
+# import writers and their dependencies at the first access to reduce the import time
+__getattr__, __dir__ = make_lazy_attrs(
+    __name__,
+    globals(),
+    {
+        "JavaScriptTableWriter": "._javascript",
+        "NumpyTableWriter": "._numpy",
+        "PandasDataFrameWriter": "._pandas",
+        "PythonCodeTableWriter": "._python",
+    },
+)
@@ -2,7 +2,7 @@ import io
 from datetime import datetime
 from typing import Any, Final
 
-from dataproperty import ColumnDataProperty, DataProperty, DefaultValue
+from dataproperty import ColumnDataProperty, DataProperty, DataPropertyExtractor, DefaultValue
 from typepy import StrictLevel, Typecode
 
 from ...._converter import strip_quote
@@ -86,13 +86,18 @@ class JavaScriptTableWriter(SourceCodeTableWriter):
         super().__init__(**kwargs)
 
         self.variable_declaration = "const"
-        self._dp_extractor.type_value_map = {
+        self.register_trans_func(bool_to_str)
+
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.type_value_map = {
             # Typecode.NONE: "null",
             Typecode.INFINITY: "Infinity",
             Typecode.NAN: "NaN",
         }
-        self._dp_extractor.update_strict_level_map({Typecode.BOOL: StrictLevel.MAX})
-        self.register_trans_func(bool_to_str)
+        extractor.update_strict_level_map({Typecode.BOOL: StrictLevel.MAX})
 
     def get_variable_name(self, value: str) -> str:
         return sanitize_js_var_name(value, "_").casefold()
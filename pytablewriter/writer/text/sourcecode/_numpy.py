@@ -1,10 +1,14 @@
-from typing import Any
+from typing import Any, Final
 
 import typepy
+from dataproperty import DataPropertyExtractor
 
 from ._python import PythonCodeTableWriter
 
 
+_DEFAULT_IMPORT_NUMPY_AS: Final = "np"
+
+
 class NumpyTableWriter(PythonCodeTableWriter):
     """
     A table writer class for ``NumPy`` source code format.
@@ -46,9 +50,14 @@ class NumpyTableWriter(PythonCodeTableWriter):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-        self.import_numpy_as = "np"
-        self._dp_extractor.set_type_value(typepy.Typecode.INFINITY, f"{self.import_numpy_as:s}.inf")
-        self._dp_extractor.set_type_value(typepy.Typecode.NAN, f"{self.import_numpy_as:s}.nan")
+        self.import_numpy_as = _DEFAULT_IMPORT_NUMPY_AS
+
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.set_type_value(typepy.Typecode.INFINITY, f"{_DEFAULT_IMPORT_NUMPY_AS:s}.inf")
+        extractor.set_type_value(typepy.Typecode.NAN, f"{_DEFAULT_IMPORT_NUMPY_AS:s}.nan")
 
     def _get_opening_row_items(self) -> list[str]:
         array_def = f"{self.import_numpy_as:s}.array(["
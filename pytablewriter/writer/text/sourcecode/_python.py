@@ -1,6 +1,7 @@
 from typing import Any
 
 import typepy
+from dataproperty import DataPropertyExtractor
 
 from ...._function import dateutil_datetime_formatter, quote_datetime_formatter
 from ....sanitizer import sanitize_python_var_name
@@ -52,7 +53,11 @@ class PythonCodeTableWriter(SourceCodeTableWriter):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-        self._dp_extractor.type_value_map = {
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.type_value_map = {
             typepy.Typecode.NONE: None,
             typepy.Typecode.INFINITY: 'float("inf")',
             typepy.Typecode.NAN: 'float("nan")',
@@ -2,6 +2,7 @@ import abc
 from typing import Any
 
 import typepy
+from dataproperty import DataPropertyExtractor
 
 from .._text_writer import IndentationTextTableWriter
 
@@ -60,11 +61,16 @@ class SourceCodeTableWriter(IndentationTextTableWriter):
         self.is_formatting_float = False
         self.is_datetime_instance_formatting = True
 
-        self._quoting_flags[typepy.Typecode.DATETIME] = False
         self._is_require_table_name = True
 
         self._init_cross_point_maps()
 
+    @classmethod
+    def _configure_dp_extractor(cls, extractor: DataPropertyExtractor) -> None:
+        super()._configure_dp_extractor(extractor)
+
+        extractor.quoting_flags[typepy.Typecode.DATETIME] = False
+
     def _get_value_row_separator_items(self) -> list[str]:
         return []
 
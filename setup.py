@@ -51,6 +51,7 @@ with open(os.path.join(REQUIREMENT_DIR, "docs_requirements.txt")) as f:
 
 setuptools_require = ["setuptools>=38.3.0"]
 
+arrow_requires = ["pyarrow>=8"]
 excel_requires = ["xlwt", "XlsxWriter>=0.9.6,<4"]
 es8_requires = ["elasticsearch>=8.0.1,<9"]
 from_requires = ["pytablereader>=0.31.3,<2"]
@@ -66,7 +67,8 @@ yaml_requires = ["PyYAML>=3.11,<7"]
 optional_requires = ["simplejson>=3.8.1,<4"]
 pandas_requires = ["pandas>=0.25.3,<3"]
 all_requires = (
-    excel_requires
+    arrow_requires
+    + excel_requires
     + es8_requires
     + from_requires
     + html_requires
@@ -122,6 +124,7 @@ setuptools.setup(
     setup_requires=setuptools_require,
     extras_require={
         "all": all_requires,
+        "arrow": arrow_requires,
         "docs": docs_requires + all_requires,
         "es": es8_requires,
         "es8": es8_requires,
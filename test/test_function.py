@@ -1,9 +1,12 @@
+import io
 from textwrap import dedent
 
 import pytest
 from tabledata import TableData
 
-from pytablewriter import dumps_tabledata
+from pytablewriter import TableFormat, TableWriterFactory, dump_formats, dumps_tabledata
+from pytablewriter.style import Style
+from pytablewriter.writer import AbstractTableWriter
 
 from ._common import print_test_result
 
@@ -75,3 +78,73 @@ class Test_dump_tabledata:
     def test_exception(self, value, expected):
         with pytest.raises(expected):
             dumps_tabledata(value)
+
+
+class Test_dump_formats:
+    @pytest.mark.parametrize(["max_workers"], [[1], [4]])
+    def test_normal(self, monkeypatch, max_workers):
+        headers = ["int", "float", "str", "mix"]
+        value_matrix = [[i, i * 0.25, f"text{i}", i if i % 2 else "n/a"] for i in range(20)]
+        format_names = ["markdown", "csv", "json", "html", "rst_grid_table", "unicode"]
+
+        def make_writer(format_name):
+            return TableWriterFactory.create_from_format_name(
+                format_name,
+                table_name="sample",
+                headers=headers,
+                value_matrix=value_matrix,
+                column_styles=[Style(thousand_separator=","), None, None, None],
+            )
+
+        expected_outputs = {}
+        for format_name in format_names:
+            expected_outputs[format_name] = make_writer(format_name).dumps()
+
+        shared_writers = []
+        org_share_table_dp = AbstractTableWriter._share_table_dp
+
+        def share_table_dp(self, writer):
+            is_shared = org_share_table_dp(self, writer)
+            if is_shared:
+                shared_writers.append(self.format_name)
+
+            return is_shared
+
+        monkeypatch.setattr(AbstractTableWriter, "_share_table_dp", share_table_dp)
+
+        outputs = {format_name: io.StringIO() for format_name in format_names}
+        dump_formats(
+            make_writer("markdown"),
+            {
+                format_name if format_name != "html" else TableFormat.HTML: stream
+                for format_name, stream in outputs.items()
+            },
+            max_workers=max_workers,
+        )
+
+        for format_name in format_names:
+            output = outputs[format_name].getvalue()
+            print_test_result(expected=expected_outputs[format_name], actual=output)
+
+            assert output == expected_outputs[format_name]
+
+        if max_workers == 1:
+            # writers that convert values with the same settings as the markdown writer
+            assert sorted(shared_writers) == ["rst_grid_table", "unicode"]
+
+    def test_normal_path(self, tmpdir):
+        writer = TableWriterFactory.create_from_format_name(
+            "markdown", headers=["a", "b"], value_matrix=iter([[1, 2], [3, 4]])
+        )
+        csv_path = str(tmpdir.join("out.csv"))
+        md_path = str(tmpdir.join("out.md"))
+        stream = io.StringIO()
+
+        dump_formats(writer, {"csv": csv_path, "markdown": md_path, "tsv": stream})
+
+        with open(csv_path, encoding="utf-8") as f:
+            assert f.read() == '"a","b"\n1,2\n3,4\n'
+        with open(md_path, encoding="utf-8") as f:
+            assert "|  1|  2|" in f.read()
+        assert stream.getvalue() == '"a"\t"b"\n1\t2\n3\t4\n'
+        assert not stream.closed
@@ -0,0 +1,80 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pytablewriter
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    # run with a fresh interpreter to import the package from scratch
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(pytablewriter.__file__)), env.get("PYTHONPATH", "")]
+    )
+
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def import_time_modules(code: str) -> set[str]:
+    proc = run_python("-X", "importtime", "-c", code)
+
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def loaded_modules(code: str) -> set[str]:
+    # -X importtime does not report modules imported by importlib.import_module
+    proc = run_python("-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))")
+
+    return set(proc.stdout.splitlines())
+
+
+class Test_import:
+    @pytest.mark.parametrize(
+        ["module_name"],
+        [
+            ["dataproperty"],
+            ["loguru"],
+            ["mbstrdecoder"],
+            ["pathvalidate"],
+            ["tcolorpy"],
+            ["typepy"],
+            ["pytablewriter._factory"],
+            ["pytablewriter._table_format"],
+            ["pytablewriter.writer"],
+        ],
+    )
+    def test_normal_lazy(self, module_name):
+        modules = import_time_modules("import pytablewriter")
+
+        assert "pytablewriter" in modules
+        assert module_name not in modules
+        assert module_name not in loaded_modules("import pytablewriter")
+
+    def test_normal_import_writer(self):
+        modules = loaded_modules("from pytablewriter import MarkdownTableWriter")
+
+        assert "pytablewriter.writer.text._markdown" in modules
+        assert "pytablewriter._table_format" not in modules
+        assert "pytablewriter.writer.binary._excel" not in modules
+        assert "pytablewriter.writer.text.sourcecode._javascript" not in modules
+
+    def test_normal_attrs(self):
+        assert pytablewriter.MarkdownTableWriter is pytablewriter.writer.MarkdownTableWriter
+        assert pytablewriter.style.Style is not None
+        assert set(pytablewriter.__all__) <= set(dir(pytablewriter))
+
+    def test_exception(self):
+        with pytest.raises(AttributeError):
+            pytablewriter.NotExistTableWriter  # noqa: B018
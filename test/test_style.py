@@ -1,8 +1,11 @@
 import copy
+import importlib.metadata
 import sys
+import types
 
 import pytest
 
+import pytablewriter.style._theme as theme_module
 from pytablewriter.style import (
     Align,
     Cell,
@@ -12,6 +15,9 @@ from pytablewriter.style import (
     FontWeight,
     Style,
     ThousandSeparator,
+    fetch_theme,
+    invalidate_theme_cache,
+    list_themes,
 )
 
 from ._common import print_test_result
@@ -253,3 +259,85 @@ class Test_Style_update:
         assert lhs.color == lhs.fg_color
         assert rhs.color == rhs.fg_color
         assert lhs.bg_color == rhs.bg_color
+
+
+@pytest.fixture
+def theme_cache():
+    invalidate_theme_cache()
+    yield
+    invalidate_theme_cache()
+
+
+class Test_fetch_theme:
+    def test_normal_cache(self, monkeypatch, theme_cache):
+        num_scan = 0
+        iter_modules = theme_module.pkgutil.iter_modules
+
+        def counting_iter_modules(*args, **kwargs):
+            nonlocal num_scan
+            num_scan += 1
+            return iter_modules(*args, **kwargs)
+
+        monkeypatch.setattr(theme_module.pkgutil, "iter_modules", counting_iter_modules)
+
+        theme = fetch_theme("altrow")
+        assert theme.style_filter is not None
+        for _ in range(3):
+            assert fetch_theme("altrow") is theme
+            assert "pytablewriter_altrow_theme" in list_themes()
+        assert num_scan == 1
+
+        invalidate_theme_cache()
+        assert fetch_theme("altrow") == theme
+        assert num_scan == 2
+
+    def test_normal_entry_point(self, monkeypatch, theme_cache):
+        plugin = types.SimpleNamespace(style_filter=lambda cell, **kwargs: None)
+        entry_point = importlib.metadata.EntryPoint(
+            name="example",
+            value="example_module:plugin",
+            group=theme_module.PLUGIN_ENTRY_POINT_GROUP,
+        )
+        monkeypatch.setattr(theme_module, "_iter_theme_entry_points", lambda: [entry_point])
+        monkeypatch.setattr(importlib.metadata.EntryPoint, "load", lambda self: plugin)
+
+        theme = fetch_theme("example")
+        assert theme.style_filter is plugin.style_filter
+        assert theme.col_separator_style_filter is None
+        assert "pytablewriter_example_theme" in list_themes()
+
+    @pytest.mark.parametrize(
+        ["value"],
+        [
+            ["pytablewriter_not_existing_module:plugin"],
+            ["pytablewriter.style._theme:not_existing_plugin"],
+        ],
+    )
+    def test_normal_broken_entry_point(self, monkeypatch, theme_cache, value):
+        entry_point = importlib.metadata.EntryPoint(
+            name="broken", value=value, group=theme_module.PLUGIN_ENTRY_POINT_GROUP
+        )
+        monkeypatch.setattr(theme_module, "_iter_theme_entry_points", lambda: [entry_point])
+
+        # entry points that fail to load are skipped
+        assert "pytablewriter_broken_theme" not in list_themes()
+        with pytest.raises(RuntimeError):
+            fetch_theme("broken")
+
+    def test_exception_entry_point(self, monkeypatch, theme_cache):
+        def load(self):
+            raise ZeroDivisionError()
+
+        entry_point = importlib.metadata.EntryPoint(
+            name="error", value="example_module:plugin", group=theme_module.PLUGIN_ENTRY_POINT_GROUP
+        )
+        monkeypatch.setattr(theme_module, "_iter_theme_entry_points", lambda: [entry_point])
+        monkeypatch.setattr(importlib.metadata.EntryPoint, "load", load)
+
+        # errors of plugins other than loading failures are not hidden
+        with pytest.raises(ZeroDivisionError):
+            list_themes()
+
+    def test_exception(self, theme_cache):
+        with pytest.raises(RuntimeError):
+            fetch_theme("not_existing_theme")
@@ -2,14 +2,18 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import io
 import itertools
 import sys
+from concurrent import futures
 
 import pytest
 
 import pytablewriter as ptw
 from pytablewriter.typehint import Integer
 
+from ._common import print_test_result
+
 
 class Test_WriterFactory_get_format_names:
     def test_normal(self):
@@ -313,3 +317,169 @@ class Test_FileLoaderFactory_create_from_format_name:
     def test_exception(self, format_name, expected):
         with pytest.raises(expected):
             ptw.TableWriterFactory.create_from_format_name(format_name)
+
+
+class Test_WriterFactory_create_pool_from_format_name:
+    @pytest.mark.parametrize(
+        ["format_name", "expected"],
+        [
+            ["csv", ptw.CsvTableWriter],
+            ["Markdown", ptw.MarkdownTableWriter],
+            ["json", ptw.JsonTableWriter],
+            ["null", ptw.NullTableWriter],
+            ["excel", ptw.ExcelXlsxTableWriter],
+        ],
+    )
+    def test_normal(self, format_name, expected):
+        pool = ptw.TableWriterFactory.create_pool_from_format_name(
+            format_name, pool_size=2, table_name="dummy", headers=["a", "b"]
+        )
+
+        writers = [pool.acquire() for _ in range(3)]
+        assert all(isinstance(writer, expected) for writer in writers)
+        assert len({id(writer) for writer in writers}) == 3
+        assert all(writer.table_name == "dummy" for writer in writers)
+        assert all(writer.headers == ["a", "b"] for writer in writers)
+
+        for writer in writers:
+            pool.release(writer)
+
+        # writers are recycled up to the pool size
+        assert pool.num_idle_writers == 2
+        assert pool.acquire() in writers
+
+    @pytest.mark.parametrize(
+        ["format_name", "pool_size", "expected"],
+        [
+            ["not_exist_format", 1, ptw.WriterNotFoundError],
+            ["csv", -1, ValueError],
+        ],
+    )
+    def test_exception(self, format_name, pool_size, expected):
+        with pytest.raises(expected):
+            ptw.TableWriterFactory.create_pool_from_format_name(format_name, pool_size=pool_size)
+
+
+class Test_WriterFactory_create_pool_from_file_extension:
+    def test_normal(self):
+        pool = ptw.TableWriterFactory.create_pool_from_file_extension("output.md", margin=1)
+
+        with pool.borrow() as writer:
+            assert isinstance(writer, ptw.MarkdownTableWriter)
+            assert writer.margin == 1
+
+        assert pool.num_idle_writers == 1
+
+    def test_exception(self):
+        with pytest.raises(ptw.WriterNotFoundError):
+            ptw.TableWriterFactory.create_pool_from_file_extension("output.not_exist")
+
+
+class Test_TableWriterPool:
+    def test_normal_recycle(self):
+        prototype = ptw.MarkdownTableWriter(table_name="pool", headers=["a", "b"], margin=1)
+        pool = ptw.TableWriterPool(prototype)
+
+        # changes to the prototype after the pool creation do not affect the pool
+        prototype.margin = 2
+
+        with pool.borrow() as writer:
+            writer.table_name = "changed"
+            writer.headers = ["x", "y", "z"]
+            writer.value_matrix = [[1, 2, 3]]
+            writer.stream = io.StringIO()
+            writer.write_table()
+            first_output = writer.stream.getvalue()
+
+        # data of the previous table are cleared when a writer is released
+        with pool.borrow() as recycled_writer:
+            assert recycled_writer is writer
+            assert recycled_writer.table_name == "pool"
+            assert recycled_writer.headers == ["a", "b"]
+            assert recycled_writer.value_matrix == []
+
+            recycled_writer.table_name = "changed"
+            recycled_writer.headers = ["x", "y", "z"]
+            recycled_writer.value_matrix = [[1, 2, 3]]
+            output = recycled_writer.dumps()
+
+        expected = ptw.MarkdownTableWriter(
+            table_name="changed", headers=["x", "y", "z"], value_matrix=[[1, 2, 3]], margin=1
+        ).dumps()
+
+        print_test_result(expected=expected, actual=output)
+        assert output == expected
+        assert first_output == expected
+
+    def test_normal_write_table(self, capsys):
+        pool = ptw.TableWriterFactory.create_pool_from_format_name("csv")
+
+        for _ in range(2):
+            # writers write to the stream of the prototype
+            with pool.borrow() as writer:
+                writer.headers = ["a"]
+                writer.value_matrix = [[1]]
+                writer.write_table()
+
+            out, _err = capsys.readouterr()
+            assert out == '"a"\n1\n'
+
+    def test_normal_reset_table_attrs(self):
+        pool = ptw.TableWriterFactory.create_pool_from_format_name("markdown", margin=1)
+        stream = io.StringIO()
+        callbacks = []
+
+        with pool.borrow() as writer:
+            writer.from_writer(
+                ptw.MarkdownTableWriter(
+                    headers=["a"],
+                    value_matrix=[[1]],
+                    margin=3,
+                    column_styles=[ptw.style.Style(align="center")],
+                )
+            )
+            writer.stream = stream
+            writer.iteration_length = 3
+            writer.write_callback = lambda iter_count, iteration_length: callbacks.append(
+                iter_count
+            )
+            writer.add_style_filter(lambda cell, **kwargs: None)
+
+        # attributes of the previous table are restored to the values of the prototype
+        with pool.borrow() as recycled_writer:
+            assert recycled_writer is writer
+            assert recycled_writer.stream is sys.stdout
+            assert recycled_writer.margin == 1
+            assert recycled_writer.iteration_length == -1
+            assert recycled_writer.column_styles == []
+            assert len(recycled_writer._style_filters) == len(pool.acquire()._style_filters)
+
+            recycled_writer.headers = ["a"]
+            recycled_writer.value_matrix = [[[1]], [[2]]]
+            recycled_writer.iteration_length = 2
+            recycled_writer.stream = io.StringIO()
+            recycled_writer.write_table_iter()
+
+        assert callbacks == []
+
+    def test_normal_concurrent(self):
+        pool = ptw.TableWriterFactory.create_pool_from_format_name("csv", pool_size=4)
+
+        def render(value: int) -> str:
+            with pool.borrow() as writer:
+                writer.headers = ["value"]
+                writer.value_matrix = [[value]]
+
+                return writer.dumps()
+
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(executor.map(render, range(50)))
+
+        assert outputs == [f'"value"\n{value}\n' for value in range(50)]
+        assert pool.num_idle_writers <= 4
+
+    def test_exception(self):
+        pool = ptw.TableWriterPool(ptw.CsvTableWriter())
+
+        with pytest.raises(TypeError):
+            pool.release(ptw.MarkdownTableWriter())
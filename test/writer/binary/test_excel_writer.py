@@ -4,6 +4,8 @@
 
 import collections
 import itertools
+import re
+import zipfile
 from decimal import Decimal
 
 import pytest
@@ -301,3 +303,51 @@ class Test_ExcelTableWriter_dumps:
 
             with pytest.raises(NotImplementedError):
                 writer.dumps()
+
+
+class Test_ExcelXlsxTableWriter_constant_memory:
+    @staticmethod
+    def read_sheet_rows(file_path: str) -> list[str]:
+        with zipfile.ZipFile(file_path) as workbook:
+            sheet_xml = workbook.read("xl/worksheets/sheet1.xml").decode()
+
+        return re.findall(r"<row [^>]*>.*?</row>", sheet_xml)
+
+    @pytest.mark.parametrize(["constant_memory"], [[False], [True]])
+    def test_normal_write_table_iter(self, tmpdir, constant_memory):
+        test_file_path = str(tmpdir.join("test.xlsx"))
+        num_rows = 10
+
+        writer = ptw.ExcelXlsxTableWriter(constant_memory=constant_memory)
+        writer.open(test_file_path)
+        writer.make_worksheet("rows")
+        writer.headers = ["id", "value", "name"]
+        writer.value_matrix = ([i, i * 0.25, f"name{i}"] for i in range(num_rows))
+        writer.write_table_iter(warmup_rows=3)
+        writer.close()
+
+        assert writer.last_data_row == num_rows + 1
+
+        rows = self.read_sheet_rows(test_file_path)
+        assert [re.search(r'r="(\d+)"', row).group(1) for row in rows] == [
+            str(row_idx) for row_idx in range(1, num_rows + 2)
+        ]
+
+        # strings are written inline in the constant memory mode
+        assert ("<t>name9</t>" in rows[-1]) == constant_memory
+
+        # cells after the warm-up rows use the number formats of the warm-up rows
+        data_cell_styles = [re.findall(r' s="(\d+)"', row) for row in rows[1:]]
+        assert all(styles == data_cell_styles[0] for styles in data_cell_styles)
+
+    def test_normal_dump(self, tmpdir):
+        test_file_path = str(tmpdir.join("test.xlsx"))
+
+        writer = ptw.ExcelXlsxTableWriter(
+            headers=["a", "b"], value_matrix=[[1, 1.1], [2, 2.2]], constant_memory=True
+        )
+        writer.dump(test_file_path)
+
+        rows = self.read_sheet_rows(test_file_path)
+        assert len(rows) == 3
+        assert "<t>a</t>" in rows[0]
@@ -0,0 +1,108 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+from pytablewriter import TableWriterFactory
+from pytablewriter.style import Style
+
+from .._common import print_test_result
+
+
+class Test_append_rows:
+    @pytest.mark.parametrize(
+        ["format_name", "append_rows", "expected_incremental", "expected_phases"],
+        [
+            ["markdown", [[3, 0.3, "c"]], True, ["write"]],
+            ["markdown", [{"int": 3, "float": 0.3, "str": "c"}], True, ["write"]],
+            [
+                "markdown",
+                [[333333, 0.3, "c"]],
+                False,
+                ["table_property", "header", "value_matrix", "write"],
+            ],
+            [
+                "markdown",
+                [[3, 0.333, "c"]],
+                False,
+                ["table_property", "header", "value_matrix", "write"],
+            ],
+            [
+                "markdown",
+                [["text", 0.3, "c"]],
+                False,
+                ["table_property", "header", "value_matrix", "write"],
+            ],
+            ["unicode", [[3, 0.3, "c"]], True, ["write"]],
+            ["csv", [[3, 0.3, "c"]], True, ["write"]],
+        ],
+    )
+    def test_normal_append_rows(
+        self, format_name, append_rows, expected_incremental, expected_phases
+    ):
+        headers = ["int", "float", "str"]
+        value_matrix = [[1, 1.1, "a"], [22, 2.2, "bb"]]
+        writer = TableWriterFactory.create_from_format_name(
+            format_name=format_name,
+            headers=headers,
+            value_matrix=value_matrix,
+            column_styles=[None, Style(thousand_separator=","), None],
+            enable_write_stats=True,
+        )
+        writer.dumps()
+
+        assert writer.append_rows(append_rows) == expected_incremental
+
+        output = writer.dumps()
+        assert list(writer.last_write_stats.phases) == expected_phases
+        assert writer.value_matrix == value_matrix + append_rows
+        assert (
+            output
+            == TableWriterFactory.create_from_format_name(
+                format_name=format_name,
+                headers=headers,
+                value_matrix=value_matrix + append_rows,
+                column_styles=[None, Style(thousand_separator=","), None],
+            ).dumps()
+        )
+
+    def test_normal_append_rows_before_write(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown", headers=["A", "B"], value_matrix=[[1, 2]]
+        )
+
+        assert writer.append_rows([[3, 4]]) is False
+        assert writer.append_rows([]) is True
+        assert writer.value_matrix == [[1, 2], [3, 4]]
+
+    def test_normal_append_rows_in_place(self):
+        value_matrix = [[1, 2]]
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown", headers=["A", "B"], value_matrix=value_matrix
+        )
+        writer.dumps()
+
+        # the value matrix of the caller is copied once, and the copy is extended in place
+        assert writer.append_rows([[3, 4]]) is True
+        appended_value_matrix = writer.value_matrix
+        table_value_matrix = writer._table_value_matrix
+        assert value_matrix == [[1, 2]]
+
+        assert writer.append_rows([[5, 6]]) is True
+        assert writer.value_matrix is appended_value_matrix
+        assert writer._table_value_matrix is table_value_matrix
+        assert writer.value_matrix == [[1, 2], [3, 4], [5, 6]]
+
+        # matrices shared with another writer are not extended in place
+        other_writer = TableWriterFactory.create_from_format_name(format_name="markdown")
+        other_writer.from_writer(writer)
+        expected = other_writer.dumps()
+
+        assert writer.append_rows([[7, 8]]) is True
+        output = other_writer.dumps()
+        print_test_result(expected=expected, actual=output)
+
+        assert output == expected
+        assert other_writer.value_matrix == [[1, 2], [3, 4], [5, 6]]
+        assert writer.value_matrix == [[1, 2], [3, 4], [5, 6], [7, 8]]
@@ -0,0 +1,81 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import io
+
+import pytest
+
+from pytablewriter import TableWriterFactory
+
+from .._common import print_test_result
+
+
+class Test_from_arrow:
+    @pytest.mark.parametrize(["max_chunksize"], [[2], [100]])
+    def test_normal_from_arrow(self, max_chunksize):
+        pa = pytest.importorskip("pyarrow")
+
+        headers = ["int", "float", "str", "nullable", "nullable_str"]
+        value_matrix = [
+            [1, 0.5, "a", 1, "x"],
+            [-20, 1.25, "bb", None, None],
+            [300, -0.125, "ccc", 3, "zz"],
+        ]
+        table = pa.table(
+            {header: list(column) for header, column in zip(headers, zip(*value_matrix))}
+        )
+
+        expected_writer = TableWriterFactory.create_from_format_name(
+            format_name="csv", headers=headers, value_matrix=value_matrix
+        )
+        expected = expected_writer.dumps()
+
+        for data in (
+            table,
+            table.to_batches(max_chunksize=max_chunksize),
+            iter(table.to_batches(max_chunksize=max_chunksize)),
+        ):
+            writer = TableWriterFactory.create_from_format_name(format_name="csv")
+            writer.from_arrow(data)
+            writer.stream = io.StringIO()
+            writer.write_table_iter()
+            output = writer.stream.getvalue()
+            print_test_result(expected=expected, actual=output)
+
+            assert writer.headers == headers
+            assert output == expected
+
+        # all of the record batches are written as a table
+        for format_name in ("csv", "json", "markdown"):
+            expected = TableWriterFactory.create_from_format_name(
+                format_name=format_name, headers=headers, value_matrix=value_matrix
+            ).dumps()
+
+            for data in (table, iter(table.to_batches(max_chunksize=max_chunksize))):
+                writer = TableWriterFactory.create_from_format_name(format_name=format_name)
+                writer.from_arrow(data)
+                output = writer.dumps()
+                print_test_result(expected=expected, actual=output)
+
+                assert output == expected
+                assert writer.dumps() == expected
+
+    def test_normal_write_table_iter_indefinite_length(self):
+        def write(iteration_length):
+            writer = TableWriterFactory.create_from_format_name(
+                format_name="json", table_name="iter", headers=["A", "B"]
+            )
+            writer.value_matrix = ([[i, i * 10]] for i in range(3))
+            writer.iteration_length = iteration_length
+            writer.stream = io.StringIO()
+            writer.write_table_iter()
+
+            return writer.stream.getvalue()
+
+        expected = write(iteration_length=3)
+        output = write(iteration_length=-1)
+        print_test_result(expected=expected, actual=output)
+
+        # the final iteration is found without the iteration length
+        assert output == expected
@@ -0,0 +1,129 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import json
+from textwrap import dedent
+
+import pytest
+
+import pytablewriter.writer._table_writer as table_writer_module
+from pytablewriter import TableWriterFactory
+from pytablewriter.style import Style
+
+from .._common import print_test_result
+
+
+class Test_ColumnarValueStore:
+    def test_normal_columnar_value_store(self, monkeypatch):
+        monkeypatch.setattr(table_writer_module, "_DP_CHUNK_SIZE", 2)
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["real", "str", "bool"],
+            value_matrix=[[0.5, "a", True], [-0.5, "a", 1], [0.5, "b", True], [0.5, "a", True]],
+            margin=1,
+        )
+        expected = dedent(
+            """\
+            | real | str | bool |
+            | ---: | --- | ---- |
+            |  0.5 | a   | True |
+            | -0.5 | a   |    1 |
+            |  0.5 | b   | True |
+            |  0.5 | a   | True |
+            """
+        )
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+
+        assert output == expected
+
+        store = writer._table_value_dp_matrix.store
+        assert store.num_cells == 12
+        assert store.num_unique_cells == 6
+        assert len(writer._table_value_dp_matrix) == 4
+        assert [dp.data for dp in writer._table_value_dp_matrix[1]] == [-0.5, "a", 1]
+        assert writer._table_value_dp_matrix[0][0] is writer._table_value_dp_matrix[2][0]
+
+    @pytest.mark.parametrize(
+        ["column_styles"],
+        [
+            [[]],
+            [[Style(), Style(thousand_separator=",")]],
+        ],
+    )
+    def test_normal_columnar_value_store_mixed_types(self, monkeypatch, column_styles):
+        monkeypatch.setattr(table_writer_module, "_DP_CHUNK_SIZE", 2)
+
+        value_matrix = [
+            ["abc", 1],
+            ["abc", "1"],
+            ["1", "01"],
+            ["01", ""],
+            ["1.00", None],
+            [1, "1.00"],
+            [None, 1],
+            ["", "01"],
+        ]
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["str", "int"],
+            value_matrix=value_matrix,
+            column_styles=column_styles,
+            margin=1,
+        )
+        expected = dedent(
+            """\
+            | str  | int |
+            | ---- | --: |
+            | abc  |   1 |
+            | abc  |   1 |
+            | 1    |   1 |
+            | 01   |     |
+            | 1.00 |     |
+            |    1 |   1 |
+            |      |   1 |
+            |      |   1 |
+            """
+        )
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+
+        assert output == expected
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="json", headers=["str", "int"], value_matrix=value_matrix
+        )
+        assert [row["str"] for row in json.loads(writer.dumps())] == [
+            "abc",
+            "abc",
+            "1",
+            "01",
+            "1.00",
+            1,
+            None,
+            "",
+        ]
+
+    def test_normal_columnar_value_store_unshared_data(self):
+        values = [1, 2]
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["list", "str"],
+            value_matrix=[[values, "a"], [values, "a"]],
+        )
+        writer.dumps()
+
+        # mutable data are not shared between cells
+        dp_matrix = writer._table_value_dp_matrix
+        assert dp_matrix[0][0] is not dp_matrix[1][0]
+        assert dp_matrix[0][1] is dp_matrix[1][1]
+        assert dp_matrix.store.num_unique_cells == 3
+
+        output = TableWriterFactory.create_from_format_name(
+            format_name="yaml", headers=["a", "b"], value_matrix=[[values, "x"], [values, "x"]]
+        ).dumps()
+        print_test_result(expected="", actual=output)
+
+        assert "&" not in output
@@ -2,6 +2,7 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import asyncio
 import collections
 import datetime
 import json
@@ -9,6 +10,13 @@ from decimal import Decimal
 
 import elasticsearch
 import pytest
+from elastic_transport import (
+    ApiResponseMeta,
+    HttpHeaders,
+    NodeConfig,
+    ObjectApiResponse,
+    TransportApiResponse,
+)
 
 import pytablewriter as ptw
 
@@ -32,6 +40,63 @@ exception_test_data_list = [
 table_writer_class = ptw.ElasticsearchWriter
 
 
+def make_index_creation_transport(
+    error_type="resource_already_exists_exception", existing_indices=()
+):
+    """
+    Make a ``perform_request`` function of a transport that responds to index creation requests
+    as Elasticsearch: creating an existing index fails with the ``error_type`` error.
+    """
+
+    created_indices = list(existing_indices)
+
+    def perform_request(method, path, **kwargs):
+        index = path.strip("/")
+        if index in created_indices:
+            status = 400
+            body = {
+                "error": {
+                    "root_cause": [{"type": error_type, "reason": f"index [{index}] error"}],
+                    "type": error_type,
+                    "reason": f"index [{index}] error",
+                },
+                "status": status,
+            }
+        else:
+            created_indices.append(index)
+            status = 200
+            body = {"acknowledged": True, "shards_acknowledged": True, "index": index}
+
+        meta = ApiResponseMeta(
+            status=status,
+            http_version="1.1",
+            headers=HttpHeaders({"x-elastic-product": "Elasticsearch"}),
+            duration=0.0,
+            node=NodeConfig("http", "localhost", 9200),
+        )
+
+        return TransportApiResponse(meta, body)
+
+    return created_indices, perform_request
+
+
+def bulk_response(documents):
+    items = [
+        {"index": {"status": 400, "error": {"type": "mapper_parsing_exception"}}}
+        if document["name"] == "invalid"
+        else {"index": {"status": 201}}
+        for document in documents
+    ]
+
+    return ObjectApiResponse(
+        body={
+            "errors": any(document["name"] == "invalid" for document in documents),
+            "items": items,
+        },
+        meta=None,
+    )
+
+
 class Test_ElasticsearchWriter__get_mappings:
     def test_normal(self):
         writer = table_writer_class()
@@ -200,3 +265,211 @@ class Test_ElasticsearchWriter_write_table:
 
         with pytest.raises(expected):
             writer.write_table()
+
+    @pytest.mark.parametrize(
+        ["bulk_chunk_size", "bulk_thread_count", "refresh", "expected_num_requests"],
+        [
+            [500, 1, None, 1],
+            [2, 1, "wait_for", 3],
+            [2, 2, True, 3],
+        ],
+    )
+    def test_normal_bulk(
+        self, monkeypatch, bulk_chunk_size, bulk_thread_count, refresh, expected_num_requests
+    ):
+        bulk_requests = []
+
+        def bulk(self, *args, operations, **kwargs):
+            documents = [json.loads(source) for source in operations[1::2]]
+            bulk_requests.append((documents, kwargs))
+            items = [
+                {"index": {"status": 400, "error": {"type": "mapper_parsing_exception"}}}
+                if document["name"] == "invalid"
+                else {"index": {"status": 201}}
+                for document in documents
+            ]
+
+            return ObjectApiResponse(
+                body={
+                    "errors": any(document["name"] == "invalid" for document in documents),
+                    "items": items,
+                },
+                meta=None,
+            )
+
+        monkeypatch.setattr(elasticsearch.Elasticsearch, "bulk", bulk)
+
+        writer = table_writer_class(
+            table_name="bulk",
+            headers=["id", "name"],
+            value_matrix=[[1, "a"], [2, "b"], [3, "invalid"], [4, "c"], [5, "d"]],
+            bulk_chunk_size=bulk_chunk_size,
+            bulk_thread_count=bulk_thread_count,
+            refresh=refresh,
+        )
+        writer.stream = elasticsearch.Elasticsearch("http://localhost:9200")
+        monkeypatch.setattr(writer.stream.indices, "create", lambda **kwargs: {})
+        writer.write_table()
+
+        assert len(bulk_requests) == expected_num_requests
+        assert [document["id"] for documents, _ in bulk_requests for document in documents] == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+        for _, kwargs in bulk_requests:
+            assert kwargs.get("refresh") == refresh
+
+        assert len(writer.failed_documents) == 1
+        failed_document = writer.failed_documents[0]
+        assert failed_document.row == 2
+        assert failed_document.document == {"id": 3, "name": "invalid"}
+        assert failed_document.status == 400
+        assert failed_document.error == {"type": "mapper_parsing_exception"}
+
+    def test_normal_bulk_iter(self, monkeypatch):
+        def bulk(self, *args, operations, **kwargs):
+            return bulk_response([json.loads(source) for source in operations[1::2]])
+
+        monkeypatch.setattr(elasticsearch.Elasticsearch, "bulk", bulk)
+
+        writer = table_writer_class(table_name="bulk", headers=["id", "name"])
+        writer.value_matrix = [
+            [[1, "a"], [2, "invalid"]],
+            [[3, "b"], [4, "invalid"]],
+            [[5, "invalid"]],
+        ]
+        writer.iteration_length = 3
+        writer.stream = elasticsearch.Elasticsearch("http://localhost:9200")
+        created_indices, perform_request = make_index_creation_transport()
+        monkeypatch.setattr(writer.stream.transport, "perform_request", perform_request)
+        writer.write_table_iter()
+
+        # the index is created only by the first iteration
+        assert created_indices == ["bulk"]
+
+        # row indices are the indices in all of the iterations
+        assert [failed_document.row for failed_document in writer.failed_documents] == [1, 3, 4]
+        assert [failed_document.document["id"] for failed_document in writer.failed_documents] == [
+            2,
+            4,
+            5,
+        ]
+
+    def test_normal_existing_index(self, monkeypatch):
+        def bulk(self, *args, operations, **kwargs):
+            return bulk_response([json.loads(source) for source in operations[1::2]])
+
+        monkeypatch.setattr(elasticsearch.Elasticsearch, "bulk", bulk)
+
+        writer = table_writer_class(
+            table_name="bulk", headers=["id", "name"], value_matrix=[[1, "a"], [2, "b"]]
+        )
+        writer.stream = elasticsearch.Elasticsearch("http://localhost:9200")
+        created_indices, perform_request = make_index_creation_transport()
+        monkeypatch.setattr(writer.stream.transport, "perform_request", perform_request)
+
+        # creating the existing index by the second write fails and is ignored
+        for _ in range(2):
+            writer.write_table()
+            assert writer.failed_documents == []
+        assert created_indices == ["bulk"]
+
+        # other errors of the index creation are raised
+        _, perform_request = make_index_creation_transport(
+            error_type="illegal_argument_exception", existing_indices=["bulk"]
+        )
+        monkeypatch.setattr(writer.stream.transport, "perform_request", perform_request)
+        with pytest.raises(elasticsearch.BadRequestError):
+            writer.write_table()
+
+    def test_normal_write_table_async(self, monkeypatch):
+        pytest.importorskip("aiohttp")
+
+        bulk_requests = []
+
+        async def bulk(self, *args, operations, **kwargs):
+            documents = [json.loads(source) for source in operations[1::2]]
+            bulk_requests.append(documents)
+            items = [
+                {"index": {"status": 400, "error": {"type": "mapper_parsing_exception"}}}
+                if document["name"] == "invalid"
+                else {"index": {"status": 201}}
+                for document in documents
+            ]
+
+            return ObjectApiResponse(
+                body={
+                    "errors": any(document["name"] == "invalid" for document in documents),
+                    "items": items,
+                },
+                meta=None,
+            )
+
+        async def create(**kwargs):
+            return {}
+
+        monkeypatch.setattr(elasticsearch.AsyncElasticsearch, "bulk", bulk)
+
+        writer = table_writer_class(
+            table_name="bulk",
+            headers=["id", "name"],
+            value_matrix=[[1, "a"], [2, "b"], [3, "invalid"], [4, "c"], [5, "d"]],
+            bulk_chunk_size=2,
+        )
+
+        # the stream must be an AsyncElasticsearch instance
+        writer.stream = elasticsearch.Elasticsearch("http://localhost:9200")
+        with pytest.raises(ValueError):
+            asyncio.run(writer.write_table_async())
+
+        writer.stream = elasticsearch.AsyncElasticsearch("http://localhost:9200")
+        monkeypatch.setattr(writer.stream.indices, "create", create)
+        asyncio.run(writer.write_table_async(is_preprocess_in_executor=True))
+
+        assert [[document["id"] for document in documents] for documents in bulk_requests] == [
+            [1, 2],
+            [3, 4],
+            [5],
+        ]
+        assert len(writer.failed_documents) == 1
+        assert writer.failed_documents[0].row == 2
+        assert writer.failed_documents[0].document == {"id": 3, "name": "invalid"}
+
+    @pytest.mark.parametrize(
+        ["error_type", "expected"],
+        [
+            ["resource_already_exists_exception", None],
+            ["illegal_argument_exception", elasticsearch.BadRequestError],
+        ],
+    )
+    def test_normal_write_table_async_existing_index(self, monkeypatch, error_type, expected):
+        pytest.importorskip("aiohttp")
+
+        async def bulk(self, *args, operations, **kwargs):
+            return bulk_response([json.loads(source) for source in operations[1::2]])
+
+        _, sync_perform_request = make_index_creation_transport(
+            error_type=error_type, existing_indices=["bulk"]
+        )
+
+        async def perform_request(method, path, **kwargs):
+            return sync_perform_request(method, path, **kwargs)
+
+        monkeypatch.setattr(elasticsearch.AsyncElasticsearch, "bulk", bulk)
+
+        writer = table_writer_class(
+            table_name="bulk", headers=["id", "name"], value_matrix=[[1, "a"], [2, "b"]]
+        )
+        writer.stream = elasticsearch.AsyncElasticsearch("http://localhost:9200")
+        monkeypatch.setattr(writer.stream.transport, "perform_request", perform_request)
+
+        if expected is None:
+            asyncio.run(writer.write_table_async())
+            assert writer.failed_documents == []
+            return
+
+        with pytest.raises(expected):
+            asyncio.run(writer.write_table_async())
@@ -0,0 +1,45 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+from dataproperty import DataProperty, DataPropertyExtractor
+from typepy import Integer, RealNumber
+
+from pytablewriter.writer._numeric import NumericDataProperty, is_same_dp, to_numeric_dp_list
+
+
+np = pytest.importorskip("numpy")
+
+
+class Test_to_numeric_dp_list:
+    @pytest.mark.parametrize(
+        ["values", "dtype", "type_hint"],
+        [
+            [[0, 1, -1, 12345, -(2**63)], "int64", Integer],
+            [[0, 1, 2**64 - 1], "uint64", Integer],
+            [[0.5, -1.25, 3.0, -0.0, 1e-5, 123456.789], "float64", RealNumber],
+        ],
+    )
+    def test_normal(self, values, dtype, type_hint):
+        dp_list, rep_rows = to_numeric_dp_list(np.array(values, dtype=dtype))
+        extractor = DataPropertyExtractor()
+        extractor.type_hints = [type_hint]
+        expected_dp_list = [
+            dp_list_row[0] for dp_list_row in extractor.to_dp_matrix([[value] for value in values])
+        ]
+
+        for value_dp, expected_dp in zip(dp_list, expected_dp_list):
+            assert isinstance(value_dp, NumericDataProperty)
+            assert not isinstance(value_dp, DataProperty)
+            assert is_same_dp(value_dp, expected_dp), f"{value_dp!r} != {expected_dp!r}"
+            assert value_dp.get_padding_len(10) == expected_dp.get_padding_len(10)
+            assert value_dp.no_ansi_escape_dp is None
+
+        assert rep_rows
+
+    def test_normal_not_converted(self):
+        dp_list, _ = to_numeric_dp_list(np.array([1.5, float("nan"), float("inf"), 1e20]))
+
+        assert isinstance(dp_list[0], NumericDataProperty)
+        assert dp_list[1:] == [None, None, None]
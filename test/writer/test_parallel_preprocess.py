@@ -0,0 +1,85 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from concurrent import futures
+from typing import Optional
+
+import pytest
+
+import pytablewriter.writer._table_writer as table_writer_module
+from pytablewriter import TableWriterFactory
+from pytablewriter.style import Cell, Style
+from pytablewriter.writer import AbstractTableWriter
+
+
+def even_row_style_filter(cell: Cell, **kwargs) -> Optional[Style]:
+    if cell.is_header_row() or cell.row % 2:
+        return None
+
+    return Style(font_weight="bold")
+
+
+class Test_parallel_preprocess:
+    @pytest.mark.parametrize(
+        ["format_name"],
+        [
+            ["html"],
+            ["latex_table"],
+            ["markdown"],
+            ["unicode"],
+        ],
+    )
+    def test_normal_parallel_preprocess(self, monkeypatch, format_name):
+        def make_writer():
+            writer = TableWriterFactory.create_from_format_name(
+                format_name=format_name,
+                headers=["int", "float", "str"],
+                value_matrix=[[i, i * 0.5, f"text{i}"] for i in range(20)],
+                column_styles=[Style(thousand_separator=","), None, Style(align="center")],
+            )
+            writer.add_style_filter(even_row_style_filter)
+
+            return writer
+
+        expected = make_writer().dumps()
+
+        monkeypatch.setattr(table_writer_module, "_MIN_PARALLEL_ROWS", 2)
+        monkeypatch.setattr(
+            AbstractTableWriter, "max_workers", property(lambda self: 3, lambda self, value: None)
+        )
+        submitted_start_rows = []
+
+        class RecordingExecutor(futures.ProcessPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted_start_rows.append(args[1])
+                return super().submit(fn, *args, **kwargs)
+
+        monkeypatch.setattr(futures, "ProcessPoolExecutor", RecordingExecutor)
+
+        assert make_writer().dumps() == expected
+        assert submitted_start_rows == [0, 7, 14]
+
+    def test_normal_parallel_preprocess_fallback(self, monkeypatch):
+        def make_writer():
+            writer = TableWriterFactory.create_from_format_name(
+                format_name="markdown",
+                headers=["A", "B"],
+                value_matrix=[[i, f"value{i}"] for i in range(10)],
+            )
+            # lambda style filters cannot be sent to worker processes
+            writer.add_style_filter(
+                lambda cell, **kwargs: Style(font_weight="bold") if cell.col == 0 else None
+            )
+
+            return writer
+
+        expected = make_writer().dumps()
+
+        monkeypatch.setattr(table_writer_module, "_MIN_PARALLEL_ROWS", 2)
+        monkeypatch.setattr(
+            AbstractTableWriter, "max_workers", property(lambda self: 2, lambda self, value: None)
+        )
+        monkeypatch.setattr(futures, "ProcessPoolExecutor", None)
+
+        assert make_writer().dumps() == expected
@@ -0,0 +1,222 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from textwrap import dedent
+
+import pytest
+from typepy import Typecode
+
+from pytablewriter import TableWriterFactory
+
+from .._common import print_test_result
+
+
+class Test_schema:
+    @pytest.mark.parametrize(
+        ["format_name", "overflow"],
+        [
+            [format_name, overflow]
+            for format_name in ["csv", "markdown", "unicode"]
+            for overflow in ["extend", "error"]
+        ],
+    )
+    def test_normal_schema(self, format_name, overflow):
+        value_matrix = [
+            [1, -1.25, "a", None],
+            [22, 3.5, "bbbb", "2017-01-01 00:00:00"],
+        ]
+        writer = TableWriterFactory.create_from_format_name(
+            format_name, headers=["int", "float", "str", "mix"], value_matrix=value_matrix
+        )
+        expected = writer.dumps()
+        schema = writer.dumps_schema()
+
+        writer = TableWriterFactory.create_from_format_name(format_name, value_matrix=value_matrix)
+        writer.load_schema(schema, overflow=overflow)
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+
+        assert writer.headers == ["int", "float", "str", "mix"]
+        assert output == expected
+        assert writer.dumps_schema() == schema
+
+    def test_normal_schema_string_column(self):
+        writer = TableWriterFactory.create_from_format_name(
+            "markdown", headers=["c"], value_matrix=[["x"]]
+        )
+        expected = writer.dumps()
+        schema = writer.dumps_schema()
+        assert '"type": "STRING"' in schema
+
+        writer.load_schema(schema, overflow="error")
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+
+        assert output == expected
+        assert writer._column_dp_list[0].typecode == Typecode.STRING
+
+    def test_normal_schema_pinned(self):
+        writer = TableWriterFactory.create_from_format_name(
+            "markdown",
+            headers=["int", "float", "str"],
+            value_matrix=[[1000, -1.25, "abcdef"], [22, 3.5, "b"]],
+        )
+        schema = writer.dumps_schema()
+
+        # narrower values are written with the column properties of the schema
+        writer.value_matrix = [[1, 0.5, "a"]]
+        writer.load_schema(schema)
+        expected = dedent(
+            """\
+            |int |float| str  |
+            |---:|----:|------|
+            |   1| 0.50|a     |
+            """
+        )
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+        assert output == expected
+
+    @pytest.mark.parametrize(
+        ["overflow", "expected"],
+        [
+            [
+                "extend",
+                dedent(
+                    """\
+                    | int |float| str  |
+                    |----:|----:|------|
+                    |12345|0.125|abcdef|
+                    """
+                ),
+            ],
+            [
+                "ignore",
+                dedent(
+                    """\
+                    |int|float|str|
+                    |--:|----:|---|
+                    |12345|  0.1|abcdef|
+                    """
+                ),
+            ],
+            ["error", ValueError],
+        ],
+    )
+    def test_normal_schema_overflow(self, overflow, expected):
+        writer = TableWriterFactory.create_from_format_name(
+            "markdown", headers=["int", "float", "str"], value_matrix=[[1, 0.5, "a"]]
+        )
+        schema = writer.dumps_schema()
+
+        writer.value_matrix = [[12345, 0.125, "abcdef"]]
+        writer.load_schema(schema, overflow=overflow)
+
+        if expected is ValueError:
+            with pytest.raises(ValueError):
+                writer.dumps()
+            return
+
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+        assert output == expected
+
+        writer.load_schema(None)
+        assert writer.dumps() == dedent(
+            """\
+            | int |float| str  |
+            |----:|----:|------|
+            |12345|0.125|abcdef|
+            """
+        )
+
+    @pytest.mark.parametrize(
+        ["value_matrix", "expected"],
+        [
+            [[[3, 0.5, "ab"], [None, 2, ""]], []],
+            [[[2.5, 0.5, "ab"]], ["int"]],
+            [[[1, 0.125, "ab"]], ["float"]],
+            [[[1, 10000.5, "abcd"]], ["float", "str"]],
+            [[["x", "y", 1]], ["int", "float", "str"]],
+        ],
+    )
+    def test_normal_schema_fit(self, monkeypatch, value_matrix, expected):
+        writer = TableWriterFactory.create_from_format_name(
+            "markdown", headers=["int", "float", "str"], value_matrix=[[1, 0.5, "a"]]
+        )
+        schema = writer.dumps_schema()
+
+        writer = TableWriterFactory.create_from_format_name(
+            "markdown", headers=["int", "float", "str"], value_matrix=value_matrix
+        )
+        writer.load_schema(schema, overflow="error")
+
+        # values are checked against the schema without calculating column properties
+        # from the values: only the row of the schema is converted to column properties
+        to_column_dp_list = writer._dp_extractor.to_column_dp_list
+        num_rows_list = []
+
+        def spy_to_column_dp_list(value_dp_matrix, *args, **kwargs):
+            num_rows_list.append(len(value_dp_matrix))
+            return to_column_dp_list(value_dp_matrix, *args, **kwargs)
+
+        monkeypatch.setattr(writer._dp_extractor, "to_column_dp_list", spy_to_column_dp_list)
+
+        if not expected:
+            writer.dumps()
+        else:
+            with pytest.raises(ValueError) as e:
+                writer.dumps()
+            assert str(e.value) == f"values do not fit the schema: columns={expected}"
+
+        assert num_rows_list == [1]
+
+    def test_normal_schema_ignore_rounding(self):
+        writer = TableWriterFactory.create_from_format_name(
+            "markdown", headers=["int", "float"], value_matrix=[[1, 0.5]]
+        )
+        schema = writer.dumps_schema()
+
+        writer.value_matrix = [[2.5, 0.25]]
+        writer.load_schema(schema, overflow="ignore")
+        expected = dedent(
+            """\
+            |int|float|
+            |--:|----:|
+            |  2|  0.2|
+            """
+        )
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+        assert output == expected
+
+        writer.load_schema(schema, overflow="extend")
+        expected = dedent(
+            """\
+            |int|float|
+            |--:|----:|
+            |2.5| 0.25|
+            """
+        )
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+        assert output == expected
+
+    @pytest.mark.parametrize(
+        ["schema", "expected"],
+        [
+            ["not a json", ValueError],
+            ['{"version": 0, "columns": []}', ValueError],
+            [
+                '{"version": 1, "columns": [{"header": "a", "type": "UNKNOWN", "width": 1}]}',
+                ValueError,
+            ],
+            [[], TypeError],
+        ],
+    )
+    def test_exception_schema(self, schema, expected):
+        writer = TableWriterFactory.create_from_format_name("markdown")
+
+        with pytest.raises(expected):
+            writer.load_schema(schema)
@@ -0,0 +1,87 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from pytablewriter import TableWriterFactory, set_width_cache
+
+from .._common import print_test_result
+
+
+class Test_width_cache:
+    def test_normal_write_stats_width_cache(self):
+        from pytablewriter.writer._width import calc_ascii_char_width, clear_width_cache
+
+        clear_width_cache()
+        value_matrix = [[i, "家電", "株式会社あいう", "abc"] for i in range(10)]
+        writers = [
+            TableWriterFactory.create_from_format_name(
+                format_name="markdown",
+                headers=["A", "B", "C", "D"],
+                value_matrix=value_matrix,
+                enable_write_stats=True,
+            )
+            for _ in range(2)
+        ]
+
+        set_width_cache(True)
+        try:
+            outputs = [writer.dumps() for writer in writers]
+        finally:
+            set_width_cache(False)
+        first_stats, second_stats = [writer.last_write_stats for writer in writers]
+        print_test_result(expected=outputs[0], actual=outputs[1])
+
+        assert outputs[0] == outputs[1]
+        assert "|  0|家電|株式会社あいう|abc|" in outputs[0]
+        assert first_stats.width_cache_misses > 0
+
+        # the cache is shared by writers: widths of the same strings are not calculated again
+        assert second_stats.width_cache_misses == 0
+        assert second_stats.width_cache_hits > 0
+        assert second_stats.width_cache_hit_rate == 1.0
+        assert second_stats.as_dict()["width_cache"]["hit_rate"] == 1.0
+
+        assert calc_ascii_char_width("abc") == 3
+        assert calc_ascii_char_width("株式会社") == 8
+        assert calc_ascii_char_width("±", east_asian_ambiguous_width=2) == 2
+        assert calc_ascii_char_width("±", east_asian_ambiguous_width=1) == 1
+
+    def test_normal_write_stats_width_cache_disabled(self):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A"],
+            value_matrix=[["家電"], ["家電"]],
+            enable_write_stats=True,
+        )
+        writer.dumps()
+
+        # the width cache is disabled by default
+        assert writer.last_write_stats.width_cache_hits == 0
+        assert writer.last_write_stats.width_cache_misses == 0
+
+    def test_normal_aligned_str_cache(self):
+        from pytablewriter import clear_width_cache
+        from pytablewriter.writer._width import _align_cached_str
+
+        def make_writer():
+            return TableWriterFactory.create_from_format_name(
+                format_name="markdown",
+                headers=["A"],
+                value_matrix=[["abc"], ["abc"]],
+            )
+
+        clear_width_cache()
+
+        # the aligned strings are not cached by default
+        make_writer().dumps()
+        assert _align_cached_str.cache_info().currsize == 0
+
+        set_width_cache(True)
+        try:
+            make_writer().dumps()
+            assert _align_cached_str.cache_info().currsize > 0
+
+            clear_width_cache()
+            assert _align_cached_str.cache_info().currsize == 0
+        finally:
+            set_width_cache(False)
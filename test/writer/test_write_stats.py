@@ -0,0 +1,83 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+from pytablewriter import TableWriterFactory
+
+
+class Test_write_stats:
+    @pytest.mark.parametrize(
+        ["format_name"],
+        [
+            ["csv"],
+            ["json"],
+            ["markdown"],
+            ["unicode"],
+        ],
+    )
+    def test_normal_write_stats(self, format_name):
+        stats_list = []
+        writer = TableWriterFactory.create_from_format_name(
+            format_name=format_name,
+            headers=["A", "B", "C"],
+            value_matrix=[[i, f"value{i}", i * 0.1] for i in range(10)],
+            enable_write_stats=True,
+            write_stats_callback=stats_list.append,
+        )
+        writer.dumps()
+
+        stats = writer.last_write_stats
+        assert stats is not None
+        assert stats_list == [stats]
+        assert stats.format_name == format_name
+        assert stats.iteration is None
+        assert list(stats.phases) == [
+            "table_dp",
+            "table_property",
+            "header",
+            "value_matrix",
+            "write",
+        ]
+        assert stats.phases["table_dp"].num_cells == 30
+        assert stats.phases["header"].num_cells == 3
+        assert stats.phases["value_matrix"].num_cells == 30
+        assert stats.phases["write"].num_cells == 30
+        assert all(phase.elapsed_sec >= 0 for phase in stats.phases.values())
+        assert stats.elapsed_sec >= sum(
+            phase.elapsed_sec for phase in stats.phases.values() if phase.name != "write"
+        )
+
+        # preprocessed results are cached at the second write
+        writer.dumps()
+        assert len(stats_list) == 2
+        assert list(writer.last_write_stats.phases) == ["write"]
+
+    def test_normal_write_stats_iter(self):
+        stats_list = []
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="csv",
+            headers=["A", "B"],
+            enable_write_stats=True,
+            write_stats_callback=stats_list.append,
+        )
+        writer.value_matrix = ([[i, i]] for i in range(3))
+        writer.iteration_length = 3
+        writer.write_table_iter()
+
+        assert [stats.iteration for stats in stats_list] == [1, 2, 3]
+        assert [stats.phases["value_matrix"].num_cells for stats in stats_list] == [2, 2, 2]
+
+    def test_normal_write_stats_disabled(self):
+        stats_list = []
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[1, 2]],
+            write_stats_callback=stats_list.append,
+        )
+        writer.dumps()
+
+        assert writer.last_write_stats is None
+        assert stats_list == []
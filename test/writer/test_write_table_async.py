@@ -0,0 +1,77 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import asyncio
+import io
+
+import pytest
+
+from pytablewriter import TableWriterFactory
+
+
+class Test_write_table_async:
+    def test_normal_write_table_async(self):
+        class AsyncStream:
+            def __init__(self):
+                self.chunks = []
+                self.num_drains = 0
+
+            async def write(self, data):
+                self.chunks.append(data)
+
+            async def drain(self):
+                self.num_drains += 1
+
+        async def count_ticks(ticks):
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def write(writer, stream, ticks):
+            ticker = asyncio.ensure_future(count_ticks(ticks))
+            try:
+                await writer.write_table_async(stream, chunk_size=64)
+            finally:
+                ticker.cancel()
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[i, f"value{i}"] for i in range(100)],
+        )
+        stream = AsyncStream()
+        ticks = []
+        asyncio.run(write(writer, stream, ticks))
+
+        assert "".join(stream.chunks) == writer.dumps()
+        assert stream.num_drains == len(stream.chunks) > 1
+        # the event loop runs other tasks while writing the table
+        assert len(ticks) > 1
+
+        # chunks are encoded if an encoding is specified
+        bytes_stream = io.BytesIO()
+        asyncio.run(writer.write_table_async(bytes_stream, encoding="utf-8"))
+        assert bytes_stream.getvalue() == writer.dumps().encode("utf-8")
+
+    def test_exception_write_table_async(self):
+        class BrokenStream:
+            async def write(self, data):
+                raise OSError("broken stream")
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[i, i] for i in range(1000)],
+        )
+        old_stream = writer.stream
+
+        with pytest.raises(ValueError):
+            asyncio.run(writer.write_table_async(io.StringIO(), chunk_size=0))
+
+        with pytest.raises(OSError):
+            asyncio.run(writer.write_table_async(BrokenStream(), chunk_size=16))
+
+        # the writing is stopped and the writer is restored
+        assert writer.stream is old_stream
+        assert writer.dumps().startswith("| A |")
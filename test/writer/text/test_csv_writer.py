@@ -239,6 +239,25 @@ class Test_CsvTableWriter_write_table:
 
         assert out == expected
 
+    def test_normal_null_string(self):
+        value_matrix = [["", None], [None, ""], ["1.00", 1]]
+        expected = dedent(
+            """\
+            "a","b"
+            "",
+            ,
+            "1.00",1
+            """
+        )
+
+        for _ in range(2):
+            # writers of the class share the default extractor
+            writer = table_writer_class(headers=["a", "b"], value_matrix=value_matrix)
+            output = writer.dumps()
+            print_test_result(expected=expected, actual=output)
+
+            assert output == expected
+
     @pytest.mark.parametrize(
         ["header", "value", "expected"],
         [[data.header, data.value, data.expected] for data in exception_test_data_list],
@@ -283,6 +302,72 @@ class Test_CsvTableWriter_write_table_iter:
 
         assert out == expected
 
+    def test_normal_warmup_rows(self, capsys):
+        writer = table_writer_class(
+            headers=["ha", "hb", "hc"],
+            value_matrix=(row for matrix in value_matrix_iter for row in matrix),
+        )
+        writer.write_table_iter(warmup_rows=4)
+
+        expected = dedent(
+            """\
+            "ha","hb","hc"
+            1,2,3
+            11,12,13
+            1,2,3
+            11,12,13
+            101,102,103
+            1001,1002,1003
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+        assert writer.type_hints == []
+
+    def test_normal_warmup_rows_type_change(self, capsys):
+        # a real number and a None arrive after the warm-up rows
+        writer = table_writer_class(
+            headers=["n", "s"], value_matrix=iter([[1, "a"], [2, "b"], [3.5, None], [4, "d"]])
+        )
+        writer.write_table_iter(warmup_rows=2)
+
+        expected = dedent(
+            """\
+            "n","s"
+            1,"a"
+            2,"b"
+            3.5,
+            4,"d"
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+        assert (
+            out
+            == table_writer_class(
+                headers=["n", "s"], value_matrix=[[1, "a"], [2, "b"], [3.5, None], [4, "d"]]
+            ).dumps()
+        )
+
+    def test_normal_warmup_rows_empty(self, capsys):
+        writer = table_writer_class(headers=["a", "b"], value_matrix=iter([]))
+        writer.write_table_iter(warmup_rows=2)
+
+        out, err = capsys.readouterr()
+        print_test_result(expected='"a","b"\n', actual=out, error=err)
+
+        assert out == '"a","b"\n'
+
+    def test_exception_warmup_rows(self):
+        writer = table_writer_class(headers=["ha"], value_matrix=iter([[1]]))
+
+        with pytest.raises(ValueError):
+            writer.write_table_iter(warmup_rows=0)
+
     @pytest.mark.parametrize(
         ["header", "value", "expected"],
         [[data.header, data.value, data.expected] for data in exception_test_data_list],
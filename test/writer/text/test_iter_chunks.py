@@ -0,0 +1,85 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import io
+from typing import Optional
+
+import pytest
+
+from pytablewriter import TableWriterFactory
+from pytablewriter.style import Cell, Style
+
+from ..._common import print_test_result
+
+
+class Test_iter_chunks:
+    @pytest.mark.parametrize(
+        ["format_name", "chunk_size"],
+        [
+            ["csv", 1],
+            ["html", 16],
+            ["json", 1024],
+            ["latex_table", 16],
+            ["markdown", 16],
+            ["rst_grid", 16],
+            ["unicode", 8192],
+        ],
+    )
+    def test_normal_iter_chunks(self, format_name, chunk_size):
+        writer = TableWriterFactory.create_from_format_name(
+            format_name=format_name,
+            table_name="iter",
+            headers=["A", "B", "C"],
+            value_matrix=[[i, f"value{i}", i * 0.1] for i in range(100)],
+        )
+        expected = writer.dumps()
+
+        chunks = list(writer.iter_chunks(chunk_size))
+        print_test_result(expected=expected, actual="".join(chunks))
+
+        assert "".join(chunks) == expected
+        assert all(len(chunk) >= chunk_size for chunk in chunks[:-1])
+
+        lines = list(writer.iter_lines())
+        assert "".join(lines) == expected
+        assert lines == expected.splitlines(keepends=True)
+
+        # the writer can be used after the iteration
+        assert writer.dumps() == expected
+
+    def test_normal_iter_lines_close(self):
+        old_stream = io.StringIO()
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[i, i * 10] for i in range(10000)],
+            is_stream_value_rows=True,
+            stream=old_stream,
+        )
+        writer.stream = old_stream
+
+        line_iter = writer.iter_lines()
+        assert next(line_iter) == "| A  |  B  |\n"
+        assert next(line_iter) == "|---:|----:|\n"
+        line_iter.close()
+
+        assert writer.stream is old_stream
+        assert writer.write_buffer_size == 64 * 1024
+        assert old_stream.getvalue() == ""
+
+    def test_exception_iter_chunks(self):
+        def style_filter(cell: Cell, **kwargs) -> Optional[Style]:
+            raise RuntimeError("style filter error")
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown", headers=["A"], value_matrix=[[1]]
+        )
+
+        with pytest.raises(ValueError):
+            next(writer.iter_chunks(chunk_size=0))
+
+        # exceptions raised while rendering are raised from the iterator
+        writer.add_style_filter(style_filter)
+        with pytest.raises(RuntimeError):
+            list(writer.iter_lines())
@@ -1459,6 +1459,69 @@ class Test_MarkdownTableWriter_write_table_iter:
 
         assert out == expected
 
+    def test_normal_warmup_rows(self, capsys):
+        writer = table_writer_class(
+            table_name="mix length",
+            headers=["string", "hb", "hc"],
+            value_matrix=(row for matrix in value_matrix_iter_1 for row in matrix),
+        )
+        writer.write_table_iter(warmup_rows=2)
+
+        expected = dedent(
+            """\
+            # mix length
+            |           string            | hb  | hc |
+            |-----------------------------|----:|---:|
+            |a b c d e f g h i jklmn      |  2.1|   3|
+            |aaaaa                        | 12.1|  13|
+            |bbb                          |  2.0|   3|
+            |cc                           | 12.0|  13|
+            |a                            |102.0| 103|
+            |                             |1002.0|1003|
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    def test_normal_warmup_rows_type_change(self, capsys):
+        # a real number and a None arrive after the warm-up rows
+        writer = table_writer_class(
+            headers=["n", "s"], value_matrix=iter([[1, "a"], [2, "b"], [3.5, None], [4, "d"]])
+        )
+        writer.write_table_iter(warmup_rows=2)
+
+        expected = dedent(
+            """\
+            | n  | s  |
+            |---:|----|
+            |   1|a   |
+            |   2|b   |
+            | 3.5|    |
+            | 4.0|d   |
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    def test_normal_warmup_rows_empty(self, capsys):
+        writer = table_writer_class(headers=["a", "b"], value_matrix=iter([]))
+        writer.write_table_iter(warmup_rows=2)
+
+        expected = dedent(
+            """\
+            | a  | b  |
+            |----|----|
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
 
 class Test_MarkdownTableWriter_dump:
     def test_normal(self, tmpdir):
@@ -1650,6 +1713,42 @@ class Test_MarkdownTableWriter_from_dataframe:
 
         assert not_overwrite != overwrite
 
+    @pytest.mark.parametrize(["add_index_column"], [[False], [True]])
+    @pytest.mark.parametrize(
+        ["thousand_separator"], [[ThousandSeparator.NONE], [ThousandSeparator.COMMA]]
+    )
+    def test_normal_numeric_columns(self, add_index_column, thousand_separator):
+        import numpy as np
+
+        df = pd.DataFrame(
+            {
+                "int": [0, -1, 12, -123, 1234567, np.iinfo(np.int64).min, 9, 10],
+                "uint": np.array([0, 1, 255, 128, 7, 8, 9, 10], dtype=np.uint8),
+                "float": [0.0, -0.0, 1.5, -0.25, 1e-7, 123.456, 0.30000000000000004, -9.99],
+                "special": [np.nan, np.inf, -np.inf, 1e20, 2.0, -3.5, np.nan, 0.125],
+                "str": ["a", "bb", "ccc", "a", "bb", "ccc", "a", "bb"],
+            },
+            index=[10, 20, 30, 40, 50, 60, 70, 80],
+        )
+
+        writer = table_writer_class(margin=1)
+        writer.thousand_separator = thousand_separator
+        writer.from_dataframe(df, add_index_column=add_index_column)
+        out = writer.dumps()
+
+        # cells of numeric columns are converted in vector: the same as per-cell conversion
+        expected_writer = table_writer_class(
+            margin=1,
+            headers=writer.headers,
+            type_hints=writer.type_hints,
+            value_matrix=[list(row) for row in writer.value_matrix],
+        )
+        expected_writer.thousand_separator = thousand_separator
+        expected = expected_writer.dumps()
+
+        print_test_result(expected=expected, actual=out)
+        assert out == expected
+
 
 @pytest.mark.skipif(SKIP_DATAFRAME_TEST, reason="required package not found")
 class Test_MarkdownTableWriter_from_series:
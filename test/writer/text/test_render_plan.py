@@ -0,0 +1,71 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import io
+from concurrent import futures
+from typing import Optional
+
+import pytest
+
+from pytablewriter import TableWriterFactory
+from pytablewriter.style import Cell, Style
+
+from ..._common import print_test_result
+
+
+class Test_compile:
+    def test_normal_compile(self):
+        def style_filter(cell: Cell, **kwargs) -> Optional[Style]:
+            assert "writer" in kwargs
+
+            if cell.is_header_row() or cell.col != 1:
+                return None
+
+            return Style(font_weight="bold")
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            table_name="plan",
+            headers=["A", "B"],
+            margin=1,
+            column_styles=[Style(align="center"), None],
+        )
+        writer.add_style_filter(style_filter)
+        plan = writer.compile()
+
+        # changes to the writer after the compilation do not affect the plan
+        writer.headers = ["X", "Y"]
+        writer.margin = 2
+        writer.column_styles = []
+        writer.clear_theme()
+
+        matrices = [[[i, j] for j in range(20)] for i in range(16)]
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(executor.map(plan.renders, matrices))
+
+        expected_writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            table_name="plan",
+            headers=["A", "B"],
+            margin=1,
+            column_styles=[Style(align="center"), None],
+        )
+        expected_writer.add_style_filter(style_filter)
+        expected_outputs = []
+        for value_matrix in matrices:
+            expected_writer.value_matrix = value_matrix
+            expected_outputs.append(expected_writer.dumps())
+
+        print_test_result(expected=expected_outputs[1], actual=outputs[1])
+        assert outputs == expected_outputs
+        assert plan.format_name == "markdown"
+        assert plan.table_name == "plan"
+        assert plan.headers == ("A", "B")
+
+        stream = io.StringIO()
+        plan.render(matrices[0], stream)
+        assert stream.getvalue() == expected_outputs[0]
+
+        with pytest.raises(AttributeError):
+            plan.headers = ["X", "Y"]
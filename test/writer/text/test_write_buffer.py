@@ -0,0 +1,75 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import io
+
+import pytest
+
+from pytablewriter import TableWriterFactory
+
+from ..._common import print_test_result
+
+
+class Test_write_buffer:
+    @pytest.mark.parametrize(
+        ["format_name"],
+        [["csv"], ["javascript"], ["json"], ["jsonl"], ["ltsv"], ["markdown"], ["unicode"]],
+    )
+    def test_normal_write_buffer(self, format_name):
+        class CountingStream(io.StringIO):
+            def __init__(self):
+                super().__init__()
+                self.write_count = 0
+
+            def write(self, s):
+                self.write_count += 1
+                return super().write(s)
+
+        def write(write_buffer_size):
+            writer = TableWriterFactory.create_from_format_name(
+                format_name=format_name,
+                table_name="buffer",
+                headers=["int", "str"],
+                value_matrix=[[i, f"text{i}"] for i in range(100)],
+                write_buffer_size=write_buffer_size,
+            )
+            writer.stream = CountingStream()
+            writer.write_table()
+
+            return writer.stream
+
+        expected = write(write_buffer_size=0)
+        stream = write(write_buffer_size=64 * 1024)
+        print_test_result(expected=expected.getvalue(), actual=stream.getvalue())
+
+        assert stream.getvalue() == expected.getvalue()
+        assert stream.write_count <= min(expected.write_count, 2)
+
+        # flush every time the buffered texts reach the buffer size
+        stream = write(write_buffer_size=100)
+        assert stream.getvalue() == expected.getvalue()
+        assert stream.write_count <= expected.write_count
+
+    def test_normal_write_buffer_iter(self):
+        outputs = []
+
+        def callback(iter_count, iteration_length):
+            # buffered texts are written before the callback
+            outputs.append(writer.stream.getvalue())
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="csv",
+            headers=["A", "B"],
+            value_matrix=([[i, i * 10]] for i in range(3)),
+            iteration_length=3,
+            write_callback=callback,
+        )
+        writer.stream = io.StringIO()
+        writer.write_table_iter()
+
+        assert outputs == [
+            '"A","B"\n0,0\n',
+            '"A","B"\n0,0\n1,10\n',
+            '"A","B"\n0,0\n1,10\n2,20\n',
+        ]
@@ -1,8 +1,21 @@
+import io
 from typing import Optional
 
+import pytest
+from typepy import Typecode
+
 from pytablewriter import TableWriterFactory
 from pytablewriter.style import Cell, Style
 
+from ..._common import print_test_result
+
+
+def even_row_style_filter(cell: Cell, **kwargs) -> Optional[Style]:
+    if cell.is_header_row() or cell.row % 2:
+        return None
+
+    return Style(font_weight="bold")
+
 
 class Test_text_writer:
     def test_normal_style_filter(self):
@@ -41,3 +54,179 @@ class Test_text_writer:
         writer.enable_style_filter()
         output_wo_filter_2 = writer.dumps()
         assert output_w_filter == output_wo_filter_2
+
+    @pytest.mark.parametrize(
+        ["format_name"],
+        [
+            ["csv"],
+            ["html"],
+            ["latex_table"],
+            ["markdown"],
+            ["rst_grid"],
+            ["space_aligned"],
+            ["unicode"],
+        ],
+    )
+    def test_normal_column_compiled_styles(self, format_name):
+        def nop_style_filter(cell: Cell, **kwargs) -> Optional[Style]:
+            return None
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name=format_name,
+            headers=["int", "float", "str", "mix", "styled"],
+            value_matrix=[
+                [1, 1.1, "a", 1, "bold"],
+                [22, 0.12, "bb", "text", "bold"],
+                [333, 10, "ccc", 0.5, "bold"],
+            ],
+            column_styles=[
+                None,
+                Style(align="center"),
+                Style(padding=5),
+                None,
+                Style(font_weight="bold"),
+            ],
+            margin=1,
+        )
+        output_compiled = writer.dumps()
+
+        writer.add_style_filter(nop_style_filter)
+        assert writer.dumps() == output_compiled
+
+    def test_normal_row_independent_style_filter(self):
+        called_cells = []
+
+        def style_filter(cell: Cell, **kwargs) -> Optional[Style]:
+            called_cells.append(cell)
+
+            if cell.col == 0:
+                return Style(font_weight="bold")
+
+            return None
+
+        writer = TableWriterFactory.create_from_format_name(
+            format_name="markdown",
+            headers=["A", "B"],
+            value_matrix=[[i, f"value{i}"] for i in range(10)],
+        )
+        writer.add_style_filter(style_filter)
+        output_row_dependent = writer.dumps()
+        assert len(called_cells) == 24
+
+        called_cells.clear()
+        style_filter.is_row_dependent = False
+        writer.clear_theme()
+        writer.add_style_filter(style_filter)
+        assert writer.dumps() == output_row_dependent
+        assert len(called_cells) == 4
+
+    @pytest.mark.parametrize(
+        ["format_name"],
+        [
+            ["asciidoc"],
+            ["csv"],
+            ["markdown"],
+            ["mediawiki"],
+            ["rst_grid_table"],
+            ["tsv"],
+            ["unicode"],
+        ],
+    )
+    def test_normal_stream_value_rows(self, format_name):
+        def make_writer(**kwargs):
+            writer = TableWriterFactory.create_from_format_name(
+                format_name=format_name,
+                headers=["int", "float", "str"],
+                value_matrix=[[i, i * 0.5, f"text{i}"] for i in range(10)],
+                column_styles=[Style(thousand_separator=","), None, Style(align="center")],
+                **kwargs,
+            )
+            writer.add_style_filter(even_row_style_filter)
+
+            return writer
+
+        expected = make_writer().dumps()
+
+        writer = make_writer(is_stream_value_rows=True)
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+
+        assert output == expected
+        # formatted rows are not retained
+        assert writer._table_value_matrix == []
+        assert writer.dumps() == expected
+
+    @pytest.mark.parametrize(["format_name"], [["markdown"], ["csv"], ["json"], ["latex_table"]])
+    def test_normal_shared_default_extractor(self, format_name):
+        headers = ["a", "b", "c"]
+        value_matrix = [["x\ny", 1.23456, float("inf")], ['"q"', 2, None]]
+
+        expected = TableWriterFactory.create_from_format_name(
+            format_name, headers=headers, value_matrix=value_matrix
+        ).dumps()
+
+        # customizations of a writer do not affect the other writers of the class
+        writer = TableWriterFactory.create_from_format_name(
+            format_name, headers=headers, value_matrix=value_matrix, max_precision=1, dequote=False
+        )
+        writer.register_trans_func(lambda value: "trans" if value == 2 else value)
+        writer.update_preprocessor(line_break_repl="<br>")
+        writer._dp_extractor.set_type_value(Typecode.INFINITY, "INF")
+        writer._quoting_flags[Typecode.STRING] = False
+        customized_output = writer.dumps()
+
+        output = TableWriterFactory.create_from_format_name(
+            format_name, headers=headers, value_matrix=value_matrix
+        ).dumps()
+
+        print_test_result(expected=expected, actual=output)
+        assert output == expected
+        assert customized_output != expected
+
+    def test_normal_row_independent_col_separator_style_filter(self):
+        called_cells = []
+
+        def col_separator_style_filter(
+            left_cell: Optional[Cell], right_cell: Optional[Cell], **kwargs
+        ) -> Optional[Style]:
+            called_cells.append((left_cell, right_cell))
+
+            if left_cell and right_cell:
+                return Style(color="red")
+
+            return None
+
+        def make_writer():
+            writer = TableWriterFactory.create_from_format_name(
+                format_name="markdown",
+                headers=["A", "B", "C"],
+                value_matrix=[[i, f"{{value{i}}}", i * 0.5] for i in range(10)],
+            )
+            writer.column_delimiter = "{|}"
+            writer.stream = io.StringIO()
+
+            return writer
+
+        writer = make_writer()
+        writer.add_col_separator_style_filter(col_separator_style_filter)
+        writer.write_table()
+        output_row_dependent = writer.stream.getvalue()
+        assert len(called_cells) == 44
+
+        called_cells.clear()
+        col_separator_style_filter.is_row_dependent = False
+        writer = make_writer()
+        writer.add_col_separator_style_filter(col_separator_style_filter)
+        writer.write_table()
+        output = writer.stream.getvalue()
+        print_test_result(expected=output_row_dependent, actual=output)
+
+        assert output == output_row_dependent
+        # column delimiters are resolved once for the header row and once for value rows
+        assert len(called_cells) == 8
+
+        # column delimiters without style filters
+        writer = make_writer()
+        writer.write_table()
+        assert "{|}" in writer.stream.getvalue()
+        assert "\x1b[" not in writer.stream.getvalue()